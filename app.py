@@ -4,17 +4,35 @@ A Flet UI app designed to perform various Alma-Digital bib record editing functi
 """
 
 import flet as ft
+import atexit
 import os
+import io
 import logging
+import logging.handlers
 import json
+import re
 import subprocess
+import threading
+import time
+import traceback
+from collections import Counter, OrderedDict, defaultdict, deque
 from datetime import datetime
+from http import HTTPStatus
 from dotenv import load_dotenv
 from typing import Optional, Union
 from pathlib import Path
 import xml.etree.ElementTree as ET
-import xml.dom.minidom as minidom
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import ReadTimeoutError
+from urllib3.util.retry import Retry
+
+# orjson is optional: when installed it parses the large Alma JSON payloads several
+# times faster; both parsers accept the raw response bytes
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    json_loads = json.loads
 
 # Import inactive functions module
 import inactive_functions
@@ -38,9 +56,17 @@ formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(messag
 file_handler.setFormatter(formatter)
 console_handler.setFormatter(formatter)
 
+# Buffer file writes: DEBUG-heavy batch runs write the log in blocks of 200 records,
+# and anything at ERROR or above flushes the buffer immediately (as does exit)
+buffered_file_handler = logging.handlers.MemoryHandler(
+    capacity=200,
+    flushLevel=logging.ERROR,
+    target=file_handler
+)
+
 logging.basicConfig(
     level=logging.DEBUG,
-    handlers=[file_handler, console_handler]
+    handlers=[buffered_file_handler, console_handler]
 )
 logger = logging.getLogger(__name__)
 
@@ -51,6 +77,186 @@ logging.getLogger('flet_desktop').setLevel(logging.WARNING)
 
 # Persistent storage file
 PERSISTENCE_FILE = "persistent.json"
+# Set ID field values that look like a CSV path (contain a path separator or end in .csv)
+_CSV_PATH_PATTERN = re.compile(r'[\\/]|\.csv$', re.IGNORECASE)
+
+# Minimum seconds between progress-driven page redraws (~30 per second)
+PROGRESS_UPDATE_INTERVAL = 1 / 30
+# Minimum seconds between progress bar redraws in per-record batch loops (Functions 6 and 7)
+BATCH_PROGRESS_INTERVAL = 0.1
+# Leading text of the batch progress label ("Processing 12/300: <MMS ID>")
+PROGRESS_LABEL_PREFIX = "Processing "
+
+# Alma API base URL per ALMA_API_REGION value
+ALMA_REGION_URLS = {
+    'America': 'https://api-na.hosted.exlibrisgroup.com',
+    'Europe': 'https://api-eu.hosted.exlibrisgroup.com',
+    'Asia Pacific': 'https://api-ap.hosted.exlibrisgroup.com',
+    'Canada': 'https://api-ca.hosted.exlibrisgroup.com',
+    'China': 'https://api-cn.hosted.exlibrisgroup.com'
+}
+
+# Idle time (seconds) before UI state and function usage changes are written to disk
+UI_STATE_SAVE_DELAY = 0.3
+
+# Confirmation dialog text for Functions 6 and 7 (filled with .format at click time)
+_WARN_BATCH_F6 = "⚠️ WARNING: This will modify {n} bibliographic record(s) in Alma.\n\nFunction: Replace old dc:rights with Public Domain link\n\nThis action will PERMANENTLY modify dc:rights fields in the records.\n\nDo you want to continue?"
+_WARN_SINGLE_F6 = "⚠️ WARNING: This will modify the bibliographic record in Alma.\n\nMMS ID: {mms_id}\nFunction: Replace old dc:rights with Public Domain link\n\nThis action will PERMANENTLY modify dc:rights fields.\n\nDo you want to continue?"
+_WARN_BATCH_F7 = "⚠️ WARNING: This will modify {n} bibliographic record(s) in Alma.\n\nFunction: Add Grinnell: dc:identifier Field As Needed\n\nThis action will PERMANENTLY add dc:identifier fields to records with dg_ identifiers.\n\nDo you want to continue?"
+_WARN_SINGLE_F7 = "⚠️ WARNING: This will modify the bibliographic record in Alma.\n\nMMS ID: {mms_id}\nFunction: Add Grinnell: dc:identifier Field As Needed\n\nThis action will PERMANENTLY add a dc:identifier field if a dg_ identifier exists.\n\nDo you want to continue?"
+
+# Stand-in event passed to click handlers when a function is run from the dropdown
+_MOCK_EVENT = type("MockEvent", (), {})()
+
+# Status code -> reason phrase for Handle validation reports (Function 9)
+_STATUS_MESSAGES = {status.value: status.phrase for status in HTTPStatus}
+
+# Primo public PNX endpoint used by Function 9's optional title cross-check
+PRIMO_URL_TMPL = "https://grinnell.primo.exlibrisgroup.com/primaws/rest/pub/pnxs/undefined/alma{mms}?vid=01GCL_INST:GCL&lang=en"
+# Split once so per-record URLs are a plain concatenation instead of a str.format() call
+_PRIMO_URL_PREFIX, _PRIMO_URL_SUFFIX = PRIMO_URL_TMPL.split("{mms}")
+
+# Function 9 CSV columns, in output order; _check_handle builds rows as tuples in this order
+HANDLE_VALIDATION_HEADINGS = (
+    "MMS ID",
+    "Handle URL",
+    "dc:title",
+    "HTTP Status Code",
+    "Status Message",
+    "Final Redirect URL",
+    "Returned Correct MMS ID",
+    "Titles Match!"
+)
+# Positions of the Function 9 columns read back after the Handle checks
+_HANDLE_COL_MMS_ID = HANDLE_VALIDATION_HEADINGS.index("MMS ID")
+_HANDLE_COL_TITLE = HANDLE_VALIDATION_HEADINGS.index("dc:title")
+_HANDLE_COL_STATUS_CODE = HANDLE_VALIDATION_HEADINGS.index("HTTP Status Code")
+_HANDLE_COL_MMS_ID_MATCH = HANDLE_VALIDATION_HEADINGS.index("Returned Correct MMS ID")
+_HANDLE_COL_TITLES_MATCH = HANDLE_VALIDATION_HEADINGS.index("Titles Match!")
+
+# Dublin Core namespaces used when reading fields out of a record's anies XML
+_DC_NAMESPACES = {
+    'dc': 'http://purl.org/dc/elements/1.1/',
+    'dcterms': 'http://purl.org/dc/terms/'
+}
+_XSI_TYPE = '{http://www.w3.org/2001/XMLSchema-instance}type'
+_DC_TAG = f"{{{_DC_NAMESPACES['dc']}}}"
+_DCTERMS_TAG = f"{{{_DC_NAMESPACES['dcterms']}}}"
+_DC_TAG_PREFIXES = {'dc': _DC_TAG, 'dcterms': _DCTERMS_TAG}
+_DC_IDENTIFIER_TAG = _DC_TAG + "identifier"
+# _collect_fields key for dcterms:subject values typed xsi:type="dcterms:LCSH"
+_LCSH_KEY = "dcterms:subject.dcterms:LCSH"
+# Alma's custom (non-DC) columns in Function 3 exports, read from the record's default namespace
+_CUSTOM_FIELDS = ("compoundrelationship", "googlesheetsource", "dginfo")
+_DEFAULT_GRINNELL_NS = "http://alma.exlibrisgroup.com/dc/01GCL_INST"
+_XMLNS_PATTERN = re.compile(r'xmlns="([^"]+)"')
+# Default namespace URI -> Clark-notation tags of _CUSTOM_FIELDS; a set normally has just one
+_CUSTOM_FIELD_TAGS = {}
+# anies XML longer than this is streamed with iterparse during CSV export instead of parsed into a tree
+STREAM_PARSE_MIN_CHARS = 256 * 1024
+
+# Function 3 CSV export columns, in output order (no duplicates); _map_bib_to_csv_row fills rows by index
+CSV_EXPORT_HEADINGS = (
+    "group_id", "collection_id", "mms_id", "originating_system_id", "compoundrelationship",
+    "dc:title", "dcterms:alternative", "oldalttitle", "dc:identifier",
+    "dcterms:identifier.dcterms:URI", "dcterms:tableOfContents", "dc:creator",
+    "dc:contributor", "dc:subject", "dcterms:subject.dcterms:LCSH",
+    "dc:description", "dcterms:provenance",
+    "dcterms:bibliographicCitation", "dcterms:abstract", "dcterms:publisher",
+    "dc:date", "dcterms:created", "dcterms:issued",
+    "dcterms:dateSubmitted", "dcterms:dateAccepted", "dc:type", "dc:format",
+    "dcterms:extent", "dcterms:medium",
+    "dcterms:format.dcterms:IMT", "dcterms:type.dcterms:DCMIType", "dc:language",
+    "dc:relation", "dcterms:isPartOf",
+    "dc:coverage", "dcterms:spatial", "dcterms:spatial.dcterms:Point",
+    "dcterms:temporal", "dc:rights", "dc:source", "bib custom field",
+    "rep_label", "rep_public_note", "rep_access_rights", "rep_usage_type",
+    "rep_library", "rep_note", "rep_custom field", "file_name_1", "file_label_1",
+    "file_name_2", "file_label_2", "googlesheetsource", "dginfo"
+)
+_CSV_EXPORT_COLUMNS = {heading: index for index, heading in enumerate(CSV_EXPORT_HEADINGS)}
+# Export columns that take only the first value of their DC element
+_CSV_EXPORT_FIRST_VALUE_FIELDS = (
+    ("dcterms:created", _DCTERMS_TAG + "created"),
+    ("dcterms:issued", _DCTERMS_TAG + "issued"),
+    ("dcterms:dateSubmitted", _DCTERMS_TAG + "dateSubmitted"),
+    ("dcterms:dateAccepted", _DCTERMS_TAG + "dateAccepted"),
+    ("dc:type", _DC_TAG + "type"),
+    ("dc:format", _DC_TAG + "format"),
+    ("dcterms:medium", _DCTERMS_TAG + "medium"),
+    ("dcterms:format.dcterms:IMT", _DCTERMS_TAG + "format"),
+    ("dcterms:type.dcterms:DCMIType", _DCTERMS_TAG + "type"),
+)
+
+# Alma's documented per-institution API threshold; requests to /almaws/ are spaced to stay under it
+ALMA_MAX_CALLS_PER_SECOND = 25
+
+
+class _AlmaRateLimitedAdapter(HTTPAdapter):
+    """HTTPAdapter that spaces Alma API requests across all threads to ALMA_MAX_CALLS_PER_SECOND"""
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._interval = 1.0 / ALMA_MAX_CALLS_PER_SECOND
+        self._next_slot = 0.0
+        self._slot_lock = threading.Lock()
+    
+    def send(self, request, **kwargs):
+        if '/almaws/' in request.url:
+            # Reserve the next free slot under the lock, then wait for it outside the lock
+            with self._slot_lock:
+                now = time.monotonic()
+                wait = self._next_slot - now
+                self._next_slot = max(now, self._next_slot) + self._interval
+            if wait > 0:
+                time.sleep(wait)
+        return super().send(request, **kwargs)
+
+
+# Shared connection pool for Alma API calls - keeps TLS connections alive across batches
+# Transient failures (connection resets, timeouts, 429/5xx gateway errors) are retried with exponential
+# backoff (honouring Retry-After) for idempotent methods only; POST (e.g. creating representations) is never replayed.
+# raise_on_status=False returns the final response so callers still report the status code
+_HTTP_ADAPTER = _AlmaRateLimitedAdapter(
+    pool_connections=32,
+    pool_maxsize=64,
+    pool_block=False,
+    max_retries=Retry(
+        total=5,
+        backoff_factor=1.0,
+        status_forcelist=(429, 500, 502, 503, 504),
+        allowed_methods=frozenset(['GET', 'HEAD', 'PUT', 'DELETE']),
+        respect_retry_after_header=True,  # Alma's 429s say how long to wait
+        raise_on_status=False
+    )
+)
+
+# Separate pool for Function 9's Handle and Primo checks (hdl.handle.net and Primo, not the Alma API):
+# a few quick retries for connection failures and 5xx, but read=False so a stalled server is reported
+# after one timeout as requests.ReadTimeout rather than retried and re-raised as a ConnectionError
+_WEB_CHECK_ADAPTER = HTTPAdapter(
+    pool_connections=20,
+    pool_maxsize=20,
+    max_retries=Retry(
+        total=3,
+        read=False,
+        backoff_factor=0.3,
+        status_forcelist=(500, 502, 503, 504),
+        allowed_methods=frozenset(['GET', 'HEAD']),
+        raise_on_status=False
+    )
+)
+
+
+def _is_read_timeout(error: requests.RequestException) -> bool:
+    """
+    True if a request failed on a timeout. Once an adapter's read retries are used up,
+    requests raises a read timeout as ConnectionError wrapping urllib3's ReadTimeoutError.
+    """
+    if isinstance(error, requests.exceptions.Timeout):
+        return True
+    reason = getattr(error.args[0], 'reason', None) if error.args else None
+    return isinstance(reason, ReadTimeoutError)
 
 
 class PersistentStorage:
@@ -58,6 +264,14 @@ class PersistentStorage:
     
     def __init__(self):
         self.data = self.load()
+        self.usage_version = 0  # Bumped whenever function_usage changes, for caches built from it
+        self._save_timer = None  # Pending coalesced save, see _schedule_save()
+        self._save_lock = threading.Lock()  # Guards self.data and the save bookkeeping below
+        self._write_lock = threading.Lock()  # Serializes writes of the file itself
+        # Bumped on every change to self.data; the file is dirty while _saved_version lags behind
+        self._change_version = 0
+        self._saved_version = 0
+        atexit.register(self.flush)  # Write any change not yet saved successfully
     
     def load(self) -> dict:
         """Load persistent data from file"""
@@ -83,18 +297,56 @@ class PersistentStorage:
         }
     
     def save(self):
-        """Save persistent data to file"""
-        try:
-            with open(PERSISTENCE_FILE, 'w', encoding='utf-8') as f:
-                json.dump(self.data, f, indent=2, ensure_ascii=False)
-            logger.debug(f"Saved persistent data to {PERSISTENCE_FILE}")
-        except Exception as e:
-            logger.error(f"Could not save persistent data: {str(e)}")
+        """Save persistent data to file (written to a temp file, then swapped in atomically)"""
+        with self._save_lock:
+            # A full save covers any pending debounced save
+            if self._save_timer is not None:
+                self._save_timer.cancel()
+                self._save_timer = None
+            # Serialize under the lock: json.dump to the file would walk self.data while
+            # the UI thread may still be adding keys to it
+            payload = json.dumps(self.data, ensure_ascii=False)
+            version = self._change_version
+        
+        with self._write_lock:
+            if version <= self._saved_version:
+                return  # A concurrent save already wrote this state or a newer one
+            tmp_file = f"{PERSISTENCE_FILE}.tmp"
+            try:
+                with open(tmp_file, 'w', encoding='utf-8') as f:
+                    f.write(payload)
+                os.replace(tmp_file, PERSISTENCE_FILE)
+                self._saved_version = version
+                logger.debug(f"Saved persistent data to {PERSISTENCE_FILE}")
+            except Exception as e:
+                # Still dirty, so flush() tries again at exit
+                logger.error(f"Could not save persistent data: {str(e)}")
+    
+    def _schedule_save(self):
+        """
+        Save once changes have been idle for UI_STATE_SAVE_DELAY.
+        
+        Bursts of changes (typing an ID, clicking through functions) are written
+        to the file once rather than once per change.
+        """
+        with self._save_lock:
+            if self._save_timer is not None:
+                self._save_timer.cancel()
+            self._save_timer = threading.Timer(UI_STATE_SAVE_DELAY, self.save)
+            self._save_timer.daemon = True
+            self._save_timer.start()
+    
+    def flush(self):
+        """Save now if any change has not been written successfully yet (registered with atexit)"""
+        if self._saved_version < self._change_version:
+            self.save()
     
     def set_ui_state(self, field: str, value: str):
         """Update UI state field"""
-        self.data["ui_state"][field] = value
-        self.save()
+        with self._save_lock:
+            self.data["ui_state"][field] = value
+            self._change_version += 1
+        self._schedule_save()
     
     def get_ui_state(self, field: str, default: str = "") -> str:
         """Get UI state field"""
@@ -102,12 +354,15 @@ class PersistentStorage:
     
     def record_function_usage(self, function_name: str):
         """Record that a function was used"""
-        if function_name not in self.data["function_usage"]:
-            self.data["function_usage"][function_name] = {"count": 0}
-        
-        self.data["function_usage"][function_name]["last_used"] = datetime.now().isoformat()
-        self.data["function_usage"][function_name]["count"] = self.data["function_usage"][function_name].get("count", 0) + 1
-        self.save()
+        with self._save_lock:
+            if function_name not in self.data["function_usage"]:
+                self.data["function_usage"][function_name] = {"count": 0}
+            
+            self.data["function_usage"][function_name]["last_used"] = datetime.now().isoformat()
+            self.data["function_usage"][function_name]["count"] = self.data["function_usage"][function_name].get("count", 0) + 1
+            self._change_version += 1
+        self.usage_version += 1
+        self._schedule_save()
     
     def get_function_usage(self, function_name: str) -> dict:
         """Get usage stats for a function"""
@@ -118,44 +373,148 @@ class PersistentStorage:
         return self.data["function_usage"]
 
 
+class BatchProgress:
+    """Progress counters shared between a batch driver and the UI progress refresher"""
+    
+    def __init__(self, total: int):
+        self._lock = threading.Lock()
+        self.total = total
+        self.current = 0
+        self.item = ""
+    
+    def update(self, current: int, item: str):
+        """Record progress (called by the batch driver, never touches the UI)
+        
+        Only the raw values are stored; the refresher builds the label text, so
+        records finished between redraws never format a string.
+        """
+        with self._lock:
+            self.current = current
+            self.item = item
+    
+    def snapshot(self) -> tuple[int, int, str]:
+        """Return (current, total, item) as one consistent reading"""
+        with self._lock:
+            return self.current, self.total, self.item
+
+
+def _env_positive_int(name: str, default: int) -> int:
+    """Read a positive integer setting from the environment, falling back to `default`"""
+    value = os.getenv(name, '').strip()
+    try:
+        number = int(value) if value else default
+    except ValueError:
+        logger.warning(f"Ignoring {name}={value!r}: expected a whole number, using {default}")
+        return default
+    return number if number > 0 else default
+
+
 class AlmaBibEditor:
     """Main application class for Alma Bib Records Editor"""
     
+    # Maximum concurrent Alma requests for batch record rewrites (Alma allows ~25 calls/sec);
+    # set CABB_BATCH_WORKERS in .env to tune it if Alma starts answering 429
+    BATCH_WORKERS = _env_positive_int('CABB_BATCH_WORKERS', 10)
+    # Concurrent Handle/Primo checks in Function 9 (these hit hdl.handle.net and Primo, not the Alma API)
+    HANDLE_WORKERS = 16
+    # Most recently fetched bib records kept by fetch_bib_record
+    BIB_CACHE_SIZE = 512
+    # Seconds a cached bib record is reused; bounds how stale it can be after edits made outside
+    # this editor's API PUTs (e.g. in the Alma UI)
+    BIB_CACHE_TTL = 300
+    # Seconds a fetch_set_details result is reused before asking Alma again
+    SET_CACHE_TTL = 300
+    # (connect, read) timeout in seconds for Alma API requests, so a stalled call can't hang a batch
+    REQUEST_TIMEOUT = (5, 60)
+    # (connect, read) timeout for POSTs (file uploads, new representations). POST is never retried and
+    # Alma may still complete a slow one, so a short read timeout would report success as failure and a
+    # re-run would create duplicates; the read limit only guards against a connection that never answers
+    WRITE_TIMEOUT = (5, 600)
+    
     def __init__(self, log_callback=None):
         logger.info("Initializing AlmaBibEditor")
         self.api_key = os.getenv('ALMA_API_KEY', '')
         # Region should be: 'America', 'Europe', 'Asia Pacific', 'Canada', or 'China'
         self.api_region = os.getenv('ALMA_API_REGION', 'America')
+        self._api_base = ALMA_REGION_URLS.get(self.api_region, ALMA_REGION_URLS['America'])
         self.status_text = None
         self.log_callback = log_callback
         self.set_members = []  # Store MMS IDs from loaded set
         self.set_info = None   # Store set metadata
         self.current_record = None  # Store currently fetched bib record
-        self.kill_switch = False  # Emergency stop for batch operations
+        self._bib_cache = OrderedDict()  # mms_id -> (fetch time, record dict), least recently used first
+        self._set_cache = {}  # set_id -> (fetch time, set_data)
+        self._cache_lock = threading.Lock()
+        self._parsed_anies = None  # (anies XML string, parsed root) for the current record's DC fields
+        self.kill_event = threading.Event()  # Emergency stop for batch operations (set by the Kill Switch button)
         self.last_manifest = None  # Store last retrieved IIIF manifest
         self.last_manifest_url = None  # Store last manifest URL
         self._pinned_debug_driver = None  # Keep failed Selenium session alive for manual inspection
         self.min_log_level = logging.INFO  # Minimum log level for UI display
+        self._http = requests.Session()  # Keep-alive session shared by Alma API calls
+        self._http.mount('https://', _HTTP_ADAPTER)
+        # Alma answers in JSON unless asked otherwise; XML calls override Accept per request
+        self._http.headers.update({'User-Agent': 'CABB (Crunch Alma Bibs in Bulk)', 'Accept': 'application/json'})
+        # Handle/Primo checks get their own session, so every redirect hop uses _WEB_CHECK_ADAPTER
+        self._web = requests.Session()
+        self._web.mount('https://', _WEB_CHECK_ADAPTER)
+        self._web.mount('http://', _WEB_CHECK_ADAPTER)  # Handle URLs are http://hdl.handle.net/
+        self._web.headers.update({'User-Agent': 'CABB (Crunch Alma Bibs in Bulk)', 'Accept': 'application/json'})
         logger.debug(f"API Region: {self.api_region}")
         logger.debug(f"API Key configured: {'Yes' if self.api_key else 'No'}")
         
-    def log(self, message, level=logging.INFO):
-        """Log a message and send to UI callback if level is sufficient"""
-        logger.log(level, message)
+    def log(self, message, level=logging.INFO, *args, exc_info=False):
+        """
+        Log a message and send to UI callback if level is sufficient
+        
+        Any extra args are %-formatted into message only when the message will
+        actually be emitted, so hot loops can pass values instead of f-strings.
+        With exc_info=True (inside an except block) the current traceback is
+        attached to the same log record, so an error is logged with one call; the
+        UI only shows the traceback when its log level is DEBUG.
+        """
         # Only send to UI callback if message level is >= minimum level
-        if self.log_callback and level >= self.min_log_level:
+        to_ui = self.log_callback and level >= self.min_log_level
+        if not to_ui and not logger.isEnabledFor(level):
+            return
+        if args:
+            message = message % args
+        logger.log(level, message, exc_info=exc_info)
+        if to_ui:
+            if exc_info and self.min_log_level <= logging.DEBUG:
+                message = f"{message}\n{traceback.format_exc()}"
             self.log_callback(message)
     
+    def _cache_bib(self, mms_id: str, record: dict):
+        """Store a bib record in the LRU cache, evicting the least recently used entry when full"""
+        with self._cache_lock:
+            self._bib_cache[mms_id] = (time.monotonic(), record)
+            self._bib_cache.move_to_end(mms_id)
+            if len(self._bib_cache) > self.BIB_CACHE_SIZE:
+                self._bib_cache.popitem(last=False)
+    
+    def invalidate_bib(self, mms_id: str):
+        """Forget the cached copy of a bib record (call after any update to it)"""
+        with self._cache_lock:
+            self._bib_cache.pop(mms_id, None)
+    
+    def _cached_bib(self, mms_id: str) -> Optional[dict]:
+        """
+        Return the cached record for mms_id, or None if it is missing or older than
+        BIB_CACHE_TTL (expired entries are dropped). The caller must hold _cache_lock.
+        """
+        cached = self._bib_cache.get(mms_id)
+        if cached is None:
+            return None
+        if time.monotonic() - cached[0] >= self.BIB_CACHE_TTL:
+            del self._bib_cache[mms_id]
+            return None
+        self._bib_cache.move_to_end(mms_id)
+        return cached[1]
+    
     def _get_alma_api_url(self):
-        """Get the correct Alma API URL based on region"""
-        region_urls = {
-            'America': 'https://api-na.hosted.exlibrisgroup.com',
-            'Europe': 'https://api-eu.hosted.exlibrisgroup.com',
-            'Asia Pacific': 'https://api-ap.hosted.exlibrisgroup.com',
-            'Canada': 'https://api-ca.hosted.exlibrisgroup.com',
-            'China': 'https://api-cn.hosted.exlibrisgroup.com'
-        }
-        return region_urls.get(self.api_region, region_urls['America'])
+        """Get the correct Alma API URL based on region (resolved once in __init__)"""
+        return self._api_base
     
     def initialize_alma_connection(self):
         """Verify API Key is configured"""
@@ -183,29 +542,41 @@ class AlmaBibEditor:
             self.log("API Key not configured", logging.ERROR)
             return False, "API Key not configured", {}
         
+        cached = self._set_cache.get(set_id)
+        if cached is not None and time.monotonic() - cached[0] < self.SET_CACHE_TTL:
+            set_data = cached[1]
+        else:
+            set_data = None
+        
         try:
-            api_url = self._get_alma_api_url()
+            api_url = self._api_base
             
-            self.log(f"Requesting set {set_id} from Alma API")
-            response = requests.get(
-                f"{api_url}/almaws/v1/conf/sets/{set_id}?apikey={self.api_key}",
-                headers={'Accept': 'application/json'}
-            )
-            
-            if response.status_code == 401 or response.status_code == 400:
-                # Check if it's an authorization issue
-                if 'UNAUTHORIZED' in response.text or 'API-key not defined' in response.text:
-                    error_msg = "API Key not authorized for Sets API. Please add 'Configuration' permissions in Alma API key settings."
-                    self.log(error_msg, logging.ERROR)
+            if set_data is not None:
+                self.log(f"Using set {set_id} details fetched in the last {self.SET_CACHE_TTL} seconds", logging.DEBUG)
+            else:
+                self.log(f"Requesting set {set_id} from Alma API")
+                response = self._http.get(
+                    f"{api_url}/almaws/v1/conf/sets/{set_id}",
+                    params={'apikey': self.api_key},
+                    timeout=self.REQUEST_TIMEOUT
+                )
+                
+                if response.status_code == 401 or response.status_code == 400:
+                    # Check if it's an authorization issue
+                    if 'UNAUTHORIZED' in response.text or 'API-key not defined' in response.text:
+                        error_msg = "API Key not authorized for Sets API. Please add 'Configuration' permissions in Alma API key settings."
+                        self.log(error_msg, logging.ERROR)
+                        self.log(f"Response: {response.text}", logging.ERROR)
+                        return False, error_msg, {}
+                
+                if response.status_code != 200:
+                    self.log(f"Failed to fetch set: {response.status_code}", logging.ERROR)
                     self.log(f"Response: {response.text}", logging.ERROR)
-                    return False, error_msg, {}
-            
-            if response.status_code != 200:
-                self.log(f"Failed to fetch set: {response.status_code}", logging.ERROR)
-                self.log(f"Response: {response.text}", logging.ERROR)
-                return False, f"Failed to fetch set: {response.status_code}", {}
+                    return False, f"Failed to fetch set: {response.status_code}", {}
+                
+                set_data = json_loads(response.content)
+                self._set_cache[set_id] = (time.monotonic(), set_data)
             
-            set_data = response.json()
             set_name = set_data.get('name', 'Unknown')
             set_type = set_data.get('type', {}).get('desc', 'Unknown')
             member_count = set_data.get('number_of_members', {}).get('value', 0)
@@ -216,11 +587,12 @@ class AlmaBibEditor:
             
             return True, f"Set: {set_name} ({member_count} members)", set_data
             
+        except (requests.Timeout, requests.ConnectionError) as e:
+            # Retries exhausted on a stalled or unreachable Alma (read timeouts surface as ConnectionError)
+            self.log(f"Alma did not respond while fetching set {set_id}: {str(e)}", logging.ERROR)
+            return False, f"Alma did not respond while fetching set {set_id}", {}
         except Exception as e:
-            import traceback
-            error_details = traceback.format_exc()
-            self.log(f"Error fetching set {set_id}: {str(e)}", logging.ERROR)
-            self.log(f"Full traceback:\n{error_details}", logging.DEBUG)
+            self.log(f"Error fetching set {set_id}: {str(e)}", logging.ERROR, exc_info=True)
             return False, f"Error fetching set {set_id}: {str(e)}", {}
     
     def fetch_set_members(self, set_id: str, progress_callback=None, max_members=0) -> tuple[bool, str, list]:
@@ -241,117 +613,136 @@ class AlmaBibEditor:
             return False, "API Key not configured", []
         
         try:
-            api_url = self._get_alma_api_url()
+            from concurrent.futures import ThreadPoolExecutor
+            
+            api_url = self._api_base
             all_members = []
-            offset = 0
             limit = 100  # API default page size
             total_records = 0
             
-            while True:
-                self.log(f"Fetching members (offset: {offset}, limit: {limit})")
-                response = requests.get(
-                    f"{api_url}/almaws/v1/conf/sets/{set_id}/members?limit={limit}&offset={offset}&apikey={self.api_key}",
-                    headers={'Accept': 'application/json'}
+            def get_page(page_offset):
+                self.log(f"Fetching members (offset: {page_offset}, limit: {limit})")
+                return page_offset, self._http.get(
+                    f"{api_url}/almaws/v1/conf/sets/{set_id}/members?limit={limit}&offset={page_offset}",
+                    params={'apikey': self.api_key},
+                    timeout=self.REQUEST_TIMEOUT
                 )
-                
-                if response.status_code != 200:
-                    # Handle errors - if we already have some members, return them with a warning
-                    # This handles cases where corrupted records cause the API to fail mid-pagination
-                    if response.status_code == 400:
-                        self.log(f"Got 400 error fetching set members (offset {offset})", logging.WARNING)
-                        self.log(f"Response: {response.text}", logging.WARNING)
-                        
-                        # Try to extract corrupted MMS IDs from error message
-                        import re
-                        import json
-                        corrupted_ids = []
-                        try:
-                            error_data = json.loads(response.text)
-                            if 'errorList' in error_data and 'error' in error_data['errorList']:
-                                for error in error_data['errorList']['error']:
-                                    msg = error.get('errorMessage', '')
-                                    # Extract MMS ID from messages like "Set Member not found: IED 991011546791604641"
-                                    match = re.search(r'\d{18,21}', msg)
-                                    if match:
-                                        corrupted_ids.append(match.group(0))
-                        except:
-                            pass
-                        
-                        if corrupted_ids:
-                            self.log(f"Identified corrupted record(s): {', '.join(corrupted_ids)}", logging.WARNING)
-                        
-                        if all_members:
-                            # We've fetched some members already, return them with a warning
-                            warning_msg = f"⚠️ Fetched {len(all_members)} members, but stopped due to corrupted records (error 400 at offset {offset})"
-                            self.log(warning_msg, logging.WARNING)
-                            self.set_members = all_members
-                            return True, warning_msg, all_members
-                        else:
-                            # First page failed - set contains corrupted records in first page
-                            self.log("First page failed with 400 - set contains corrupted records that prevent API access", logging.ERROR)
-                            msg = "⚠️ Cannot fetch set via API: corrupted records detected.\n"
-                            msg += "💡 WORKAROUND: Export set member list from Alma Analytics or use existing CSV file.\n"
-                            msg += "   Then enter the CSV filename in 'Set ID or CSV Path' field and click 'Load Set Members'."
+            
+            def pages():
+                # The first page tells us total_records (set by the loop below); the rest are
+                # requested concurrently and yielded in offset order
+                yield get_page(0)
+                executor = ThreadPoolExecutor(max_workers=self.BATCH_WORKERS)
+                futures = [executor.submit(get_page, page_offset) for page_offset in range(limit, total_records, limit)]
+                try:
+                    for future in futures:
+                        yield future.result()
+                finally:
+                    # Stopping early (error or limit reached) drops pages not yet requested
+                    for future in futures:
+                        future.cancel()
+                    executor.shutdown(wait=False)
+            
+            page_iter = pages()
+            try:
+                for offset, response in page_iter:
+                    if response.status_code != 200:
+                        # Handle errors - if we already have some members, return them with a warning
+                        # This handles cases where corrupted records cause the API to fail mid-pagination
+                        if response.status_code == 400:
+                            self.log(f"Got 400 error fetching set members (offset {offset})", logging.WARNING)
+                            self.log(f"Response: {response.text}", logging.WARNING)
+                            
+                            # Try to extract corrupted MMS IDs from error message
+                            import re
+                            import json
+                            corrupted_ids = []
+                            try:
+                                error_data = json.loads(response.text)
+                                if 'errorList' in error_data and 'error' in error_data['errorList']:
+                                    for error in error_data['errorList']['error']:
+                                        msg = error.get('errorMessage', '')
+                                        # Extract MMS ID from messages like "Set Member not found: IED 991011546791604641"
+                                        match = re.search(r'\d{18,21}', msg)
+                                        if match:
+                                            corrupted_ids.append(match.group(0))
+                            except:
+                                pass
+                            
                             if corrupted_ids:
-                                msg += f"\n   Known corrupted record(s): {', '.join(corrupted_ids)}"
-                            return False, msg, []
-                    else:
-                        # Other errors - fail immediately
-                        self.log(f"Failed to fetch set members: {response.status_code}", logging.ERROR)
-                        self.log(f"Response: {response.text}", logging.ERROR)
-                        return False, f"Failed to fetch set members: {response.status_code}", []
-                
-                data = response.json()
-                members = data.get('member', [])
-                
-                # Get total record count from first response
-                if offset == 0:
-                    total_records = data.get('total_record_count', 0)
-                    # Adjust total if max_members is set
-                    if max_members > 0 and max_members < total_records:
-                        total_records = max_members
-                
-                if not members:
-                    break
-                
-                # Extract MMS IDs from member objects
-                for member in members:
-                    mms_id = member.get('id')
-                    if mms_id:
-                        all_members.append(mms_id)
-                        # Stop if we've reached the limit
-                        if max_members > 0 and len(all_members) >= max_members:
-                            break
-                
-                self.log(f"Retrieved {len(members)} members (total so far: {len(all_members)})")
-                
-                # Update progress
-                if progress_callback and total_records > 0:
-                    progress_callback(len(all_members), total_records)
-                
-                # Check if we've reached the limit
-                if max_members > 0 and len(all_members) >= max_members:
-                    break
-                
-                # Check if there are more results
-                if offset + limit >= total_records:
-                    break
-                
-                offset += limit
+                                self.log(f"Identified corrupted record(s): {', '.join(corrupted_ids)}", logging.WARNING)
+                            
+                            if all_members:
+                                # We've fetched some members already, return them with a warning
+                                warning_msg = f"⚠️ Fetched {len(all_members)} members, but stopped due to corrupted records (error 400 at offset {offset})"
+                                self.log(warning_msg, logging.WARNING)
+                                self.set_members = all_members
+                                return True, warning_msg, all_members
+                            else:
+                                # First page failed - set contains corrupted records in first page
+                                self.log("First page failed with 400 - set contains corrupted records that prevent API access", logging.ERROR)
+                                msg = "⚠️ Cannot fetch set via API: corrupted records detected.\n"
+                                msg += "💡 WORKAROUND: Export set member list from Alma Analytics or use existing CSV file.\n"
+                                msg += "   Then enter the CSV filename in 'Set ID or CSV Path' field and click 'Load Set Members'."
+                                if corrupted_ids:
+                                    msg += f"\n   Known corrupted record(s): {', '.join(corrupted_ids)}"
+                                return False, msg, []
+                        else:
+                            # Other errors - fail immediately
+                            self.log(f"Failed to fetch set members: {response.status_code}", logging.ERROR)
+                            self.log(f"Response: {response.text}", logging.ERROR)
+                            return False, f"Failed to fetch set members: {response.status_code}", []
+                    
+                    data = json_loads(response.content)
+                    members = data.get('member', [])
+                    
+                    # Get total record count from first response
+                    if offset == 0:
+                        total_records = data.get('total_record_count', 0)
+                        # Adjust total if max_members is set
+                        if max_members > 0 and max_members < total_records:
+                            total_records = max_members
+                    
+                    if not members:
+                        break
+                    
+                    # Extract MMS IDs from member objects, trimmed to what the limit still allows
+                    page_ids = [member['id'] for member in members if member.get('id')]
+                    if max_members > 0:
+                        page_ids = page_ids[:max_members - len(all_members)]
+                    all_members.extend(page_ids)
+                    
+                    self.log(f"Retrieved {len(members)} members (total so far: {len(all_members)})")
+                    
+                    # Update progress
+                    if progress_callback and total_records > 0:
+                        progress_callback(len(all_members), total_records)
+                    
+                    # Check if we've reached the limit
+                    if max_members > 0 and len(all_members) >= max_members:
+                        break
+                    
+                    # Check if there are more results
+                    if offset + limit >= total_records:
+                        break
+            finally:
+                # Cancels queued page requests on every exit, including the early error returns
+                page_iter.close()
             
             self.set_members = all_members
             self.log(f"Successfully fetched {len(all_members)} members from set {set_id}")
             
             return True, f"Fetched {len(all_members)} member records", all_members
             
+        except (requests.Timeout, requests.ConnectionError) as e:
+            # Retries exhausted on a stalled or unreachable Alma (read timeouts surface as ConnectionError)
+            self.log(f"Alma did not respond while fetching set members {set_id}: {str(e)}", logging.ERROR)
+            return False, f"Alma did not respond while fetching set members {set_id}", []
         except Exception as e:
-            import traceback
-            error_details = traceback.format_exc()
-            self.log(f"Error fetching set members {set_id}: {str(e)}", logging.ERROR)
-            self.log(f"Full traceback:\n{error_details}", logging.DEBUG)
+            self.log(f"Error fetching set members {set_id}: {str(e)}", logging.ERROR, exc_info=True)
             return False, f"Error fetching set members {set_id}: {str(e)}", []
     
-    def load_mms_ids_from_csv(self, csv_file_path: str) -> tuple[bool, str, list]:
+    def load_mms_ids_from_csv(self, csv_file_path: str, max_members: int = 0) -> tuple[bool, str, list]:
         """
         Load MMS IDs from a CSV file.
         
@@ -360,61 +751,64 @@ class AlmaBibEditor:
         
         Args:
             csv_file_path: Path to the CSV file
+            max_members: Maximum number of MMS IDs to load (0 = all); reading stops once reached
             
         Returns:
             tuple: (success: bool, message: str, mms_ids: list)
         """
         import csv
+        from itertools import islice
         
         self.log(f"Loading MMS IDs from CSV: {csv_file_path}")
         
         try:
-            mms_ids = []
-            
-            with open(csv_file_path, 'r', encoding='utf-8') as csvfile:
-                reader = csv.DictReader(csvfile)
-                
-                # Find the mms_id column (case-insensitive)
-                mms_id_column = None
-                for fieldname in reader.fieldnames:
-                    if fieldname.lower() == 'mms_id':
-                        mms_id_column = fieldname
-                        break
-                
-                if mms_id_column is None:
+            with open(csv_file_path, 'r', encoding='utf-8', newline='') as csvfile:
+                # Plain rows (not DictReader) - only one column is needed, so no per-row dict
+                reader = csv.reader(csvfile)
+                header = next(reader, None)
+                if not header:
+                    self.log(f"CSV file is empty: {csv_file_path}", logging.ERROR)
+                    return False, "Error loading CSV: file is empty", []
+                
+                # Find the mms_id column (case-insensitive) - headers are lowered once into a lookup dict
+                column_index = {fieldname.strip().lower(): i for i, fieldname in enumerate(header)}
+                mms_id_index = column_index.get('mms_id')
+                
+                if mms_id_index is None:
                     # Use first column if no mms_id column found
-                    mms_id_column = reader.fieldnames[0]
-                    self.log(f"No 'mms_id' column found, using first column: {mms_id_column}", logging.WARNING)
+                    mms_id_index = 0
+                    self.log(f"No 'mms_id' column found, using first column: {header[0]}", logging.WARNING)
                 
-                # Read MMS IDs, skipping comment lines (starting with #)
-                for row in reader:
-                    mms_id = row.get(mms_id_column, '').strip()
-                    # Skip empty lines and comment lines (starting with #)
-                    if mms_id and not mms_id.startswith('#'):
-                        mms_ids.append(mms_id)
+                # Read MMS IDs, skipping empty lines and comment lines (starting with #)
+                valid_ids = (
+                    mms_id for mms_id in (row[mms_id_index].strip() for row in reader if len(row) > mms_id_index)
+                    if mms_id and not mms_id.startswith('#')
+                )
+                # islice stops reading the file as soon as max_members IDs are collected
+                mms_ids = list(islice(valid_ids, max_members or None))
             
             self.set_members = mms_ids
-            self.set_info = {'name': csv_file_path.split('/')[-1], 'source': 'CSV'}
+            self.set_info = {'name': os.path.basename(csv_file_path), 'source': 'CSV'}
             
             self.log(f"Loaded {len(mms_ids)} MMS IDs from CSV")
             return True, f"Loaded {len(mms_ids)} MMS IDs from CSV", mms_ids
             
         except Exception as e:
-            import traceback
-            error_details = traceback.format_exc()
-            self.log(f"Error loading CSV {csv_file_path}: {str(e)}", logging.ERROR)
-            self.log(f"Full traceback:\n{error_details}", logging.DEBUG)
+            self.log(f"Error loading CSV {csv_file_path}: {str(e)}", logging.ERROR, exc_info=True)
             return False, f"Error loading CSV: {str(e)}", []
     
     def fetch_bib_records_batch(self, mms_ids: list) -> dict:
         """
         Fetch multiple bibliographic records in a single batch API call (up to 100 IDs).
         
+        Records already in the bib cache are served from it; only the misses are
+        requested from Alma, and the fetched records are added to the cache.
+        
         Args:
             mms_ids: List of MMS IDs to retrieve (max 100)
             
         Returns:
-            dict: Dictionary mapping mms_id -> record dict, only contains successfully fetched records
+            dict: Dictionary mapping mms_id -> record dict, only contains successfully fetched (or cached) records
         """
         if not self.api_key:
             self.log("API Key not configured", logging.ERROR)
@@ -428,27 +822,39 @@ class AlmaBibEditor:
             self.log(f"Warning: Batch size {len(mms_ids)} exceeds limit, truncating to 100", logging.WARNING)
             mms_ids = mms_ids[:100]
         
+        # Serve cache hits first; a fully cached batch needs no API call at all
+        mms_ids = [str(mms_id).strip() for mms_id in mms_ids]
+        with self._cache_lock:
+            records = {}
+            for mms_id in mms_ids:
+                cached = self._cached_bib(mms_id)
+                if cached is not None:
+                    records[mms_id] = cached
+        missing = [mms_id for mms_id in mms_ids if mms_id not in records]
+        if not missing:
+            self.log(f"Batch served from cache: {len(records)} records", logging.DEBUG)
+            return records
+        
         try:
-            api_url = self._get_alma_api_url()
+            api_url = self._api_base
             
             # Join MMS IDs with comma for batch request
-            mms_ids_param = ','.join([str(mms_id).strip() for mms_id in mms_ids])
+            mms_ids_param = ','.join(missing)
             
-            self.log(f"Batch API call: Fetching {len(mms_ids)} records")
-            headers = {'Accept': 'application/json'}
-            response = requests.get(
-                f"{api_url}/almaws/v1/bibs?mms_id={mms_ids_param}&view=full&expand=None&apikey={self.api_key}",
-                headers=headers
+            self.log(f"Batch API call: Fetching {len(missing)} records ({len(records)} cached)")
+            response = self._http.get(
+                f"{api_url}/almaws/v1/bibs?mms_id={mms_ids_param}&view=full&expand=None",
+                params={'apikey': self.api_key},
+                timeout=self.REQUEST_TIMEOUT
             )
             
             if response.status_code != 200:
                 self.log(f"Batch API call failed: {response.status_code}", logging.ERROR)
                 self.log(f"Response: {response.text}", logging.ERROR)
-                return {}
+                return records
             
             # Parse JSON response
-            data = response.json()
-            records = {}
+            data = json_loads(response.content)
             
             # Extract bibs from response
             bibs = data.get('bib', [])
@@ -478,15 +884,53 @@ class AlmaBibEditor:
                     'originating_system': bib.get('originating_system_id', '')[:9] if bib.get('originating_system_id') else '01GCL_INST',
                     'anies': anies
                 }
+                self._cache_bib(mms_id, records[mms_id])
             
             return records
             
+        except (requests.Timeout, requests.ConnectionError) as e:
+            # Retries exhausted on a stalled or unreachable Alma (read timeouts surface as ConnectionError)
+            self.log(f"Alma did not respond while fetching a batch of {len(missing)} records: {str(e)}", logging.ERROR)
+            return records
         except Exception as e:
-            import traceback
-            error_details = traceback.format_exc()
-            self.log(f"Error in batch fetch: {str(e)}", logging.ERROR)
-            self.log(f"Full traceback:\n{error_details}", logging.DEBUG)
-            return {}
+            self.log(f"Error in batch fetch: {str(e)}", logging.ERROR, exc_info=True)
+            return records
+    
+    def iter_bib_records_batches(self, mms_ids: list, batch_size: int = 100, max_workers: int = 4):
+        """
+        Yield fetch_bib_records_batch results for consecutive batch_size slices of mms_ids, in order.
+        
+        Up to max_workers upcoming batches are requested concurrently while the caller
+        works on the current one. Stopping early (e.g. on the kill switch) cancels
+        batches that have not been requested yet.
+        
+        Args:
+            mms_ids: List of MMS IDs
+            batch_size: IDs per batch call (Alma allows up to 100)
+            max_workers: Number of batches fetched ahead
+            
+        Yields:
+            dict: mms_id -> record dict for each batch, as from fetch_bib_records_batch
+        """
+        from concurrent.futures import ThreadPoolExecutor
+        from itertools import islice
+        
+        starts = iter(range(0, len(mms_ids), batch_size))
+        executor = ThreadPoolExecutor(max_workers=max_workers)
+        pending = deque(
+            executor.submit(self.fetch_bib_records_batch, mms_ids[start:start + batch_size])
+            for start in islice(starts, max_workers)
+        )
+        try:
+            while pending:
+                records = pending.popleft().result()
+                for start in islice(starts, 1):
+                    pending.append(executor.submit(self.fetch_bib_records_batch, mms_ids[start:start + batch_size]))
+                yield records
+        finally:
+            for future in pending:
+                future.cancel()
+            executor.shutdown(wait=False)
     
     def fetch_bib_record(self, mms_id: str) -> tuple[bool, str]:
         """
@@ -503,15 +947,22 @@ class AlmaBibEditor:
             self.log("API Key not configured", logging.ERROR)
             return False, "API Key not configured"
         
+        with self._cache_lock:
+            cached = self._cached_bib(mms_id)
+        if cached is not None:
+            self.current_record = cached
+            self.log(f"Using cached record {mms_id}", logging.DEBUG)
+            return True, f"Successfully fetched record {mms_id}"
+        
         try:
-            api_url = self._get_alma_api_url()
+            api_url = self._api_base
             
             # GET the bib record as JSON (easier to parse than XML for this use case)
             self.log(f"Requesting bibliographic record {mms_id} from Alma API")
-            headers = {'Accept': 'application/json'}
-            response = requests.get(
-                f"{api_url}/almaws/v1/bibs/{mms_id}?view=full&expand=None&apikey={self.api_key}",
-                headers=headers
+            response = self._http.get(
+                f"{api_url}/almaws/v1/bibs/{mms_id}?view=full&expand=None",
+                params={'apikey': self.api_key},
+                timeout=self.REQUEST_TIMEOUT
             )
             
             if response.status_code != 200:
@@ -520,7 +971,7 @@ class AlmaBibEditor:
                 return False, f"Failed to fetch record: {response.status_code}"
             
             # Parse JSON response
-            bib = response.json()
+            bib = json_loads(response.content)
             
             # Extract anies field (contains Dublin Core XML)
             anies = bib.get('anies', [])
@@ -537,15 +988,17 @@ class AlmaBibEditor:
                 'originating_system': bib.get('originating_system_id', '')[:9] if bib.get('originating_system_id') else '01GCL_INST',
                 'anies': anies
             }
+            self._cache_bib(mms_id, self.current_record)
             
             self.log(f"Successfully fetched record {mms_id}")
             return True, f"Successfully fetched record {mms_id}"
             
+        except (requests.Timeout, requests.ConnectionError) as e:
+            # Retries exhausted on a stalled or unreachable Alma (read timeouts surface as ConnectionError)
+            self.log(f"Alma did not respond while fetching record {mms_id}: {str(e)}", logging.ERROR)
+            return False, f"Alma did not respond while fetching record {mms_id}"
         except Exception as e:
-            import traceback
-            error_details = traceback.format_exc()
-            self.log(f"Error fetching record {mms_id}: {str(e)}", logging.ERROR)
-            self.log(f"Full traceback:\n{error_details}", logging.DEBUG)
+            self.log(f"Error fetching record {mms_id}: {str(e)}", logging.ERROR, exc_info=True)
             return False, f"Error fetching record {mms_id}: {str(e)}"
     
     def fetch_and_display_xml(self, mms_id: str, page=None) -> tuple[bool, str]:
@@ -566,14 +1019,16 @@ class AlmaBibEditor:
         
         try:
             # Get the Alma API base URL
-            api_url = self._get_alma_api_url()
+            api_url = self._api_base
             
             # GET the bib record as XML
             self.log(f"Requesting bibliographic record {mms_id} from Alma API")
             headers = {'Accept': 'application/xml'}
-            response = requests.get(
-                f"{api_url}/almaws/v1/bibs/{mms_id}?view=full&expand=None&apikey={self.api_key}",
-                headers=headers
+            response = self._http.get(
+                f"{api_url}/almaws/v1/bibs/{mms_id}?view=full&expand=None",
+                params={'apikey': self.api_key},
+                headers=headers,
+                timeout=self.REQUEST_TIMEOUT
             )
             
             if response.status_code != 200:
@@ -581,20 +1036,16 @@ class AlmaBibEditor:
                 self.log(f"Response: {response.text}", logging.ERROR)
                 return False, f"Failed to fetch record: {response.status_code}"
             
-            # Pretty print the XML
-            xml_text = response.text
-            self.log(f"Raw XML length: {len(xml_text)} chars")
+            # Pretty print the XML (parsed from the raw bytes; only decoded as-is if that fails)
+            xml_bytes = response.content
+            self.log(f"Raw XML length: {len(xml_bytes)} bytes")
             
             try:
-                # Parse and pretty print
-                dom = minidom.parseString(xml_text)
-                pretty_xml = dom.toprettyxml(indent="  ")
-                # Remove extra blank lines
-                pretty_xml = '\n'.join([line for line in pretty_xml.split('\n') if line.strip()])
+                pretty_xml = pretty_print_xml(xml_bytes)
                 self.log(f"Pretty-printed XML length: {len(pretty_xml)} chars")
             except Exception as e:
                 self.log(f"Could not pretty-print XML: {str(e)}", logging.WARNING)
-                pretty_xml = xml_text
+                pretty_xml = response.text
             
             self.log(f"Successfully fetched XML for MMS ID: {mms_id}")
             
@@ -605,13 +1056,10 @@ class AlmaBibEditor:
             else:
                 self.log("WARNING: No page object provided, cannot show dialog", logging.WARNING)
             
-            return True, f"Successfully fetched and displayed XML for record {mms_id} ({len(xml_text)} chars)"
+            return True, f"Successfully fetched and displayed XML for record {mms_id} ({len(xml_bytes)} bytes)"
             
         except Exception as e:
-            import traceback
-            error_details = traceback.format_exc()
-            self.log(f"Error fetching record {mms_id}: {str(e)}", logging.ERROR)
-            self.log(f"Full traceback:\n{error_details}", logging.DEBUG)
+            self.log(f"Error fetching record {mms_id}: {str(e)}", logging.ERROR, exc_info=True)
             return False, f"Error fetching record {mms_id}: {str(e)}"
     
     def _show_xml_dialog(self, page, mms_id: str, xml_content: str):
@@ -623,19 +1071,24 @@ class AlmaBibEditor:
             xml_dialog.open = False
             page.update()
         
+        reset_timer = None
+        
+        def reset_text():
+            copy_button.text = "Copy to Clipboard"
+            page.update()
+        
         def copy_xml(e):
+            nonlocal reset_timer
             self.log("Copying XML to clipboard")
             page.set_clipboard(xml_content)
             copy_button.text = "Copied!"
             page.update()
-            # Reset button text after 2 seconds
-            import threading
-            def reset_text():
-                import time
-                time.sleep(2)
-                copy_button.text = "Copy to Clipboard"
-                page.update()
-            threading.Thread(target=reset_text, daemon=True).start()
+            # Reset button text after 2 seconds; a repeat click restarts the one pending timer
+            if reset_timer is not None:
+                reset_timer.cancel()
+            reset_timer = threading.Timer(2.0, reset_text)
+            reset_timer.daemon = True
+            reset_timer.start()
         
         copy_button = ft.TextButton("Copy to Clipboard", on_click=copy_xml)
         
@@ -694,30 +1147,11 @@ class AlmaBibEditor:
         
         self.log(f"Starting CSV export for {len(mms_ids)} records to {output_file}")
         
-        # Define CSV column headings (no duplicates)
-        column_headings = [
-            "group_id", "collection_id", "mms_id", "originating_system_id", "compoundrelationship",
-            "dc:title", "dcterms:alternative", "oldalttitle", "dc:identifier",
-            "dcterms:identifier.dcterms:URI", "dcterms:tableOfContents", "dc:creator",
-            "dc:contributor", "dc:subject", "dcterms:subject.dcterms:LCSH",
-            "dc:description", "dcterms:provenance",
-            "dcterms:bibliographicCitation", "dcterms:abstract", "dcterms:publisher",
-            "dc:date", "dcterms:created", "dcterms:issued",
-            "dcterms:dateSubmitted", "dcterms:dateAccepted", "dc:type", "dc:format",
-            "dcterms:extent", "dcterms:medium",
-            "dcterms:format.dcterms:IMT", "dcterms:type.dcterms:DCMIType", "dc:language",
-            "dc:relation", "dcterms:isPartOf",
-            "dc:coverage", "dcterms:spatial", "dcterms:spatial.dcterms:Point",
-            "dcterms:temporal", "dc:rights", "dc:source", "bib custom field",
-            "rep_label", "rep_public_note", "rep_access_rights", "rep_usage_type",
-            "rep_library", "rep_note", "rep_custom field", "file_name_1", "file_label_1",
-            "file_name_2", "file_label_2", "googlesheetsource", "dginfo"
-        ]
-        
         try:
-            with open(output_file, 'w', newline='', encoding='utf-8') as csvfile:
+            # 1 MiB write buffer: rows are flushed to disk in large blocks rather than every ~8 KB
+            with open(output_file, 'w', newline='', encoding='utf-8', buffering=1 << 20) as csvfile:
                 writer = csv.writer(csvfile)
-                writer.writerow(column_headings)  # Write header
+                writer.writerow(CSV_EXPORT_HEADINGS)  # Write header
                 
                 success_count = 0
                 failed_count = 0
@@ -729,6 +1163,8 @@ class AlmaBibEditor:
                 self.log(f"Using batch API calls: {total_batches} calls for {total} records (vs {total} individual calls)")
                 
                 # Process in batches
+                # Upcoming batches are fetched in the background while this one is processed
+                batch_results = self.iter_bib_records_batches(mms_ids, batch_size)
                 for batch_start in range(0, total, batch_size):
                     batch_end = min(batch_start + batch_size, total)
                     batch_ids = mms_ids[batch_start:batch_end]
@@ -737,7 +1173,10 @@ class AlmaBibEditor:
                     self.log(f"Processing batch {batch_num}/{total_batches}: records {batch_start+1}-{batch_end}")
                     
                     # Fetch batch of records
-                    batch_records = self.fetch_bib_records_batch(batch_ids)
+                    batch_records = next(batch_results)
+                    
+                    # Rows for this batch are written together once it has been mapped
+                    batch_rows = []
                     
                     # Process each record in the batch
                     for i in range(len(batch_ids)):
@@ -751,8 +1190,7 @@ class AlmaBibEditor:
                                 self.current_record = batch_records[mms_id]
                                 
                                 # Map record to CSV row (returns list)
-                                row = self._map_bib_to_csv_row(self.current_record)
-                                writer.writerow(row)
+                                batch_rows.append(self._map_bib_to_csv_row(self.current_record))
                                 success_count += 1
                             else:
                                 self.log(f"Record not returned in batch: {mms_id}", logging.WARNING)
@@ -768,6 +1206,11 @@ class AlmaBibEditor:
                         except Exception as e:
                             self.log(f"Error exporting {mms_id}: {str(e)}", logging.ERROR)
                             failed_count += 1
+                    
+                    writer.writerows(batch_rows)
+                    # Push each finished batch to disk, so the file grows as the export runs
+                    # and an interrupted export keeps every batch written so far
+                    csvfile.flush()
                 
                 message = f"CSV export complete: {success_count} succeeded, {failed_count} failed. File: {output_file}"
                 self.log(message)
@@ -779,52 +1222,37 @@ class AlmaBibEditor:
             self.log(error_msg, logging.ERROR)
             return False, error_msg
     
-    def _extract_lcsh_subjects(self) -> list:
-        """Extract LCSH subjects (dcterms:subject with xsi:type='dcterms:LCSH')"""
-        try:
-            anies = self.current_record.get("anies", [])
-            if not anies:
-                return []
-            
-            dc_xml = anies[0] if isinstance(anies, list) else anies
-            root = ET.fromstring(dc_xml)
-            
-            namespaces = {
-                'dcterms': 'http://purl.org/dc/terms/',
-                'xsi': 'http://www.w3.org/2001/XMLSchema-instance'
-            }
-            
-            values = []
-            # Find all dcterms:subject elements
-            for elem in root.findall(".//{{{}}}subject".format(namespaces['dcterms'])):
-                # Check if it has xsi:type="dcterms:LCSH" attribute
-                xsi_type = elem.get("{{{0}}}type".format(namespaces['xsi']))
-                if xsi_type == "dcterms:LCSH" and elem.text and elem.text.strip():
-                    values.append(elem.text.strip())
-            
-            return values
-        except Exception as e:
-            self.log(f"Error extracting LCSH subjects: {str(e)}", logging.WARNING)
-            return []
+    def _current_dc_root(self):
+        """
+        Return the parsed root of the current record's anies XML, or None if it has none.
+        
+        The field extractors are called dozens of times per record (e.g. once per CSV
+        column), so the tree is parsed once and reused until the XML string changes.
+        """
+        anies = self.current_record.get("anies", []) if self.current_record else []
+        if not anies:
+            return None
+        
+        dc_xml = anies[0] if isinstance(anies, list) else anies
+        parsed = self._parsed_anies
+        if parsed is not None and parsed[0] is dc_xml:
+            return parsed[1]
+        
+        root = ET.fromstring(dc_xml)
+        self._parsed_anies = (dc_xml, root)
+        return root
     
     def _extract_dc_field(self, element: str, namespace: str = "dc") -> list:
         """Extract data from Dublin Core XML in the anies field"""
         try:
-            anies = self.current_record.get("anies", [])
-            if not anies:
+            root = self._current_dc_root()
+            if root is None:
                 return []
             
-            dc_xml = anies[0] if isinstance(anies, list) else anies
-            root = ET.fromstring(dc_xml)
-            
-            namespaces = {
-                'dc': 'http://purl.org/dc/elements/1.1/',
-                'dcterms': 'http://purl.org/dc/terms/'
-            }
-            
             values = []
-            tag = f"{{{namespaces[namespace]}}}{element}"
-            for elem in root.findall(f".//{tag}"):
+            # iter() walks the tree directly, with no ElementPath parsing per call
+            tag = _DC_TAG_PREFIXES[namespace] + element
+            for elem in root.iter(tag):
                 if elem.text and elem.text.strip():
                     values.append(elem.text.strip())
             
@@ -833,34 +1261,30 @@ class AlmaBibEditor:
             self.log(f"Error extracting DC field {namespace}:{element}: {str(e)}", logging.WARNING)
             return []
     
-    def _extract_custom_field(self, element: str, namespace_uri: str) -> list:
-        """Extract data from custom namespace fields (tries both namespaced and unprefixed)"""
+    def _iter_dc_identifiers(self):
+        """
+        Yield dc:identifier values from the current record without building a full tree.
+
+        Uses iterparse so callers can stop as soon as they have what they need;
+        each element is cleared once its text has been read.
+        """
+        anies = self.current_record.get("anies", []) if self.current_record else []
+        if not anies:
+            return
+
+        dc_xml = anies[0] if isinstance(anies, list) else anies
+        if isinstance(dc_xml, str):
+            dc_xml = dc_xml.encode('utf-8')
+
+        tag = _DC_IDENTIFIER_TAG
         try:
-            anies = self.current_record.get("anies", [])
-            if not anies:
-                return []
-            
-            dc_xml = anies[0] if isinstance(anies, list) else anies
-            root = ET.fromstring(dc_xml)
-            
-            values = []
-            # Try namespaced version first
-            tag = f"{{{namespace_uri}}}{element}"
-            for elem in root.findall(f".//{tag}"):
-                if elem.text and elem.text.strip():
-                    values.append(elem.text.strip())
-            
-            # If no namespaced elements found, try unprefixed (for dginfo, compoundrelationship, etc.)
-            if not values:
-                for elem in root.findall(f".//{element}"):
-                    if elem.text and elem.text.strip():
-                        values.append(elem.text.strip())
-            
-            return values
-        except Exception as e:
-            self.log(f"Error extracting custom field {element}: {str(e)}", logging.WARNING)
-            return []
-    
+            for _, elem in ET.iterparse(io.BytesIO(dc_xml), events=('end',)):
+                if elem.tag == tag and elem.text and elem.text.strip():
+                    yield elem.text.strip()
+                elem.clear()
+        except ET.ParseError as e:
+            self.log(f"Error extracting DC field dc:identifier: {str(e)}", logging.WARNING)
+
     def _deduplicate_values(self, values: list) -> list:
         """Remove duplicate values from a list while preserving order"""
         seen = set()
@@ -873,175 +1297,95 @@ class AlmaBibEditor:
     
     def _map_bib_to_csv_row(self, bib: dict) -> list:
         """Map a bibliographic record to a CSV row using Dublin Core fields
-        Returns a list of values in the same order as column_headings
+        Returns a list of values in the same order as CSV_EXPORT_HEADINGS
         Multi-valued fields are joined with ' | ' separator"""
         
-        # Extract the actual namespace from the XML record
-        grinnell_ns = "http://alma.exlibrisgroup.com/dc/01GCL_INST"  # Default
+        anies = bib.get("anies", [])
+        dc_xml = (anies[0] if isinstance(anies, list) else anies) if anies else ""
+        
+        # Custom fields live in the record's default namespace (normally the same for a whole set)
+        ns_match = _XMLNS_PATTERN.search(dc_xml) if dc_xml else None
+        grinnell_ns = ns_match.group(1) if ns_match else _DEFAULT_GRINNELL_NS
+        compound_tag, sheets_tag, dginfo_tag = _custom_field_tags(grinnell_ns)
+        
+        # Bin every field value by tag in one walk of the tree, instead of one scan per column
         try:
-            anies = bib.get("anies", [])
-            if anies:
-                dc_xml = anies[0] if isinstance(anies, list) else anies
-                # Extract namespace from root element
-                import re
-                ns_match = re.search(r'xmlns="([^"]+)"', dc_xml)
-                if ns_match:
-                    grinnell_ns = ns_match.group(1)
-        except Exception as e:
-            self.log(f"Could not extract namespace from XML: {str(e)}", logging.DEBUG)
+            if len(dc_xml) > STREAM_PARSE_MIN_CHARS:
+                # Very large records are streamed so no full tree is held in memory
+                fields = _collect_fields(_iter_streamed_elements(dc_xml.encode('utf-8')))
+            else:
+                root = self._current_dc_root()
+                fields = _collect_fields(root.iter() if root is not None else ())
+        except ET.ParseError as e:
+            self.log(f"Error parsing DC XML for {bib.get('mms_id', '')}: {str(e)}", logging.WARNING)
+            fields = _collect_fields(())
+        
+        # Pre-sized row in CSV_EXPORT_HEADINGS order; unset columns (placeholders) stay ""
+        row = [""] * len(CSV_EXPORT_HEADINGS)
+        col = _CSV_EXPORT_COLUMNS
         
-        # Build row as list - must match column_headings order exactly
-        row = []
+        def joined(values):
+            return " | ".join(self._deduplicate_values(values)) if values else ""
         
         # Basic metadata
-        row.append("")  # group_id
-        row.append("")  # collection_id
-        row.append(bib.get("mms_id", ""))  # mms_id
-        row.append(bib.get("originating_system_id", ""))  # originating_system_id
+        row[col["mms_id"]] = bib.get("mms_id", "")
+        row[col["originating_system_id"]] = bib.get("originating_system_id", "")
         
         # compoundrelationship (custom field)
-        compound = self._extract_custom_field("compoundrelationship", grinnell_ns)
-        row.append(compound[0] if compound else "")
+        compound = fields[compound_tag] or fields["compoundrelationship"]
+        if compound:
+            row[col["compoundrelationship"]] = compound[0]
         
         # Extract Dublin Core fields
-        titles = self._extract_dc_field("title", "dc")
-        row.append(titles[0] if titles else bib.get("title", ""))  # dc:title
-        
-        alt_titles = self._extract_dc_field("alternative", "dcterms")
-        row.append(" | ".join(self._deduplicate_values(alt_titles)) if alt_titles else "")  # dcterms:alternative
-        
-        row.append("")  # oldalttitle
-        
-        identifiers = self._extract_dc_field("identifier", "dc")
-        row.append(" | ".join(self._deduplicate_values(identifiers)) if identifiers else "")  # dc:identifier
-        
-        # dcterms:identifier.dcterms:URI - extract URI from identifiers
-        uri = ""
-        for identifier in identifiers:
-            if identifier.startswith("http://") or identifier.startswith("https://"):
-                uri = identifier
-                break
-        row.append(uri)
-        
-        toc = self._extract_dc_field("tableOfContents", "dcterms")
-        row.append(" | ".join(self._deduplicate_values(toc)) if toc else "")  # dcterms:tableOfContents
-        
-        creators = self._extract_dc_field("creator", "dc")
-        row.append(" | ".join(self._deduplicate_values(creators)) if creators else bib.get("author", ""))  # dc:creator
-        
-        contributors = self._extract_dc_field("contributor", "dc")
-        row.append(" | ".join(self._deduplicate_values(contributors)) if contributors else "")  # dc:contributor
-        
-        # dc:subject - all dc:subject values joined with pipe separator
-        dc_subjects = self._extract_dc_field("subject", "dc")
-        row.append(" | ".join(self._deduplicate_values(dc_subjects)) if dc_subjects else "")
-        
-        # Extract LCSH subjects - all joined in single column
-        lcsh_subjects = self._extract_lcsh_subjects()
-        row.append(" | ".join(self._deduplicate_values(lcsh_subjects)) if lcsh_subjects else "")
-        
-        descriptions = self._extract_dc_field("description", "dc")
-        row.append(" | ".join(self._deduplicate_values(descriptions)) if descriptions else "")  # dc:description
-        
-        provenance = self._extract_dc_field("provenance", "dcterms")
-        row.append(" | ".join(self._deduplicate_values(provenance)) if provenance else "")  # dcterms:provenance
-        
-        citation = self._extract_dc_field("bibliographicCitation", "dcterms")
-        row.append(" | ".join(self._deduplicate_values(citation)) if citation else "")  # dcterms:bibliographicCitation
-        
-        abstract = self._extract_dc_field("abstract", "dcterms")
-        row.append(" | ".join(self._deduplicate_values(abstract)) if abstract else "")  # dcterms:abstract
-        
-        # dcterms:publisher - all values joined
-        publishers = self._extract_dc_field("publisher", "dcterms")
-        row.append(" | ".join(self._deduplicate_values(publishers)) if publishers else "")
-        
-        dates = self._extract_dc_field("date", "dc")
-        row.append(dates[0] if dates else bib.get("date_of_publication", ""))  # dc:date
-        
-        created = self._extract_dc_field("created", "dcterms")
-        row.append(created[0] if created else "")  # dcterms:created
-        
-        issued = self._extract_dc_field("issued", "dcterms")
-        row.append(issued[0] if issued else "")  # dcterms:issued
-        
-        submitted = self._extract_dc_field("dateSubmitted", "dcterms")
-        row.append(submitted[0] if submitted else "")  # dcterms:dateSubmitted
-        
-        accepted = self._extract_dc_field("dateAccepted", "dcterms")
-        row.append(accepted[0] if accepted else "")  # dcterms:dateAccepted
-        
-        types = self._extract_dc_field("type", "dc")
-        row.append(types[0] if types else "")  # dc:type
-        
-        formats = self._extract_dc_field("format", "dc")
-        row.append(formats[0] if formats else "")  # dc:format
-        
-        # dcterms:extent - all values joined
-        extents = self._extract_dc_field("extent", "dcterms")
-        row.append(" | ".join(self._deduplicate_values(extents)) if extents else "")
-        
-        medium = self._extract_dc_field("medium", "dcterms")
-        row.append(medium[0] if medium else "")  # dcterms:medium
-        
-        # dcterms:format.dcterms:IMT
-        imt_formats = self._extract_dc_field("format", "dcterms")
-        row.append(imt_formats[0] if imt_formats else "")
-        
-        # dcterms:type.dcterms:DCMIType  
-        dcmi_types = self._extract_dc_field("type", "dcterms")
-        row.append(dcmi_types[0] if dcmi_types else "")
-        
-        languages = self._extract_dc_field("language", "dc")
-        row.append(" | ".join(self._deduplicate_values(languages)) if languages else "")  # dc:language
-        
-        relations = self._extract_dc_field("relation", "dc")
-        row.append(" | ".join(self._deduplicate_values(relations)) if relations else "")  # dc:relation
-        
-        # dcterms:isPartOf - all values joined
-        ispartof = self._extract_dc_field("isPartOf", "dcterms")
-        row.append(" | ".join(self._deduplicate_values(ispartof)) if ispartof else "")
-        
-        coverage = self._extract_dc_field("coverage", "dc")
-        row.append(" | ".join(self._deduplicate_values(coverage)) if coverage else "")  # dc:coverage
-        
-        spatial = self._extract_dc_field("spatial", "dcterms")
-        row.append(" | ".join(self._deduplicate_values(spatial)) if spatial else "")  # dcterms:spatial
-        
-        row.append("")  # dcterms:spatial.dcterms:Point
-        
-        temporal = self._extract_dc_field("temporal", "dcterms")
-        row.append(" | ".join(self._deduplicate_values(temporal)) if temporal else "")  # dcterms:temporal
-        
-        rights = self._extract_dc_field("rights", "dc")
-        row.append(" | ".join(self._deduplicate_values(rights)) if rights else "")  # dc:rights
-        
-        sources = self._extract_dc_field("source", "dc")
-        row.append(" | ".join(self._deduplicate_values(sources)) if sources else "")  # dc:source
-        
-        row.append("")  # bib custom field
-        
-        # Representation fields (placeholders)
-        row.append("")  # rep_label
-        row.append("")  # rep_public_note
-        row.append("")  # rep_access_rights
-        row.append("")  # rep_usage_type
-        row.append("")  # rep_library
-        row.append("")  # rep_note
-        row.append("")  # rep_custom field
+        titles = fields[_DC_TAG + "title"]
+        row[col["dc:title"]] = titles[0] if titles else bib.get("title", "")
+        row[col["dcterms:alternative"]] = joined(fields[_DCTERMS_TAG + "alternative"])
+        
+        identifiers = fields[_DC_TAG + "identifier"]
+        row[col["dc:identifier"]] = joined(identifiers)
+        # dcterms:identifier.dcterms:URI - first identifier that is a URI
+        row[col["dcterms:identifier.dcterms:URI"]] = next(
+            (identifier for identifier in identifiers if identifier.startswith(("http://", "https://"))), ""
+        )
         
-        # File fields (placeholders)
-        row.append("")  # file_name_1
-        row.append("")  # file_label_1
-        row.append("")  # file_name_2
-        row.append("")  # file_label_2
+        row[col["dcterms:tableOfContents"]] = joined(fields[_DCTERMS_TAG + "tableOfContents"])
+        creators = fields[_DC_TAG + "creator"]
+        row[col["dc:creator"]] = joined(creators) if creators else bib.get("author", "")
+        row[col["dc:contributor"]] = joined(fields[_DC_TAG + "contributor"])
+        row[col["dc:subject"]] = joined(fields[_DC_TAG + "subject"])
+        # LCSH subjects (dcterms:subject with xsi:type="dcterms:LCSH") - all joined in single column
+        row[col["dcterms:subject.dcterms:LCSH"]] = joined(fields[_LCSH_KEY])
+        row[col["dc:description"]] = joined(fields[_DC_TAG + "description"])
+        row[col["dcterms:provenance"]] = joined(fields[_DCTERMS_TAG + "provenance"])
+        row[col["dcterms:bibliographicCitation"]] = joined(fields[_DCTERMS_TAG + "bibliographicCitation"])
+        row[col["dcterms:abstract"]] = joined(fields[_DCTERMS_TAG + "abstract"])
+        row[col["dcterms:publisher"]] = joined(fields[_DCTERMS_TAG + "publisher"])
+        
+        # Date and single-valued fields take the first value only
+        dates = fields[_DC_TAG + "date"]
+        row[col["dc:date"]] = dates[0] if dates else bib.get("date_of_publication", "")
+        for heading, tag in _CSV_EXPORT_FIRST_VALUE_FIELDS:
+            values = fields[tag]
+            if values:
+                row[col[heading]] = values[0]
+        
+        row[col["dcterms:extent"]] = joined(fields[_DCTERMS_TAG + "extent"])
+        row[col["dc:language"]] = joined(fields[_DC_TAG + "language"])
+        row[col["dc:relation"]] = joined(fields[_DC_TAG + "relation"])
+        row[col["dcterms:isPartOf"]] = joined(fields[_DCTERMS_TAG + "isPartOf"])
+        row[col["dc:coverage"]] = joined(fields[_DC_TAG + "coverage"])
+        row[col["dcterms:spatial"]] = joined(fields[_DCTERMS_TAG + "spatial"])
+        row[col["dcterms:temporal"]] = joined(fields[_DCTERMS_TAG + "temporal"])
+        row[col["dc:rights"]] = joined(fields[_DC_TAG + "rights"])
+        row[col["dc:source"]] = joined(fields[_DC_TAG + "source"])
         
         # Custom fields
-        sheets = self._extract_custom_field("googlesheetsource", grinnell_ns)
-        row.append(sheets[0] if sheets else "")  # googlesheetsource
-        
-        dginfo = self._extract_custom_field("dginfo", grinnell_ns)
-        row.append(dginfo[0] if dginfo else "")  # dginfo
+        sheets = fields[sheets_tag] or fields["googlesheetsource"]
+        if sheets:
+            row[col["googlesheetsource"]] = sheets[0]
+        dginfo = fields[dginfo_tag] or fields["dginfo"]
+        if dginfo:
+            row[col["dginfo"]] = dginfo[0]
         
         return row
     
@@ -1067,14 +1411,15 @@ class AlmaBibEditor:
             return False, "API Key not configured"
         
         try:
-            api_url = self._get_alma_api_url()
+            api_url = self._api_base
             
             # Step 1: Get representations if representation_id not provided
             if not representation_id:
                 self.log("Fetching representations list")
-                response = requests.get(
-                    f"{api_url}/almaws/v1/bibs/{mms_id}/representations?apikey={self.api_key}",
-                    headers={'Accept': 'application/json'}
+                response = self._http.get(
+                    f"{api_url}/almaws/v1/bibs/{mms_id}/representations",
+                    params={'apikey': self.api_key},
+                    timeout=self.REQUEST_TIMEOUT
                 )
                 
                 if response.status_code != 200:
@@ -1111,7 +1456,7 @@ class AlmaBibEditor:
             self.log(f"IIIF Manifest URL: {manifest_url}")
             
             # Step 3: Fetch the manifest (no authentication needed for public IIIF)
-            manifest_response = requests.get(manifest_url)
+            manifest_response = self._http.get(manifest_url, timeout=self.REQUEST_TIMEOUT)
             
             if manifest_response.status_code != 200:
                 self.log(f"Failed to fetch IIIF manifest: {manifest_response.status_code}", logging.ERROR)
@@ -1124,9 +1469,9 @@ class AlmaBibEditor:
                 if institution_code:
                     delivery_url = f"https://{alma_domain}.alma.exlibrisgroup.com/view/delivery/{institution_code}/{representation_id}.json"
                 
-                delivery_response = requests.get(
+                delivery_response = self._http.get(
                     delivery_url,
-                    headers={'Accept': 'application/json'}
+                    timeout=self.REQUEST_TIMEOUT
                 )
                 
                 if delivery_response.status_code == 200:
@@ -1156,10 +1501,11 @@ class AlmaBibEditor:
                 
                 # If delivery JSON also fails, try representation files API
                 self.log("Attempting to retrieve representation files for canvas URLs", logging.INFO)
-                api_url = self._get_alma_api_url()
-                files_response = requests.get(
-                    f"{api_url}/almaws/v1/bibs/{mms_id}/representations/{representation_id}/files?apikey={self.api_key}",
-                    headers={'Accept': 'application/json'}
+                api_url = self._api_base
+                files_response = self._http.get(
+                    f"{api_url}/almaws/v1/bibs/{mms_id}/representations/{representation_id}/files",
+                    params={'apikey': self.api_key},
+                    timeout=self.REQUEST_TIMEOUT
                 )
                 
                 if files_response.status_code == 200:
@@ -1229,10 +1575,7 @@ class AlmaBibEditor:
             return True, result
             
         except Exception as e:
-            import traceback
-            error_details = traceback.format_exc()
-            self.log(f"Error retrieving IIIF manifest: {str(e)}", logging.ERROR)
-            self.log(f"Full traceback:\n{error_details}", logging.DEBUG)
+            self.log(f"Error retrieving IIIF manifest: {str(e)}", logging.ERROR, exc_info=True)
             return False, f"Error retrieving IIIF manifest: {str(e)}"
     
     def replace_author_copyright_rights(self, mms_id: str) -> tuple[bool, str, str]:
@@ -1247,7 +1590,7 @@ class AlmaBibEditor:
         """Function 22: Delegate to inactive_functions module"""
         return inactive_functions.diagnose_record_accessibility(self, mms_ids, output_file, progress_callback)
     
-    def add_grinnell_identifier(self, mms_id: str) -> tuple[bool, str]:
+    def add_grinnell_identifier(self, mms_id: str) -> tuple[bool, str, str]:
         """Function 7: Delegate to inactive_functions module"""
         return inactive_functions.add_grinnell_identifier(self, mms_id)
     
@@ -1280,9 +1623,11 @@ class AlmaBibEditor:
         ]
         
         try:
-            with open(output_file, 'w', newline='', encoding='utf-8') as csvfile:
-                writer = csv.DictWriter(csvfile, fieldnames=column_headings)
-                writer.writeheader()
+            # Same 1 MiB write buffer as export_to_csv
+            with open(output_file, 'w', newline='', encoding='utf-8', buffering=1 << 20) as csvfile:
+                # Positional rows in column_headings order (no per-row dict for DictWriter to map)
+                writer = csv.writer(csvfile)
+                writer.writerow(column_headings)
                 
                 success_count = 0
                 failed_count = 0
@@ -1294,6 +1639,8 @@ class AlmaBibEditor:
                 self.log(f"Using batch API calls: {total_batches} calls for {total} records")
                 
                 # Process in batches
+                # Upcoming batches are fetched in the background while this one is processed
+                batch_results = self.iter_bib_records_batches(mms_ids, batch_size)
                 for batch_start in range(0, total, batch_size):
                     batch_end = min(batch_start + batch_size, total)
                     batch_ids = mms_ids[batch_start:batch_end]
@@ -1302,7 +1649,8 @@ class AlmaBibEditor:
                     self.log(f"Processing batch {batch_num}/{total_batches}: records {batch_start+1}-{batch_end}")
                     
                     # Fetch batch of records
-                    batch_records = self.fetch_bib_records_batch(batch_ids)
+                    batch_records = next(batch_results)
+                    batch_rows = []
                     
                     # Process each record in the batch
                     for i in range(len(batch_ids)):
@@ -1315,31 +1663,25 @@ class AlmaBibEditor:
                                 # Set as current record for field extraction
                                 self.current_record = batch_records[mms_id]
                                 
-                                # Extract all dc:identifier values
-                                identifiers = self._extract_dc_field("identifier", "dc")
-                                
-                                # Categorize identifiers
+                                # Categorize dc:identifier values (first of each type wins)
                                 dg_identifier = ""
                                 grinnell_identifier = ""
                                 handle_identifier = ""
-                                
-                                for identifier in identifiers:
+
+                                for identifier in self._iter_dc_identifiers():
                                     if identifier.startswith("dg_"):
-                                        dg_identifier = identifier
+                                        dg_identifier = dg_identifier or identifier
                                     elif identifier.startswith("Grinnell:"):
-                                        grinnell_identifier = identifier
+                                        grinnell_identifier = grinnell_identifier or identifier
                                     elif identifier.startswith("http://hdl.handle.net/"):
-                                        handle_identifier = identifier
+                                        handle_identifier = handle_identifier or identifier
+
+                                    # Stop parsing once all three columns are filled
+                                    if dg_identifier and grinnell_identifier and handle_identifier:
+                                        break
                                 
                                 # Create CSV row
-                                row = {
-                                    "MMS ID": mms_id,
-                                    "dg_* identifier": dg_identifier,
-                                    "Grinnell:* identifier": grinnell_identifier,
-                                    "Handle identifier": handle_identifier
-                                }
-                                
-                                writer.writerow(row)
+                                batch_rows.append((mms_id, dg_identifier, grinnell_identifier, handle_identifier))
                                 success_count += 1
                             else:
                                 self.log(f"Record not returned in batch: {mms_id}", logging.WARNING)
@@ -1355,6 +1697,8 @@ class AlmaBibEditor:
                         except Exception as e:
                             self.log(f"Error exporting {mms_id}: {str(e)}", logging.ERROR)
                             failed_count += 1
+                    
+                    writer.writerows(batch_rows)
                 
                 message = f"Identifier CSV export complete: {success_count} succeeded, {failed_count} failed. File: {output_file}"
                 self.log(message)
@@ -1366,47 +1710,186 @@ class AlmaBibEditor:
             self.log(error_msg, logging.ERROR)
             return False, error_msg
     
-    def validate_handles_to_csv(self, mms_ids: list, output_file: str, progress_callback=None) -> tuple[bool, str]:
+    def _dc_title_and_handle(self, record: dict) -> tuple[str, str]:
+        """
+        Pull the first dc:title and the Handle URL from a record with a single XML parse.
+        
+        Args:
+            record: Bib record dict as returned by fetch_bib_records_batch
+        
+        Returns:
+            tuple: (title, handle_url) - "No title found" / "" when absent
+        """
+        anies = record.get("anies", [])
+        if not anies:
+            return "No title found", ""
+        
+        try:
+            root = ET.fromstring(anies[0] if isinstance(anies, list) else anies)
+        except ET.ParseError as e:
+            self.log(f"Error parsing Dublin Core XML: {str(e)}", logging.WARNING)
+            return "No title found", ""
+        
+        title = "No title found"
+        for elem in root.iter('{http://purl.org/dc/elements/1.1/}title'):
+            if elem.text and elem.text.strip():
+                title = elem.text.strip()
+                break
+        
+        handle_url = ""
+        for elem in root.iter(_DC_IDENTIFIER_TAG):
+            identifier = (elem.text or "").strip()
+            if identifier.startswith("http://hdl.handle.net/"):
+                handle_url = identifier
+                break
+        
+        return title, handle_url
+    
+    def _check_handle(self, mms_id: str, handle_url: str, title: str) -> Optional[tuple]:
+        """
+        Resolve one Handle URL and build its Function 9 CSV row.
+        
+        Runs on a worker thread, so it only uses its arguments and the shared
+        session (never self.current_record).
+        
+        Args:
+            mms_id: MMS ID the Handle should resolve to
+            handle_url: Handle URL to test
+            title: dc:title from the Alma record
+        
+        Returns:
+            tuple: CSV row in HANDLE_VALIDATION_HEADINGS order, or None if the kill switch was activated
+        """
+        if self.kill_event.is_set():
+            return None
+        
+        # Test the Handle URL
+        self.log("Testing Handle: %s", logging.INFO, handle_url)
+        returned_title = ""
+        title_matches = ""
+        primo_title_match = "N/A"  # Filled in afterwards when the Primo check is enabled
+        
+        try:
+            response = self._web.head(handle_url, allow_redirects=True, timeout=10)
+            if response.status_code == 405:
+                # Server rejects HEAD - fall back to a streamed GET and never read the body
+                response = self._web.get(handle_url, allow_redirects=True, stream=True, timeout=10)
+                response.close()
+            status_code = response.status_code
+            
+            # Get status message
+            status_message = _STATUS_MESSAGES.get(status_code) or response.reason or "Unknown"
+            
+            if status_code == 200:
+                # Check the final redirect URL (already followed above) for the correct MMS ID
+                final_url = response.url
+                returned_title = final_url
+                
+                # Check if the final URL contains the MMS ID
+                # Handle URLs typically redirect to Primo with pattern: .../alma{MMS_ID}/...
+                if mms_id in final_url:
+                    title_matches = "TRUE"
+                    self.log("MMS ID %s found in redirect URL: %s", logging.INFO, mms_id, final_url)
+                else:
+                    title_matches = "FALSE"
+                    self.log("MMS ID %s NOT found in redirect URL: %s", logging.WARNING, mms_id, final_url)
+            
+            self.log("Handle %s returned %s: %s", logging.INFO, handle_url, status_code, status_message)
+        
+        except requests.exceptions.Timeout:
+            status_code = 0
+            status_message = "Timeout"
+            returned_title = ""
+            title_matches = "N/A"
+            self.log(f"Handle {handle_url} timed out", logging.WARNING)
+        except requests.exceptions.ConnectionError:
+            status_code = 0
+            status_message = "Connection Error"
+            returned_title = ""
+            title_matches = "N/A"
+            self.log(f"Handle {handle_url} connection error", logging.WARNING)
+        except Exception as e:
+            status_code = 0
+            status_message = f"Error: {str(e)}"
+            returned_title = ""
+            title_matches = "N/A"
+            self.log(f"Handle {handle_url} error: {str(e)}", logging.WARNING)
+        
+        # Create CSV row (same order as HANDLE_VALIDATION_HEADINGS)
+        return (mms_id, handle_url, title, status_code, status_message,
+                returned_title, title_matches, primo_title_match)
+    
+    def _fetch_primo_title(self, mms_id: str) -> Optional[str]:
+        """
+        Look up a record's display title in Primo (Function 9 title cross-check).
+        
+        Args:
+            mms_id: MMS ID of the record
+        
+        Returns:
+            str: Primo display title ("" if empty), or None if it could not be retrieved
+        """
+        if self.kill_event.is_set():
+            return None
+        
+        try:
+            primo_api_url = _PRIMO_URL_PREFIX + mms_id + _PRIMO_URL_SUFFIX
+            self.log("Querying Primo API: %s", logging.DEBUG, primo_api_url)
+            primo_response = self._web.get(primo_api_url, timeout=10)
+            
+            if primo_response.status_code != 200:
+                self.log(f"Primo API returned status {primo_response.status_code}", logging.WARNING)
+                return None
+            
+            # Parse the raw bytes (json detects the UTF encoding itself)
+            primo_data = json.loads(primo_response.content)
+            # Extract title from JSON - typically in pnx.display.title[0]
+            primo_titles = primo_data.get('pnx', {}).get('display', {}).get('title')
+            if primo_titles is None:
+                self.log("No title field found in Primo JSON response", logging.WARNING)
+                return None
+            return primo_titles[0] if primo_titles else ""
+        except Exception as e:
+            self.log(f"Error querying Primo API: {str(e)}", logging.DEBUG)
+            return None
+    
+    def validate_handles_to_csv(self, mms_ids: list, output_file: str, progress_callback=None,
+                                verify_primo_title: bool = False) -> tuple[bool, str]:
         """
         Function 9: Validate Handle URLs and export results to CSV
         Creates a CSV with Handle URL, dc:title, and HTTP status code.
         Useful for finding broken Handle links (404s, redirects, etc.)
+        Handles within each 100-record batch are checked concurrently (up to HANDLE_WORKERS at once).
         
         Args:
             mms_ids: List of MMS IDs to check
             output_file: Path to output CSV file
             progress_callback: Optional callback function(current, total) for progress updates
+            verify_primo_title: Also query Primo and compare its title with dc:title
+                (one extra request per resolving Handle; "Titles Match!" is N/A when off)
             
         Returns:
             tuple: (success: bool, message: str)
         """
         import csv
+        from concurrent.futures import ThreadPoolExecutor, as_completed
         
         self.log(f"Starting Handle validation for {len(mms_ids)} records to {output_file}")
         
-        # Define CSV column headings
-        column_headings = [
-            "MMS ID",
-            "Handle URL",
-            "dc:title",
-            "HTTP Status Code",
-            "Status Message",
-            "Final Redirect URL",
-            "Returned Correct MMS ID",
-            "Titles Match!"
-        ]
-        
         try:
-            with open(output_file, 'w', newline='', encoding='utf-8') as csvfile:
-                writer = csv.DictWriter(csvfile, fieldnames=column_headings)
-                writer.writeheader()
+            # Rows are formatted into an in-memory text buffer and written to the (binary)
+            # file as one UTF-8 block per batch, skipping the per-row text-file encode layer
+            with open(output_file, 'wb', buffering=1 << 20) as csvfile, \
+                    ThreadPoolExecutor(max_workers=self.HANDLE_WORKERS) as executor:
+                row_buffer = io.StringIO(newline='')
+                writer = csv.writer(row_buffer)
+                writer.writerow(HANDLE_VALIDATION_HEADINGS)
+                csvfile.write(row_buffer.getvalue().encode('utf-8'))
                 
                 success_count = 0
                 failed_count = 0
                 no_handle_count = 0
-                status_200_count = 0
-                status_404_count = 0
-                status_other_count = 0
+                status_counts = Counter()
                 total = len(mms_ids)
                 batch_size = 100  # Alma API supports up to 100 MMS IDs per batch call
                 
@@ -1415,9 +1898,11 @@ class AlmaBibEditor:
                 self.log(f"Using batch API calls: {total_batches} calls for {total} records")
                 
                 # Process in batches
+                # Upcoming batches are fetched in the background while this one is processed
+                batch_results = self.iter_bib_records_batches(mms_ids, batch_size)
                 for batch_start in range(0, total, batch_size):
                     # Check kill switch
-                    if self.kill_switch:
+                    if self.kill_event.is_set():
                         self.log("Process stopped by user")
                         break
                     batch_end = min(batch_start + batch_size, total)
@@ -1427,173 +1912,82 @@ class AlmaBibEditor:
                     self.log(f"Processing batch {batch_num}/{total_batches}: records {batch_start+1}-{batch_end}")
                     
                     # Fetch batch of records
-                    batch_records = self.fetch_bib_records_batch(batch_ids)
+                    batch_records = next(batch_results)
                     
-                    # Process each record in the batch
-                    for i in range(len(batch_ids)):
-                        # Check kill switch
-                        if self.kill_switch:
-                            self.log("Process stopped by user")
-                            break
-                        
-                        record_index = batch_start + i + 1
-                        mms_id = batch_ids[i]
-                        
+                    # Parse each returned record once into mms_id -> title / Handle lookups
+                    titles_by_id = {}
+                    handles_by_id = {}
+                    for mms_id, record in batch_records.items():
                         try:
-                            # Check if record was successfully fetched
-                            if mms_id in batch_records:
-                                # Set as current record for field extraction
-                                self.current_record = batch_records[mms_id]
-                                
-                                # Extract title
-                                titles = self._extract_dc_field("title", "dc")
-                                title = titles[0] if titles else "No title found"
-                                
-                                # Extract all dc:identifier values
-                                identifiers = self._extract_dc_field("identifier", "dc")
-                                
-                                # Find Handle identifier
-                                handle_url = ""
-                                for identifier in identifiers:
-                                    if identifier.startswith("http://hdl.handle.net/"):
-                                        handle_url = identifier
-                                        break
-                                
-                                if handle_url:
-                                    # Test the Handle URL
-                                    self.log(f"Testing Handle: {handle_url}")
-                                    returned_title = ""
-                                    title_matches = ""
-                                    primo_title_match = "N/A"
-                                    
-                                    try:
-                                        response = requests.head(handle_url, allow_redirects=True, timeout=10)
-                                        status_code = response.status_code
-                                        
-                                        # Get status message
-                                        if status_code == 200:
-                                            status_message = "OK"
-                                            # Check the final redirect URL to verify it contains the correct MMS ID
-                                            try:
-                                                full_response = requests.get(handle_url, allow_redirects=True, timeout=10)
-                                                if full_response.status_code == 200:
-                                                    final_url = full_response.url
-                                                    returned_title = final_url
-                                                    
-                                                    # Check if the final URL contains the MMS ID
-                                                    # Handle URLs typically redirect to Primo with pattern: .../alma{MMS_ID}/...
-                                                    primo_title_match = "N/A"
-                                                    if mms_id in final_url:
-                                                        title_matches = "TRUE"
-                                                        self.log(f"MMS ID {mms_id} found in redirect URL: {final_url}")
-                                                        
-                                                        # Query Primo API for title comparison
-                                                        try:
-                                                            primo_api_url = f"https://grinnell.primo.exlibrisgroup.com/primaws/rest/pub/pnxs/undefined/alma{mms_id}?vid=01GCL_INST:GCL&lang=en&lang=en"
-                                                            self.log(f"Querying Primo API: {primo_api_url}", logging.DEBUG)
-                                                            primo_response = requests.get(primo_api_url, timeout=10)
-                                                            
-                                                            if primo_response.status_code == 200:
-                                                                primo_data = primo_response.json()
-                                                                # Extract title from JSON - typically in pnx.display.title[0]
-                                                                if 'pnx' in primo_data and 'display' in primo_data['pnx'] and 'title' in primo_data['pnx']['display']:
-                                                                    primo_title = primo_data['pnx']['display']['title'][0] if primo_data['pnx']['display']['title'] else ""
-                                                                    # Compare titles (case-insensitive, strip whitespace)
-                                                                    if primo_title.strip().lower() == title.strip().lower():
-                                                                        primo_title_match = "TRUE"
-                                                                        self.log(f"Primo title matches: '{primo_title}'")
-                                                                    else:
-                                                                        primo_title_match = "FALSE"
-                                                                        self.log(f"Primo title mismatch: '{primo_title}' vs '{title}'", logging.WARNING)
-                                                                else:
-                                                                    self.log("No title field found in Primo JSON response", logging.WARNING)
-                                                            else:
-                                                                self.log(f"Primo API returned status {primo_response.status_code}", logging.WARNING)
-                                                        except Exception as e:
-                                                            self.log(f"Error querying Primo API: {str(e)}", logging.DEBUG)
-                                                    else:
-                                                        title_matches = "FALSE"
-                                                        self.log(f"MMS ID {mms_id} NOT found in redirect URL: {final_url}", logging.WARNING)
-                                            except Exception as e:
-                                                self.log(f"Could not fetch redirect URL: {str(e)}", logging.DEBUG)
-                                                returned_title = "Error fetching page"
-                                                title_matches = "N/A"
-                                        elif status_code == 404:
-                                            status_message = "Not Found"
-                                        elif status_code == 301:
-                                            status_message = "Moved Permanently"
-                                        elif status_code == 302:
-                                            status_message = "Found (Redirect)"
-                                        elif status_code == 403:
-                                            status_message = "Forbidden"
-                                        elif status_code == 500:
-                                            status_message = "Internal Server Error"
-                                        else:
-                                            status_message = response.reason if hasattr(response, 'reason') else "Unknown"
-                                        
-                                        self.log(f"Handle {handle_url} returned {status_code}: {status_message}")
-                                        
-                                    except requests.exceptions.Timeout:
-                                        status_code = 0
-                                        status_message = "Timeout"
-                                        returned_title = ""
-                                        title_matches = "N/A"
-                                        self.log(f"Handle {handle_url} timed out", logging.WARNING)
-                                    except requests.exceptions.ConnectionError:
-                                        status_code = 0
-                                        status_message = "Connection Error"
-                                        returned_title = ""
-                                        title_matches = "N/A"
-                                        self.log(f"Handle {handle_url} connection error", logging.WARNING)
-                                    except Exception as e:
-                                        status_code = 0
-                                        status_message = f"Error: {str(e)}"
-                                        returned_title = ""
-                                        title_matches = "N/A"
-                                        self.log(f"Handle {handle_url} error: {str(e)}", logging.WARNING)
-                                    
-                                    # Create CSV row
-                                    row = {
-                                        "MMS ID": mms_id,
-                                        "Handle URL": handle_url,
-                                        "dc:title": title,
-                                        "HTTP Status Code": status_code,
-                                        "Status Message": status_message,
-                                        "Final Redirect URL": returned_title,
-                                        "Returned Correct MMS ID": title_matches,
-                                        "Titles Match!": primo_title_match
-                                    }
-                                    
-                                    writer.writerow(row)
-                                    success_count += 1
-                                    
-                                    # Track status code categories
-                                    if status_code == 200:
-                                        status_200_count += 1
-                                    elif status_code == 404:
-                                        status_404_count += 1
-                                    else:
-                                        status_other_count += 1
-                                else:
-                                    # No Handle found - skip this record
-                                    no_handle_count += 1
-                                    self.log(f"No Handle found for MMS ID {mms_id}", logging.DEBUG)
-                            else:
-                                self.log(f"Record not returned in batch: {mms_id}", logging.WARNING)
-                                failed_count += 1
-                            
-                            # Update progress
-                            if progress_callback:
-                                progress_callback(record_index, total)
-                            
-                            if record_index % 50 == 0:
-                                self.log(f"Validated {record_index}/{total} records")
-                                
+                            titles_by_id[mms_id], handles_by_id[mms_id] = self._dc_title_and_handle(record)
                         except Exception as e:
                             self.log(f"Error validating {mms_id}: {str(e)}", logging.ERROR)
+                    
+                    handle_jobs = []
+                    for mms_id in batch_ids:
+                        if mms_id not in batch_records:
+                            self.log(f"Record not returned in batch: {mms_id}", logging.WARNING)
                             failed_count += 1
+                            continue
+                        if mms_id not in titles_by_id:
+                            failed_count += 1
+                            continue
+                        
+                        handle_url = handles_by_id[mms_id]
+                        if handle_url:
+                            handle_jobs.append((mms_id, handle_url, titles_by_id[mms_id]))
+                        else:
+                            # No Handle found - skip this record
+                            no_handle_count += 1
+                            self.log("No Handle found for MMS ID %s", logging.DEBUG, mms_id)
+                    
+                    # Test the Handles concurrently, reporting progress as each check finishes
+                    futures = [executor.submit(self._check_handle, *job) for job in handle_jobs]
+                    records_done = batch_end - len(handle_jobs)
+                    for _ in as_completed(futures):
+                        records_done += 1
+                        if progress_callback:
+                            progress_callback(records_done, total)
+                    
+                    # Collect rows in input order
+                    rows = [row for row in (future.result() for future in futures) if row is not None]
+                    
+                    # Optional Primo title check, only for Handles that reached the right record
+                    if verify_primo_title:
+                        primo_ids = [row[_HANDLE_COL_MMS_ID] for row in rows if row[_HANDLE_COL_MMS_ID_MATCH] == "TRUE"]
+                        primo_titles = dict(zip(primo_ids, executor.map(self._fetch_primo_title, primo_ids)))
+                        for idx, row in enumerate(rows):
+                            primo_title = primo_titles.get(row[_HANDLE_COL_MMS_ID])
+                            if primo_title is None:
+                                continue
+                            # Compare titles (case-insensitive, strip whitespace)
+                            # casefold() also handles non-ASCII case differences
+                            alma_title = row[_HANDLE_COL_TITLE]
+                            if primo_title.strip().casefold() == alma_title.strip().casefold():
+                                rows[idx] = row[:_HANDLE_COL_TITLES_MATCH] + ("TRUE",)
+                                self.log(f"Primo title matches: '{primo_title}'")
+                            else:
+                                rows[idx] = row[:_HANDLE_COL_TITLES_MATCH] + ("FALSE",)
+                                self.log(f"Primo title mismatch: '{primo_title}' vs '{alma_title}'", logging.WARNING)
+                    
+                    # Write the whole batch in one call
+                    row_buffer.seek(0)
+                    row_buffer.truncate()
+                    writer.writerows(rows)
+                    csvfile.write(row_buffer.getvalue().encode('utf-8'))
+                    success_count += len(rows)
+                    
+                    # Track status code categories
+                    status_counts.update(row[_HANDLE_COL_STATUS_CODE] for row in rows)
+                    
+                    # Update progress
+                    if progress_callback:
+                        progress_callback(batch_end, total)
+                    
+                    self.log(f"Validated {batch_end}/{total} records")
                 
-                message = f"Handle validation complete: {success_count} handles tested, {no_handle_count} records without handles, {failed_count} failed. Status codes: {status_200_count} OK (200), {status_404_count} Not Found (404), {status_other_count} Other. File: {output_file}"
+                status_other_count = sum(v for k, v in status_counts.items() if k not in (200, 404))
+                message = f"Handle validation complete: {success_count} handles tested, {no_handle_count} records without handles, {failed_count} failed. Status codes: {status_counts[200]} OK (200), {status_counts[404]} Not Found (404), {status_other_count} Other. File: {output_file}"
                 self.log(message)
                 self.log(f"API efficiency: {total_batches} batch calls vs {total} individual calls (saved {total - total_batches} calls)")
                 return True, message
@@ -1649,9 +2043,11 @@ class AlmaBibEditor:
             self.log(f"Using batch API calls: {total_batches} calls for {total} records")
             
             # Process in batches
+            # Upcoming batches are fetched in the background while this one is processed
+            batch_results = self.iter_bib_records_batches(mms_ids, batch_size)
             for batch_start in range(0, total, batch_size):
                 # Check kill switch
-                if self.kill_switch:
+                if self.kill_event.is_set():
                     self.log("Process stopped by user")
                     break
                 
@@ -1662,12 +2058,12 @@ class AlmaBibEditor:
                 self.log(f"Processing batch {batch_num}/{total_batches}: records {batch_start+1}-{batch_end}")
                 
                 # Fetch batch of records
-                batch_records = self.fetch_bib_records_batch(batch_ids)
+                batch_records = next(batch_results)
                 
                 # Process each record in the batch
                 for i in range(len(batch_ids)):
                     # Check kill switch
-                    if self.kill_switch:
+                    if self.kill_event.is_set():
                         self.log("Process stopped by user")
                         break
                     
@@ -1823,8 +2219,10 @@ class AlmaBibEditor:
             self.log(f"Created output file: {output_file}")
             
             # Process in batches for metadata, but individual calls for representations
+            # Upcoming batches are fetched in the background while this one is processed
+            batch_results = self.iter_bib_records_batches(mms_ids, batch_size)
             for batch_start in range(0, total, batch_size):
-                if self.kill_switch:
+                if self.kill_event.is_set():
                     self.log("Process stopped by user")
                     break
                 
@@ -1835,11 +2233,11 @@ class AlmaBibEditor:
                 self.log(f"Processing batch {batch_num}/{total_batches}: records {batch_start+1}-{batch_end}")
                 
                 # Fetch batch of records for metadata
-                batch_records = self.fetch_bib_records_batch(batch_ids)
+                batch_records = next(batch_results)
                 
                 # Process each record in the batch
                 for i in range(len(batch_ids)):
-                    if self.kill_switch:
+                    if self.kill_event.is_set():
                         self.log("Process stopped by user")
                         break
                     
@@ -1863,47 +2261,24 @@ class AlmaBibEditor:
                             title = f'"{title}"'
                         
                         # Get representations for this record (requires individual API call)
-                        api_url = self._get_alma_api_url()
+                        api_url = self._api_base
                         rep_url = f"{api_url}/almaws/v1/bibs/{mms_id}/representations"
                         headers = {
-                            'Authorization': f'apikey {self.api_key}',
-                            'Accept': 'application/json'
+                            'Authorization': f'apikey {self.api_key}'
                         }
                         
                         # Add expand parameter to get file details
                         params = {'expand': 'p_files'}
                         
-                        # Make API call with timeout and retry logic
-                        max_retries = 3
-                        retry_delay = 2
-                        response = None
-                        
-                        for attempt in range(max_retries):
-                            try:
-                                response = requests.get(rep_url, headers=headers, params=params, timeout=30)
-                                break  # Success, exit retry loop
-                            except requests.exceptions.Timeout:
-                                if attempt < max_retries - 1:
-                                    self.log(f"Timeout for {mms_id}, retrying ({attempt+1}/{max_retries})...", logging.WARNING)
-                                    import time
-                                    time.sleep(retry_delay)
-                                else:
-                                    self.log(f"Timeout for {mms_id} after {max_retries} attempts", logging.ERROR)
-                                    failed_count += 1
-                                    response = None
-                                    break
-                            except requests.exceptions.RequestException as req_err:
-                                if attempt < max_retries - 1:
-                                    self.log(f"Network error for {mms_id}: {req_err}, retrying ({attempt+1}/{max_retries})...", logging.WARNING)
-                                    import time
-                                    time.sleep(retry_delay)
-                                else:
-                                    self.log(f"Network error for {mms_id} after {max_retries} attempts: {req_err}", logging.ERROR)
-                                    failed_count += 1
-                                    response = None
-                                    break
-                        
-                        if response is None:
+                        # Make API call with timeout (timeouts, resets, 429 and 5xx are retried by the session adapter)
+                        try:
+                            response = self._http.get(rep_url, headers=headers, params=params, timeout=30)
+                        except requests.exceptions.RequestException as req_err:
+                            if _is_read_timeout(req_err):
+                                self.log(f"Timeout for {mms_id} after retries", logging.ERROR)
+                            else:
+                                self.log(f"Network error for {mms_id} after retries: {req_err}", logging.ERROR)
+                            failed_count += 1
                             continue
                         
                         if response.status_code == 200:
@@ -1930,42 +2305,18 @@ class AlmaBibEditor:
                             if isinstance(files_data, dict):
                                 files_link = files_data.get('link')
                                 if files_link:
-                                    # Make another API call to get the files with timeout and retry
+                                    # Make another API call to get the files (retried by the session adapter)
                                     files_response = None
-                                    for attempt in range(max_retries):
-                                        try:
-                                            files_response = requests.get(files_link, headers=headers, timeout=30)
-                                            break
-                                        except requests.exceptions.Timeout:
-                                            if attempt < max_retries - 1:
-                                                self.log(f"Timeout fetching files for {mms_id}, retrying ({attempt+1}/{max_retries})...", logging.WARNING)
-                                                import time
-                                                time.sleep(retry_delay)
-                                            else:
-                                                self.log(f"Timeout fetching files for {mms_id} after {max_retries} attempts", logging.ERROR)
-                                                failed_count += 1
-                                                files_response = None
-                                                break
-                                        except requests.exceptions.RequestException as req_err:
-                                            if attempt < max_retries - 1:
-                                                self.log(f"Network error fetching files for {mms_id}: {req_err}, retrying ({attempt+1}/{max_retries})...", logging.WARNING)
-                                                import time
-                                                time.sleep(retry_delay)
-                                            else:
-                                                self.log(f"Network error fetching files for {mms_id} after {max_retries} attempts: {req_err}", logging.ERROR)
-                                                failed_count += 1
-                                                files_response = None
-                                                break
+                                    try:
+                                        files_response = self._http.get(files_link, headers=headers, timeout=30)
+                                    except requests.exceptions.RequestException as req_err:
+                                        if _is_read_timeout(req_err):
+                                            self.log(f"Timeout fetching files for {mms_id} after retries", logging.ERROR)
+                                        else:
+                                            self.log(f"Network error fetching files for {mms_id} after retries: {req_err}", logging.ERROR)
+                                        failed_count += 1
                                     
-                                    if files_response and files_response.status_code == 200:
-                                        files_json = files_response.json()
-                                        files = files_json.get('representation_file', [])
-                                        # Ensure files is a list
-                                        if not isinstance(files, list):
-                                            files = [files] if files else []
-                                    # Make another API call to get the files
-                                    files_response = requests.get(files_link, headers=headers)
-                                    if files_response.status_code == 200:
+                                    if files_response is not None and files_response.status_code == 200:
                                         files_json = files_response.json()
                                         files = files_json.get('representation_file', [])
                                         # Ensure files is a list
@@ -2118,9 +2469,11 @@ class AlmaBibEditor:
                 self.log(f"Using batch API calls: {total_batches} calls for {total} records")
                 
                 # Process in batches
+                # Upcoming batches are fetched in the background while this one is processed
+                batch_results = self.iter_bib_records_batches(mms_ids, batch_size)
                 for batch_start in range(0, total, batch_size):
                     # Check kill switch
-                    if self.kill_switch:
+                    if self.kill_event.is_set():
                         self.log("Process stopped by user")
                         break
                     
@@ -2131,12 +2484,12 @@ class AlmaBibEditor:
                     self.log(f"Processing batch {batch_num}/{total_batches}: records {batch_start+1}-{batch_end}")
                     
                     # Fetch batch of records
-                    batch_records = self.fetch_bib_records_batch(batch_ids)
+                    batch_records = next(batch_results)
                     
                     # Process each record in the batch
                     for i in range(len(batch_ids)):
                         # Check kill switch
-                        if self.kill_switch:
+                        if self.kill_event.is_set():
                             self.log("Process stopped by user")
                             break
                         
@@ -2303,7 +2656,7 @@ class AlmaBibEditor:
             total = len(mms_ids)
             
             for idx, mms_id in enumerate(mms_ids, 1):
-                if self.kill_switch:
+                if self.kill_event.is_set():
                     self.log("Operation cancelled by user", logging.WARNING)
                     break
                 
@@ -2442,9 +2795,7 @@ class AlmaBibEditor:
             
         except Exception as e:
             error_msg = f"Error preparing thumbnails: {str(e)}"
-            self.log(error_msg, logging.ERROR)
-            import traceback
-            self.log(traceback.format_exc(), logging.DEBUG)
+            self.log(error_msg, logging.ERROR, exc_info=True)
             return False, error_msg, None
     
     def add_jpg_representations_from_folder(self, mms_ids: list, jpg_folder: str = "For-Import", progress_callback=None) -> tuple[bool, str]:
@@ -2488,7 +2839,7 @@ class AlmaBibEditor:
             total = len(mms_ids)
             
             for idx, mms_id in enumerate(mms_ids, 1):
-                if self.kill_switch:
+                if self.kill_event.is_set():
                     self.log("Operation cancelled by user", logging.WARNING)
                     break
                 
@@ -2498,15 +2849,14 @@ class AlmaBibEditor:
                 self.log(f"\nProcessing {idx}/{total}: MMS {mms_id}")
                 
                 # Step 1: Get representations from Alma
-                api_url = self._get_alma_api_url()
+                api_url = self._api_base
                 rep_url = f"{api_url}/almaws/v1/bibs/{mms_id}/representations"
                 headers = {
-                    'Authorization': f'apikey {self.api_key}',
-                    'Accept': 'application/json'
+                    'Authorization': f'apikey {self.api_key}'
                 }
                 
                 self.log(f"  Fetching representations from Alma...")
-                response = requests.get(rep_url, headers=headers)
+                response = self._http.get(rep_url, headers=headers, timeout=self.REQUEST_TIMEOUT)
                 
                 if response.status_code != 200:
                     self.log(f"  ✗ Failed to fetch representations: HTTP {response.status_code}", logging.ERROR)
@@ -2532,7 +2882,7 @@ class AlmaBibEditor:
                         files_link = files_data.get('link')
                         if files_link:
                             # Fetch files
-                            files_response = requests.get(files_link, headers=headers)
+                            files_response = self._http.get(files_link, headers=headers, timeout=self.REQUEST_TIMEOUT)
                             if files_response.status_code == 200:
                                 files_json = files_response.json()
                                 files = files_json.get('representation_file', [])
@@ -2589,9 +2939,7 @@ class AlmaBibEditor:
             
         except Exception as e:
             error_msg = f"Error in Function 12: {str(e)}"
-            self.log(error_msg, logging.ERROR)
-            import traceback
-            self.log(traceback.format_exc(), logging.ERROR)
+            self.log(error_msg, logging.ERROR, exc_info=True)
             return False, error_msg
     
     def _upload_jpg_representation(self, mms_id: str, jpg_path: str, filename: str) -> tuple[bool, str]:
@@ -2623,7 +2971,7 @@ class AlmaBibEditor:
             file_size = Path(jpg_path).stat().st_size
             self.log(f"  File size: {file_size} bytes ({file_size / 1024 / 1024:.2f} MB)")
             
-            api_url = self._get_alma_api_url()
+            api_url = self._api_base
             self.log(f"  API URL: {api_url}")
             
             # Step 1: Create a new representation
@@ -2640,13 +2988,12 @@ class AlmaBibEditor:
             
             headers = {
                 'Authorization': f'apikey {self.api_key}',
-                'Content-Type': 'application/json',
-                'Accept': 'application/json'
+                'Content-Type': 'application/json'
             }
             
             self.log(f"Creating representation for {mms_id}")
             self.log(f"  POST to: {rep_url}")
-            response = requests.post(rep_url, headers=headers, json=rep_data)
+            response = self._http.post(rep_url, headers=headers, json=rep_data, timeout=self.WRITE_TIMEOUT)
             
             self.log(f"  Response status: {response.status_code}")
             if response.status_code not in [200, 201]:
@@ -2696,11 +3043,10 @@ class AlmaBibEditor:
             }
             
             headers_upload = {
-                'Authorization': f'apikey {self.api_key}',
-                'Accept': 'application/json'
+                'Authorization': f'apikey {self.api_key}'
             }
             
-            upload_response = requests.post(files_url, headers=headers_upload, files=files_data, data=data)
+            upload_response = self._http.post(files_url, headers=headers_upload, files=files_data, data=data, timeout=self.WRITE_TIMEOUT)
             
             self.log(f"  Upload response status: {upload_response.status_code}")
             if upload_response.status_code not in [200, 201]:
@@ -2711,9 +3057,7 @@ class AlmaBibEditor:
             return True, f"JPG representation added successfully (Rep ID: {rep_id})"
             
         except Exception as e:
-            self.log(f"Exception in _upload_jpg_representation: {str(e)}", logging.ERROR)
-            import traceback
-            self.log(traceback.format_exc(), logging.ERROR)
+            self.log(f"Exception in _upload_jpg_representation: {str(e)}", logging.ERROR, exc_info=True)
             return False, f"Error uploading JPG: {str(e)}"
     
     def _upload_thumbnail_representation(self, mms_id: str, thumbnail_path: str, filename: str, identifier: str = None) -> tuple[bool, str]:
@@ -2826,10 +3170,8 @@ class AlmaBibEditor:
                     self.log(f"  Warning: Pillow library not available - uploading PNG as-is", logging.WARNING)
                     self.log(f"  Install Pillow with: pip install Pillow", logging.INFO)
                 except Exception as e:
-                    self.log(f"  Warning: PNG to JPEG conversion failed: {e}", logging.WARNING)
+                    self.log(f"  Warning: PNG to JPEG conversion failed: {e}", logging.WARNING, exc_info=True)
                     self.log(f"  Uploading original PNG file", logging.INFO)
-                    import traceback
-                    self.log(traceback.format_exc(), logging.DEBUG)
             
             # Step 1b: Ensure file size is under 100KB (Alma thumbnail size limit)
             MAX_SIZE = 100 * 1024  # 100KB in bytes
@@ -2909,12 +3251,10 @@ class AlmaBibEditor:
                     self.log(f"  Warning: Pillow library not available - cannot optimize file size", logging.WARNING)
                     self.log(f"  File will be uploaded as-is ({current_size / 1024:.2f} KB)", logging.INFO)
                 except Exception as e:
-                    self.log(f"  Warning: File size optimization failed: {e}", logging.WARNING)
+                    self.log(f"  Warning: File size optimization failed: {e}", logging.WARNING, exc_info=True)
                     self.log(f"  Uploading file as-is", logging.INFO)
-                    import traceback
-                    self.log(traceback.format_exc(), logging.DEBUG)
             
-            api_url = self._get_alma_api_url()
+            api_url = self._api_base
             self.log(f"  API URL: {api_url}")
             
             # Step 1: Create a new representation with usage_type DERIVATIVE_COPY (for thumbnail)
@@ -2933,13 +3273,12 @@ class AlmaBibEditor:
             
             headers = {
                 'Authorization': f'apikey {self.api_key}',
-                'Content-Type': 'application/json',
-                'Accept': 'application/json'
+                'Content-Type': 'application/json'
             }
             
             self.log(f"Creating thumbnail representation for {mms_id}")
             self.log(f"  POST to: {rep_url}")
-            response = requests.post(rep_url, headers=headers, json=rep_data)
+            response = self._http.post(rep_url, headers=headers, json=rep_data, timeout=self.WRITE_TIMEOUT)
             
             self.log(f"  Response status: {response.status_code}")
             if response.status_code not in [200, 201]:
@@ -2996,11 +3335,10 @@ class AlmaBibEditor:
                 }
                 
                 headers_upload = {
-                    'Authorization': f'apikey {self.api_key}',
-                    'Accept': 'application/json'
+                    'Authorization': f'apikey {self.api_key}'
                 }
                 
-                upload_response = requests.post(files_url, headers=headers_upload, files=files_data, data=data)
+                upload_response = self._http.post(files_url, headers=headers_upload, files=files_data, data=data, timeout=self.WRITE_TIMEOUT)
                 
                 self.log(f"  Upload response status: {upload_response.status_code}")
                 if upload_response.status_code not in [200, 201]:
@@ -3020,9 +3358,7 @@ class AlmaBibEditor:
                         self.log(f"  Warning: Could not delete temporary file {temp_file_path}: {cleanup_error}", logging.WARNING)
             
         except Exception as e:
-            self.log(f"Exception in _upload_thumbnail_representation: {str(e)}", logging.ERROR)
-            import traceback
-            self.log(traceback.format_exc(), logging.ERROR)
+            self.log(f"Exception in _upload_thumbnail_representation: {str(e)}", logging.ERROR, exc_info=True)
             # Clean up temp file if it exists
             if temp_file_path and os.path.exists(temp_file_path):
                 try:
@@ -3165,7 +3501,7 @@ class AlmaBibEditor:
                 tmp_path = Path(tmp_dir)
 
                 for idx, mms_id in enumerate(mms_ids, 1):
-                    if self.kill_switch:
+                    if self.kill_event.is_set():
                         self.log("Operation cancelled by user", logging.WARNING)
                         break
 
@@ -3268,17 +3604,16 @@ class AlmaBibEditor:
                     self.log(f"  ✓ Uploaded to S3: s3://{s3_bucket}/{s3_key}")
 
                     # Step 3: Check for an existing DERIVATIVE_COPY/JPG representation
-                    api_url = self._get_alma_api_url()
+                    api_url = self._api_base
                     rep_url = f"{api_url}/almaws/v1/bibs/{mms_id}/representations"
                     headers = {
-                        'Authorization': f'apikey {self.api_key}',
-                        'Accept': 'application/json'
+                        'Authorization': f'apikey {self.api_key}'
                     }
 
                     existing_rep_id = None
                     existing_file_pid = None
 
-                    rep_list_response = requests.get(rep_url, headers=headers)
+                    rep_list_response = self._http.get(rep_url, headers=headers, timeout=self.REQUEST_TIMEOUT)
                     if rep_list_response.status_code == 200:
                         for rep in rep_list_response.json().get('representation', []):
                             usage_val = rep.get('usage_type', {}).get('value', '')
@@ -3306,7 +3641,7 @@ class AlmaBibEditor:
                     if existing_rep_id and not existing_file_pid:
                         # Inline list didn't include file details — fetch directly to be sure
                         files_url = f"{api_url}/almaws/v1/bibs/{mms_id}/representations/{existing_rep_id}/files"
-                        files_resp = requests.get(files_url, headers=headers)
+                        files_resp = self._http.get(files_url, headers=headers, timeout=self.REQUEST_TIMEOUT)
                         if files_resp.status_code == 200:
                             file_nodes = files_resp.json().get('representation_file', [])
                             if isinstance(file_nodes, dict):
@@ -3336,10 +3671,9 @@ class AlmaBibEditor:
                         }
                         headers_post = {
                             'Authorization': f'apikey {self.api_key}',
-                            'Content-Type': 'application/json',
-                            'Accept': 'application/json'
+                            'Content-Type': 'application/json'
                         }
-                        create_resp = requests.post(rep_url, headers=headers_post, json=rep_payload)
+                        create_resp = self._http.post(rep_url, headers=headers_post, json=rep_payload, timeout=self.WRITE_TIMEOUT)
                         if create_resp.status_code not in [200, 201]:
                             self.log(
                                 f"  ✗ Failed to create representation: HTTP {create_resp.status_code} — {create_resp.text}",
@@ -3404,9 +3738,7 @@ class AlmaBibEditor:
 
         except Exception as e:
             error_msg = f"Error in prepare_tiff_jpg_representations: {str(e)}"
-            self.log(error_msg, logging.ERROR)
-            import traceback
-            self.log(traceback.format_exc(), logging.DEBUG)
+            self.log(error_msg, logging.ERROR, exc_info=True)
             return False, error_msg, None
     
     # ------------------------------------------------------------------
@@ -3532,15 +3864,14 @@ class AlmaBibEditor:
         Returns:
             tuple: (success: bool, message: str)
         """
-        api_url = self._get_alma_api_url()
+        api_url = self._api_base
         del_url = f"{api_url}/almaws/v1/bibs/{mms_id}/representations/{rep_id}/files/{pid}"
         headers = {
-            'Authorization': f'apikey {self.api_key}',
-            'Accept': 'application/json'
+            'Authorization': f'apikey {self.api_key}'
         }
 
         try:
-            response = requests.delete(del_url, headers=headers)
+            response = self._http.delete(del_url, headers=headers, timeout=self.REQUEST_TIMEOUT)
             if response.status_code in [200, 204]:
                 return True, f"Deleted file pid {pid}"
             return False, f"HTTP {response.status_code}: {response.text}"
@@ -3568,17 +3899,16 @@ class AlmaBibEditor:
         Returns:
             tuple: (success: bool, result: str) — result is new file PID on success, error on failure
         """
-        api_url = self._get_alma_api_url()
+        api_url = self._api_base
         files_url = f"{api_url}/almaws/v1/bibs/{mms_id}/representations/{rep_id}/files"
         payload = {"label": label, "path": s3_path}
         headers = {
             'Authorization': f'apikey {self.api_key}',
-            'Content-Type': 'application/json',
-            'Accept': 'application/json'
+            'Content-Type': 'application/json'
         }
 
         try:
-            response = requests.post(files_url, headers=headers, json=payload)
+            response = self._http.post(files_url, headers=headers, json=payload, timeout=self.WRITE_TIMEOUT)
             if response.status_code in [200, 201]:
                 pid = response.json().get('pid', '')
                 return True, pid
@@ -3624,17 +3954,16 @@ class AlmaBibEditor:
             self.log(f"  File size: {file_size} bytes ({file_size / 1024 / 1024:.2f} MB)")
             
             # Step 1: Check for existing JPG representation
-            api_url = self._get_alma_api_url()
+            api_url = self._api_base
             rep_url = f"{api_url}/almaws/v1/bibs/{mms_id}/representations"
             
             headers = {
-                'Authorization': f'apikey {self.api_key}',
-                'Accept': 'application/json'
+                'Authorization': f'apikey {self.api_key}'
             }
             
             # Fetch existing representations
             self.log(f"Checking for existing JPG representation for {mms_id}")
-            response = requests.get(rep_url, headers=headers)
+            response = self._http.get(rep_url, headers=headers, timeout=self.REQUEST_TIMEOUT)
             
             existing_rep_id = None
             jpg_position = None
@@ -3693,12 +4022,11 @@ class AlmaBibEditor:
                 
                 headers_create = {
                     'Authorization': f'apikey {self.api_key}',
-                    'Content-Type': 'application/json',
-                    'Accept': 'application/json'
+                    'Content-Type': 'application/json'
                 }
                 
                 self.log(f"Creating new JPG representation for {mms_id}")
-                response = requests.post(rep_url, headers=headers_create, json=rep_data)
+                response = self._http.post(rep_url, headers=headers_create, json=rep_data, timeout=self.WRITE_TIMEOUT)
                 
                 if response.status_code not in [200, 201]:
                     self.log(f"  Response body: {response.text}", logging.ERROR)
@@ -3751,9 +4079,7 @@ class AlmaBibEditor:
             }
             
         except Exception as e:
-            self.log(f"Exception in _prepare_jpg_from_tiff_representation: {str(e)}", logging.ERROR)
-            import traceback
-            self.log(traceback.format_exc(), logging.ERROR)
+            self.log(f"Exception in _prepare_jpg_from_tiff_representation: {str(e)}", logging.ERROR, exc_info=True)
             return False, f"Error preparing JPG from TIFF: {str(e)}"
     
     def _prepare_jpg_from_tiff_representation_xml(self, mms_id: str, tiff_path: str, jpg_filename: str, output_dir) -> tuple[bool, Union[dict, str]]:
@@ -3781,16 +4107,15 @@ class AlmaBibEditor:
                 return False, f"File not found: {tiff_path}"
             
             # Step 1: Check for existing JPG representation
-            api_url = self._get_alma_api_url()
+            api_url = self._api_base
             rep_url = f"{api_url}/almaws/v1/bibs/{mms_id}/representations"
             
             headers = {
-                'Authorization': f'apikey {self.api_key}',
-                'Accept': 'application/json'
+                'Authorization': f'apikey {self.api_key}'
             }
             
             # Fetch existing representations
-            response = requests.get(rep_url, headers=headers)
+            response = self._http.get(rep_url, headers=headers, timeout=self.REQUEST_TIMEOUT)
             
             existing_rep_id = None
             
@@ -3829,11 +4154,10 @@ class AlmaBibEditor:
                 
                 headers_create = {
                     'Authorization': f'apikey {self.api_key}',
-                    'Content-Type': 'application/json',
-                    'Accept': 'application/json'
+                    'Content-Type': 'application/json'
                 }
                 
-                response = requests.post(rep_url, headers=headers_create, json=rep_data)
+                response = self._http.post(rep_url, headers=headers_create, json=rep_data, timeout=self.WRITE_TIMEOUT)
                 
                 if response.status_code not in [200, 201]:
                     return False, f"Failed to create representation: HTTP {response.status_code}"
@@ -4190,16 +4514,15 @@ For questions, consult the references above or contact your Alma administrator.
                 return False, f"File not found: {tiff_path}"
             
             # Step 1: Check for existing JPG representation
-            api_url = self._get_alma_api_url()
+            api_url = self._api_base
             rep_url = f"{api_url}/almaws/v1/bibs/{mms_id}/representations"
             
             headers = {
-                'Authorization': f'apikey {self.api_key}',
-                'Accept': 'application/json'
+                'Authorization': f'apikey {self.api_key}'
             }
             
             # Fetch existing representations
-            response = requests.get(rep_url, headers=headers)
+            response = self._http.get(rep_url, headers=headers, timeout=self.REQUEST_TIMEOUT)
             
             existing_rep_id = None
             
@@ -4232,7 +4555,7 @@ For questions, consult the references above or contact your Alma administrator.
                     "usage_type": {"value": "DERIVATIVE_COPY"}
                 }
                 
-                create_response = requests.post(create_url, headers=headers_post, json=rep_payload)
+                create_response = self._http.post(create_url, headers=headers_post, json=rep_payload, timeout=self.WRITE_TIMEOUT)
                 
                 if create_response.status_code != 200:
                     return False, f"Failed to create representation: {create_response.text}"
@@ -4425,17 +4748,16 @@ For questions, consult the references above or contact your Alma administrator.
                     self.log(f"  Warning: File size optimization failed: {e}", logging.WARNING)
             
             # Step 3: Check for existing thumbnail representation
-            api_url = self._get_alma_api_url()
+            api_url = self._api_base
             rep_url = f"{api_url}/almaws/v1/bibs/{mms_id}/representations"
             
             headers = {
-                'Authorization': f'apikey {self.api_key}',
-                'Accept': 'application/json'
+                'Authorization': f'apikey {self.api_key}'
             }
             
             # Fetch existing representations
             self.log(f"Checking for existing thumbnail representation for {mms_id}")
-            response = requests.get(rep_url, headers=headers)
+            response = self._http.get(rep_url, headers=headers, timeout=self.REQUEST_TIMEOUT)
             
             existing_rep_id = None
             thumbnail_position = None
@@ -4498,12 +4820,11 @@ For questions, consult the references above or contact your Alma administrator.
                 
                 headers_create = {
                     'Authorization': f'apikey {self.api_key}',
-                    'Content-Type': 'application/json',
-                    'Accept': 'application/json'
+                    'Content-Type': 'application/json'
                 }
                 
                 self.log(f"Creating new thumbnail representation for {mms_id}")
-                response = requests.post(rep_url, headers=headers_create, json=rep_data)
+                response = self._http.post(rep_url, headers=headers_create, json=rep_data, timeout=self.WRITE_TIMEOUT)
                 
                 if response.status_code not in [200, 201]:
                     self.log(f"  Response body: {response.text}", logging.ERROR)
@@ -4542,9 +4863,7 @@ For questions, consult the references above or contact your Alma administrator.
             }
             
         except Exception as e:
-            self.log(f"Exception in _prepare_thumbnail_representation: {str(e)}", logging.ERROR)
-            import traceback
-            self.log(traceback.format_exc(), logging.ERROR)
+            self.log(f"Exception in _prepare_thumbnail_representation: {str(e)}", logging.ERROR, exc_info=True)
             if temp_file_path and os.path.exists(temp_file_path):
                 try:
                     os.remove(temp_file_path)
@@ -6035,7 +6354,7 @@ For questions, consult the references above or contact your Alma administrator.
             
             try:
                 for idx, record in enumerate(records):
-                    if self.kill_switch:
+                    if self.kill_event.is_set():
                         self.log("Kill switch activated - stopping processing", logging.WARNING)
                         break
                     
@@ -6198,9 +6517,7 @@ For questions, consult the references above or contact your Alma administrator.
                         self.log(f"    Remaining: {len(records) - current}", logging.INFO)
                         break
                     except Exception as e:
-                        self.log(f"  ✗ Error uploading thumbnail: {str(e)}", logging.ERROR)
-                        import traceback
-                        self.log(traceback.format_exc(), logging.DEBUG)
+                        self.log(f"  ✗ Error uploading thumbnail: {str(e)}", logging.ERROR, exc_info=True)
                         failed_count += 1
                         self.log(f"\n⚠️  STOPPING ON FIRST FAILURE for debugging", logging.WARNING)
                         self.log(f"    Successes so far: {success_count}", logging.INFO)
@@ -6246,9 +6563,7 @@ For questions, consult the references above or contact your Alma administrator.
             
         except Exception as e:
             error_msg = f"Error in selenium upload: {str(e)}"
-            self.log(error_msg, logging.ERROR)
-            import traceback
-            self.log(traceback.format_exc(), logging.ERROR)
+            self.log(error_msg, logging.ERROR, exc_info=True)
             return False, error_msg, 0, 0, None
         finally:
             # Restore original min log level
@@ -6341,23 +6656,32 @@ For questions, consult the references above or contact your Alma administrator.
             self.log(f"Found {len(tiff_paths)} records with local paths")
             
             # Read or create alma_export CSV
+            # Rows are kept positional: Alma import profiles repeat some headings (several
+            # dcterms:subject.dcterms:LCSH or dcterms:isPartOf columns), and a DictReader/
+            # DictWriter round trip would collapse those into one value copied to every slot
             alma_rows = []
-            alma_fieldnames = []
+            alma_header = []
             
             if Path(alma_export_csv).exists():
                 self.log(f"Reading existing {alma_export_csv}")
-                with open(alma_export_csv, 'r', encoding='utf-8') as f:
-                    reader = csv.DictReader(f)
-                    alma_fieldnames = list(reader.fieldnames)
-                    alma_rows = list(reader)
+                with open(alma_export_csv, 'r', encoding='utf-8', newline='') as f:
+                    reader = csv.reader(f)
+                    alma_header = next(reader, None) or []
+                    alma_rows = [row for row in reader if row]
             else:
                 # Create new CSV structure
                 self.log(f"Creating new {alma_export_csv}")
-                # Use column headings from export function
-                alma_fieldnames = ['mms_id', 'file_name_1', 'file_name_2']
+                alma_header = ['mms_id', 'file_name_1', 'file_name_2']
+            
+            # Column positions (first occurrence), adding any of the three that are missing
+            for column in ('mms_id', 'file_name_1', 'file_name_2'):
+                if column not in alma_header:
+                    alma_header.append(column)
+            mms_col, file1_col, file2_col = (alma_header.index(column) for column in ('mms_id', 'file_name_1', 'file_name_2'))
+            width = len(alma_header)
             
             # Create MMS ID to row index mapping
-            mms_to_index = {row.get('mms_id', ''): idx for idx, row in enumerate(alma_rows)}
+            mms_to_index = {(row[mms_col] if mms_col < len(row) else ''): idx for idx, row in enumerate(alma_rows)}
             
             # Process each MMS ID
             processed_count = 0
@@ -6367,7 +6691,7 @@ For questions, consult the references above or contact your Alma administrator.
             total = len(mms_ids)
             
             for idx, mms_id in enumerate(mms_ids, 1):
-                if self.kill_switch:
+                if self.kill_event.is_set():
                     self.log("Operation cancelled by user", logging.WARNING)
                     break
                 
@@ -6439,17 +6763,19 @@ For questions, consult the references above or contact your Alma administrator.
                 
                 # Update or create alma_export row
                 if mms_id in mms_to_index:
-                    # Update existing row
-                    row_idx = mms_to_index[mms_id]
-                    alma_rows[row_idx]['file_name_1'] = jpg_filename
-                    alma_rows[row_idx]['file_name_2'] = tiff_filename
+                    # Update existing row (padding short rows out to the header width)
+                    row = alma_rows[mms_to_index[mms_id]]
+                    if len(row) < width:
+                        row.extend([''] * (width - len(row)))
+                    row[file1_col] = jpg_filename
+                    row[file2_col] = tiff_filename
                     self.log(f"  Updated existing CSV row")
                 else:
                     # Create new row
-                    new_row = {field: '' for field in alma_fieldnames}
-                    new_row['mms_id'] = mms_id
-                    new_row['file_name_1'] = jpg_filename
-                    new_row['file_name_2'] = tiff_filename
+                    new_row = [''] * width
+                    new_row[mms_col] = mms_id
+                    new_row[file1_col] = jpg_filename
+                    new_row[file2_col] = tiff_filename
                     alma_rows.append(new_row)
                     mms_to_index[mms_id] = len(alma_rows) - 1
                     self.log(f"  Created new CSV row")
@@ -6461,8 +6787,8 @@ For questions, consult the references above or contact your Alma administrator.
             if updated_count > 0:
                 self.log(f"Writing updated {alma_export_csv}...")
                 with open(alma_export_csv, 'w', encoding='utf-8', newline='') as f:
-                    writer = csv.DictWriter(f, fieldnames=alma_fieldnames)
-                    writer.writeheader()
+                    writer = csv.writer(f)
+                    writer.writerow(alma_header)
                     writer.writerows(alma_rows)
                 self.log(f"✓ Updated {updated_count} records in {alma_export_csv}")
             
@@ -6474,9 +6800,7 @@ For questions, consult the references above or contact your Alma administrator.
             
         except Exception as e:
             error_msg = f"Error in Function 12: {str(e)}"
-            self.log(error_msg, logging.ERROR)
-            import traceback
-            self.log(traceback.format_exc(), logging.ERROR)
+            self.log(error_msg, logging.ERROR, exc_info=True)
             return False, error_msg
     
     def analyze_identifier_match(self, mms_ids: list, progress_callback=None) -> tuple[bool, str, Optional[str]]:
@@ -6529,9 +6853,11 @@ For questions, consult the references above or contact your Alma administrator.
             self.log(f"Using batch API calls: {total_batches} calls for {total} records")
             
             # Process in batches
+            # Upcoming batches are fetched in the background while this one is processed
+            batch_results = self.iter_bib_records_batches(mms_ids, batch_size)
             for batch_start in range(0, total, batch_size):
                 # Check kill switch
-                if self.kill_switch:
+                if self.kill_event.is_set():
                     self.log("Process stopped by user")
                     break
                 
@@ -6542,7 +6868,7 @@ For questions, consult the references above or contact your Alma administrator.
                 self.log(f"Processing batch {batch_num}/{total_batches}: records {batch_start+1}-{batch_end}")
                 
                 # Fetch batch of records
-                batch_records = self.fetch_bib_records_batch(batch_ids)
+                batch_records = next(batch_results)
                 
                 # Process each record in the batch
                 for i in range(len(batch_ids)):
@@ -6703,9 +7029,11 @@ For questions, consult the references above or contact your Alma administrator.
             self.log(f"Using batch API calls: {total_batches} calls for {total} records")
             
             # Process in batches
+            # Upcoming batches are fetched in the background while this one is processed
+            batch_results = self.iter_bib_records_batches(mms_ids, batch_size)
             for batch_start in range(0, total, batch_size):
                 # Check kill switch
-                if self.kill_switch:
+                if self.kill_event.is_set():
                     self.log("Process stopped by user")
                     break
                 
@@ -6716,7 +7044,7 @@ For questions, consult the references above or contact your Alma administrator.
                 self.log(f"Processing batch {batch_num}/{total_batches}: records {batch_start+1}-{batch_end}")
                 
                 # Fetch batch of records
-                batch_records = self.fetch_bib_records_batch(batch_ids)
+                batch_records = next(batch_results)
                 
                 # Process each record in the batch
                 for i in range(len(batch_ids)):
@@ -6874,21 +7202,23 @@ For questions, consult the references above or contact your Alma administrator.
         """
         try:
             # Get the Alma API base URL
-            api_url = self._get_alma_api_url()
+            api_url = self._api_base
             
             # Fetch the record as XML
             self.log(f"Fetching record {mms_id} for duplicate replacement", logging.DEBUG)
             headers = {'Accept': 'application/xml'}
-            response = requests.get(
-                f"{api_url}/almaws/v1/bibs/{mms_id}?view=full&expand=None&apikey={self.api_key}",
-                headers=headers
+            response = self._http.get(
+                f"{api_url}/almaws/v1/bibs/{mms_id}?view=full&expand=None",
+                params={'apikey': self.api_key},
+                headers=headers,
+                timeout=self.REQUEST_TIMEOUT
             )
             
             if response.status_code != 200:
                 return False, f"Failed to fetch record: {response.status_code}"
             
             # Parse XML
-            root = ET.fromstring(response.text)
+            root = ET.fromstring(response.content)
             
             # Register namespaces
             namespaces_to_register = {
@@ -6900,8 +7230,7 @@ For questions, consult the references above or contact your Alma administrator.
                 ET.register_namespace(prefix, uri)
             
             # Find all dc:identifier elements
-            search_namespaces = {'dc': 'http://purl.org/dc/elements/1.1/'}
-            identifiers = root.findall('.//dc:identifier', search_namespaces)
+            identifiers = list(root.iter(_DC_IDENTIFIER_TAG))
             
             # Replace the first occurrence of old_value
             replaced = False
@@ -6919,11 +7248,14 @@ For questions, consult the references above or contact your Alma administrator.
             
             # Update the record
             headers = {'Content-Type': 'application/xml'}
-            response = requests.put(
-                f"{api_url}/almaws/v1/bibs/{mms_id}?apikey={self.api_key}",
+            response = self._http.put(
+                f"{api_url}/almaws/v1/bibs/{mms_id}",
+                params={'apikey': self.api_key},
                 headers=headers,
-                data=xml_bytes
+                data=xml_bytes,
+                timeout=self.REQUEST_TIMEOUT
             )
+            self.invalidate_bib(mms_id)  # Drop any cached copy of the pre-update record
             
             if response.status_code == 200:
                 return True, f"Replaced duplicate identifier with {new_value}"
@@ -6946,21 +7278,23 @@ For questions, consult the references above or contact your Alma administrator.
         """
         try:
             # Get the Alma API base URL
-            api_url = self._get_alma_api_url()
+            api_url = self._api_base
             
             # Fetch the record as XML
             self.log(f"Fetching record {mms_id} to add identifier", logging.DEBUG)
             headers = {'Accept': 'application/xml'}
-            response = requests.get(
-                f"{api_url}/almaws/v1/bibs/{mms_id}?view=full&expand=None&apikey={self.api_key}",
-                headers=headers
+            response = self._http.get(
+                f"{api_url}/almaws/v1/bibs/{mms_id}?view=full&expand=None",
+                params={'apikey': self.api_key},
+                headers=headers,
+                timeout=self.REQUEST_TIMEOUT
             )
             
             if response.status_code != 200:
                 return False, f"Failed to fetch record: {response.status_code}"
             
             # Parse XML
-            root = ET.fromstring(response.text)
+            root = ET.fromstring(response.content)
             
             # Register namespaces
             namespaces_to_register = {
@@ -6972,8 +7306,7 @@ For questions, consult the references above or contact your Alma administrator.
                 ET.register_namespace(prefix, uri)
             
             # Find the parent element that contains dc:identifier elements
-            search_namespaces = {'dc': 'http://purl.org/dc/elements/1.1/'}
-            existing_identifiers = root.findall('.//dc:identifier', search_namespaces)
+            existing_identifiers = list(root.iter(_DC_IDENTIFIER_TAG))
             
             if existing_identifiers:
                 # Find the parent of the first identifier
@@ -6999,11 +7332,14 @@ For questions, consult the references above or contact your Alma administrator.
             
             # Update the record
             headers = {'Content-Type': 'application/xml'}
-            response = requests.put(
-                f"{api_url}/almaws/v1/bibs/{mms_id}?apikey={self.api_key}",
+            response = self._http.put(
+                f"{api_url}/almaws/v1/bibs/{mms_id}",
+                params={'apikey': self.api_key},
                 headers=headers,
-                data=xml_bytes
+                data=xml_bytes,
+                timeout=self.REQUEST_TIMEOUT
             )
+            self.invalidate_bib(mms_id)  # Drop any cached copy of the pre-update record
             
             if response.status_code == 200:
                 return True, f"Added identifier {identifier_value}"
@@ -7076,7 +7412,7 @@ For questions, consult the references above or contact your Alma administrator.
             self._perform_alma_login_for_mde_restore(driver)
 
             for idx, mms_id in enumerate(mms_ids, start=1):
-                if self.kill_switch:
+                if self.kill_event.is_set():
                     self.log("Kill switch activated — stopping", logging.WARNING)
                     break
 
@@ -7086,6 +7422,8 @@ For questions, consult the references above or contact your Alma administrator.
                     ok, msg = self._restore_record_via_mde(driver, mms_id)
                 except Exception as e:
                     ok, msg = False, f"Exception: {e}"
+                # The MDE rewrites the record outside the API, so drop any cached pre-restore copy
+                self.invalidate_bib(mms_id)
 
                 rows.append({
                     "MMS ID": mms_id,
@@ -8323,7 +8661,7 @@ For questions, consult the references above or contact your Alma administrator.
             readme_file = output_dir / "README.txt"
             
             for idx, mms_id in enumerate(mms_ids, 1):
-                if self.kill_switch:
+                if self.kill_event.is_set():
                     self.log("Operation cancelled by user", logging.WARNING)
                     break
                 
@@ -8336,15 +8674,14 @@ For questions, consult the references above or contact your Alma administrator.
                 self.log("="*70)
                 
                 # Step 1: Fetch representations from Alma
-                api_url = self._get_alma_api_url()
+                api_url = self._api_base
                 rep_url = f"{api_url}/almaws/v1/bibs/{mms_id}/representations"
                 headers = {
-                    'Authorization': f'apikey {self.api_key}',
-                    'Accept': 'application/json'
+                    'Authorization': f'apikey {self.api_key}'
                 }
                 
                 self.log(f"  🌐 Fetching representations from Alma API...")
-                response = requests.get(rep_url, headers=headers)
+                response = self._http.get(rep_url, headers=headers, timeout=self.REQUEST_TIMEOUT)
                 
                 if response.status_code != 200:
                     self.log(f"  ❌ Failed to fetch representations: HTTP {response.status_code}")
@@ -8383,7 +8720,7 @@ For questions, consult the references above or contact your Alma administrator.
                         continue
                     
                     self.log(f"     Fetching file list from Alma...")
-                    files_response = requests.get(files_link, headers=headers)
+                    files_response = self._http.get(files_link, headers=headers, timeout=self.REQUEST_TIMEOUT)
                     if files_response.status_code != 200:
                         self.log(f"     ❌ Failed to fetch files: HTTP {files_response.status_code}")
                         continue
@@ -8525,9 +8862,7 @@ For questions, consult the references above or contact your Alma administrator.
             
         except Exception as e:
             error_msg = f"❌ ERROR in Function 19: {str(e)}"
-            self.log(error_msg)
-            import traceback
-            self.log(traceback.format_exc(), logging.DEBUG)
+            self.log(error_msg, logging.ERROR, exc_info=True)
             return False, error_msg, None
     
     def _create_thumbnail_from_file(self, source_path: str, mms_id: str, rep_num: int, 
@@ -8844,11 +9179,11 @@ End of README
             
             try:
                 # Fetch the record as JSON to access DC metadata in anies field
-                api_url = self._get_alma_api_url()
-                headers = {'Accept': 'application/json'}
-                response = requests.get(
-                    f"{api_url}/almaws/v1/bibs/{mms_id}?view=full&expand=None&apikey={self.api_key}",
-                    headers=headers
+                api_url = self._api_base
+                response = self._http.get(
+                    f"{api_url}/almaws/v1/bibs/{mms_id}?view=full&expand=None",
+                    params={'apikey': self.api_key},
+                    timeout=self.REQUEST_TIMEOUT
                 )
                 
                 if response.status_code != 200:
@@ -8881,12 +9216,9 @@ End of README
                 dc_xml = anies[0] if isinstance(anies, list) else anies
                 dc_root = ET.fromstring(dc_xml)
                 
-                # Define DC namespace
-                dc_ns = {'dc': 'http://purl.org/dc/elements/1.1/'}
-                
                 # Extract all dc:identifier values
                 identifiers = []
-                for elem in dc_root.findall(".//dc:identifier", dc_ns):
+                for elem in dc_root.iter(_DC_IDENTIFIER_TAG):
                     if elem.text and elem.text.strip():
                         identifiers.append(elem.text.strip())
                 
@@ -8921,7 +9253,7 @@ End of README
                 
                 # Check for dcterms:URI attribute (known issue from documentation)
                 # This attribute causes Handle assignment to fail
-                for elem in dc_root.findall(".//dc:identifier", dc_ns):
+                for elem in dc_root.iter(_DC_IDENTIFIER_TAG):
                     if elem.get('{http://purl.org/dc/terms/}URI'):
                         issues.append("dc:identifier has dcterms:URI attribute (must be removed)")
                         self.log(f"   ⚠️ Found dcterms:URI attribute on dc:identifier", logging.WARNING)
@@ -9217,6 +9549,110 @@ This was a known issue in 2025-2026. Possible causes:
         return instructions
 
 
+def _collect_fields(elements) -> defaultdict:
+    """
+    Collect the non-empty text of a record's elements in a single pass.
+    
+    Args:
+        elements: Iterable of elements, e.g. root.iter() or _iter_streamed_elements()
+        
+    Returns:
+        defaultdict: '{namespace}tag' (or bare tag) -> list of stripped values in document
+        order; LCSH-typed dcterms:subject values are also listed under _LCSH_KEY
+    """
+    fields = defaultdict(list)
+    subject_tag = _DCTERMS_TAG + "subject"
+    for elem in elements:
+        text = elem.text.strip() if elem.text else ""
+        if not text:
+            continue
+        fields[elem.tag].append(text)
+        if elem.tag == subject_tag and elem.get(_XSI_TYPE) == "dcterms:LCSH":
+            fields[_LCSH_KEY].append(text)
+    return fields
+
+
+def _custom_field_tags(ns_uri: str) -> tuple:
+    """Clark-notation tags of _CUSTOM_FIELDS in `ns_uri`, built once per namespace"""
+    tags = _CUSTOM_FIELD_TAGS.get(ns_uri)
+    if tags is None:
+        tags = _CUSTOM_FIELD_TAGS[ns_uri] = tuple(f"{{{ns_uri}}}{name}" for name in _CUSTOM_FIELDS)
+    return tags
+
+
+def _iter_streamed_elements(xml_bytes: bytes):
+    """
+    Yield each element of an XML document as its end tag is parsed.
+    
+    Each element is cleared once the caller moves on, so memory stays bounded
+    for very large documents. Raises ET.ParseError on malformed XML.
+    """
+    for _, elem in ET.iterparse(io.BytesIO(xml_bytes), events=('end',)):
+        yield elem
+        elem.clear()
+
+
+def pretty_print_xml(xml_bytes: bytes) -> str:
+    """
+    Indent an XML document for display, keeping the document's own namespace prefixes.
+    
+    ElementTree would otherwise rename undeclared namespaces (ns0:, ns1:, ...) on
+    output, so prefixed names and xmlns declarations are restored before serializing.
+    
+    Args:
+        xml_bytes: The raw XML document
+        
+    Returns:
+        str: The indented XML (without an XML declaration)
+    """
+    prefixes = {}
+    pending_ns = []
+    root = None
+    for event, item in ET.iterparse(io.BytesIO(xml_bytes), events=('start-ns', 'start')):
+        if event == 'start-ns':
+            pending_ns.append(item)
+            continue
+        if root is None:
+            root = item
+        for prefix, uri in pending_ns:
+            prefixes[uri] = prefix
+            item.set(f"xmlns:{prefix}" if prefix else "xmlns", uri)
+        pending_ns = []
+    
+    def display_name(name):
+        if name[:1] != "{":
+            return name
+        uri, local = name[1:].split("}", 1)
+        prefix = prefixes.get(uri)
+        return f"{prefix}:{local}" if prefix else local
+    
+    for element in root.iter():
+        element.tag = display_name(element.tag)
+        if any(key[:1] == "{" for key in element.attrib):
+            element.attrib = {display_name(key): value for key, value in element.attrib.items()}
+    
+    ET.indent(root, space="  ")
+    return ET.tostring(root, encoding="unicode")
+
+
+def compute_process_count(limit_value: str, member_count: int) -> int:
+    """
+    Number of set members a batch edit should process for the Limit field value.
+    
+    Args:
+        limit_value: Raw Limit field text (blank, non-numeric or <= 0 means no limit)
+        member_count: Number of members in the loaded set
+        
+    Returns:
+        int: Records to process, starting from the first member
+    """
+    try:
+        limit = int(limit_value) if limit_value else 0
+    except ValueError:
+        limit = 0
+    return min(limit, member_count) if limit > 0 else member_count
+
+
 def main(page: ft.Page):
     """Main Flet application"""
     logger.info("Starting Flet application")
@@ -9235,8 +9671,10 @@ def main(page: ft.Page):
     storage = PersistentStorage()
     logger.info("Persistent storage initialized")
     
-    # Log display list
-    log_messages = []
+    # Log display ring - the deques drop the oldest entry themselves once 100 are held
+    LOG_DISPLAY_LIMIT = 100
+    log_messages = deque(maxlen=LOG_DISPLAY_LIMIT)
+    log_lines = deque(maxlen=LOG_DISPLAY_LIMIT)  # ft.Text controls shown in log_output
     
     # UI Components
     status_text = ft.Text("", color=ft.Colors.BLUE)
@@ -9249,18 +9687,33 @@ def main(page: ft.Page):
         height=120,  # Approximately 5 lines
     )
     
+    # [epoch second, "HH:MM:SS"] - log lines only show seconds, so format each second once
+    log_timestamp = [0, ""]
+    # Guards the log deques, which worker threads append to while the UI snapshots them
+    log_lock = threading.Lock()
+    # While set, add_log_message only buffers; the batch progress refresher redraws the log
+    log_batching = threading.Event()
+    
+    def flush_log_display():
+        """Copy the buffered log lines into the log window (caller runs page.update())"""
+        with log_lock:
+            log_output.controls = list(log_lines)
+    
     def add_log_message(message: str):
         """Add a message to the log output window"""
-        timestamp = datetime.now().strftime("%H:%M:%S")
-        log_msg = f"[{timestamp}] {message}"
-        log_messages.append(log_msg)
-        log_output.controls.append(
-            ft.Text(log_msg, size=11, color=ft.Colors.GREY_800)
-        )
+        now = int(time.time())
+        if now != log_timestamp[0]:
+            log_timestamp[:] = [now, time.strftime("%H:%M:%S", time.localtime(now))]
+        log_msg = f"[{log_timestamp[1]}] {message}"
+        with log_lock:
+            log_messages.append(log_msg)
+            log_lines.append(
+                ft.Text(log_msg, size=11, color=ft.Colors.GREY_800)
+            )
+        if log_batching.is_set():
+            return
         # Keep only last 100 messages to prevent memory issues
-        if len(log_messages) > 100:
-            log_messages.pop(0)
-            log_output.controls.pop(0)
+        flush_log_display()
         page.update()
     
     # Initialize editor with log callback
@@ -9337,6 +9790,14 @@ def main(page: ft.Page):
         on_change=lambda e: storage.set_ui_state("log_level", e.control.value)
     )
     
+    # Function 9 option: fill the "Titles Match!" column from Primo (off by default - one extra request per Handle)
+    verify_primo_checkbox = ft.Checkbox(
+        label="Function 9: Verify Primo Titles",
+        value=storage.get_ui_state("verify_primo_title", "false") == "true",
+        tooltip="Also query Primo for each correctly resolving Handle and compare its title with dc:title ('Titles Match!' column)",
+        on_change=lambda e: storage.set_ui_state("verify_primo_title", "true" if e.control.value else "false")
+    )
+    
     # Set members display
     def load_dcap01_set(e):
         """Load the DCAP01 set ID into the input field"""
@@ -9368,6 +9829,127 @@ def main(page: ft.Page):
         add_log_message(f"Status: {message}")
         page.update()
     
+    # monotonic time of the last progress-driven redraw, shared by the export/batch progress callbacks
+    last_progress_redraw = [0.0]
+    
+    def redraw_progress(current: int, total: int):
+        """
+        page.update() for a progress callback, at most every PROGRESS_UPDATE_INTERVAL.
+        Flet re-sends the whole page on update(), so redrawing per record would
+        serialize thousands of reflows against the batch; the final record always redraws.
+        """
+        now = time.monotonic()
+        if current >= total or now - last_progress_redraw[0] >= PROGRESS_UPDATE_INTERVAL:
+            last_progress_redraw[0] = now
+            page.update()
+    
+    def start_progress_refresher(progress: BatchProgress) -> threading.Event:
+        """
+        Redraw the batch progress bar from `progress` on a background thread every
+        BATCH_PROGRESS_INTERVAL, so batch loops never call page.update() per record.
+        Log lines buffered while log_batching is set are drawn on the same tick.
+        
+        Returns:
+            threading.Event: Set it when the batch is finished to stop the refresher
+        """
+        done = threading.Event()
+        
+        def refresh():
+            last_pct_tenths = -1
+            last_current = -1
+            total_str = str(progress.total)
+            while not done.wait(BATCH_PROGRESS_INTERVAL):
+                current, total, item = progress.snapshot()
+                # Skip the redraw when neither the bar (to 0.1%) nor the record count has moved
+                pct_tenths = current * 1000 // total if total else 0
+                if pct_tenths == last_pct_tenths and current == last_current:
+                    continue
+                if pct_tenths != last_pct_tenths:
+                    set_progress_bar.value = pct_tenths / 1000
+                    last_pct_tenths = pct_tenths
+                set_progress_text.value = "".join((PROGRESS_LABEL_PREFIX, str(current), "/", total_str, ": ", item))
+                last_current = current
+                flush_log_display()
+                page.update()
+        
+        threading.Thread(target=refresh, daemon=True).start()
+        return done
+    
+    def run_record_batch(process_record, members, process_count: int, glyphs: dict) -> Counter:
+        """
+        Run a per-record edit over the first `process_count` set members
+        (Functions 2, 6 and 7), showing progress and logging one line per record.
+        
+        Args:
+            process_record: Callable taking an MMS ID and returning (success, message, outcome),
+                e.g. an editor method or a wrapper such as Function 2's clear_dc_relation_record
+            members: MMS IDs of the loaded set
+            process_count: Number of members to process
+            glyphs: Log prefix for each successful outcome; failures are logged with ✗
+            
+        Returns:
+            Counter: Records processed per outcome ("error" for failures), plus "total"
+        """
+        from concurrent.futures import ThreadPoolExecutor, as_completed
+        from itertools import islice
+        
+        # Show progress bar
+        set_progress_bar.visible = True
+        set_progress_text.visible = True
+        set_progress_bar.value = 0
+        set_progress_text.value = f"{PROGRESS_LABEL_PREFIX}0/{process_count}"
+        page.update()
+        
+        counts = Counter()
+        progress = BatchProgress(process_count)
+        refresher_done = start_progress_refresher(progress)
+        log_batching.set()  # Per-record log lines are drawn by the refresher
+        stopped = False
+        
+        # Records are updated concurrently (GET + PUT per record is network-bound);
+        # results are tallied here on the UI thread as each one finishes
+        try:
+            with ThreadPoolExecutor(max_workers=editor.BATCH_WORKERS) as executor:
+                submit = executor.submit
+                futures = {
+                    submit(process_record, mms_id): mms_id
+                    for mms_id in islice(members, process_count)
+                }
+                for future in as_completed(futures):
+                    if not stopped and editor.kill_event.is_set():
+                        # Drop records that have not started; in-flight ones still get tallied
+                        stopped = True
+                        # Cancel the queued futures one by one rather than executor.shutdown(cancel_futures=True),
+                        # which drops them without waking as_completed and would hang this loop
+                        for pending in futures:
+                            pending.cancel()
+                        add_log_message("Batch processing stopped by user")
+                    if future.cancelled():
+                        continue
+                    
+                    mms_id = futures[future]
+                    counts["total"] += 1
+                    
+                    # Update progress
+                    progress.update(counts["total"], mms_id)
+                    
+                    success, message, outcome = future.result()
+                    if success:
+                        counts[outcome] += 1
+                        add_log_message(f"{glyphs.get(outcome, '✓')} {mms_id}: {message}")
+                    else:
+                        counts["error"] += 1
+                        add_log_message(f"✗ {mms_id}: {message}")
+        finally:
+            # Stop the refresher even if the batch loop fails; the next log line redraws the window
+            refresher_done.set()
+            log_batching.clear()
+        
+        # Hide progress bar
+        set_progress_bar.visible = False
+        set_progress_text.visible = False
+        return counts
+    
     def copy_status_to_clipboard(e):
         """Copy status text to clipboard"""
         if status_text.value:
@@ -9394,7 +9976,7 @@ def main(page: ft.Page):
         input_value = set_id_input.value.strip()
         
         # Determine if input is a CSV file path or Set ID
-        is_csv = input_value.endswith('.csv') or '/' in input_value or '\\' in input_value
+        is_csv = _CSV_PATH_PATTERN.search(input_value) is not None
         
         if is_csv:
             # Load from CSV file
@@ -9407,7 +9989,15 @@ def main(page: ft.Page):
             set_progress_text.value = "Loading CSV..."
             page.update()
             
-            success, message, members = editor.load_mms_ids_from_csv(input_value)
+            # Get limit value
+            try:
+                limit = int(limit_input.value) if limit_input.value else 0
+            except ValueError:
+                update_status("Invalid limit value - using 0 (no limit)", True)
+                limit = 0
+            
+            # Positive limit: stop reading the CSV after the first N IDs
+            success, message, members = editor.load_mms_ids_from_csv(input_value, max_members=max(limit, 0))
             
             # Hide progress
             set_progress_bar.visible = False
@@ -9417,27 +10007,21 @@ def main(page: ft.Page):
                 update_status(message, True)
                 return
             
-            # Get limit value
-            try:
-                limit = int(limit_input.value) if limit_input.value else 0
-            except ValueError:
-                update_status("Invalid limit value - using 0 (no limit)", True)
-                limit = 0
+            csv_name = os.path.basename(input_value)
             
             # Apply limit if set
-            if limit > 0 and len(members) > limit:
-                # Positive limit: take first N records
-                editor.set_members = members[:limit]
-                set_info_text.controls = [ft.Text(f"CSV: {input_value.split('/')[-1]} (first {limit} of {len(members)} IDs loaded)", size=12, color=ft.Colors.GREY_700)]
+            if limit > 0 and len(members) == limit:
+                # Positive limit: only the first N records were read
+                set_info_text.controls = [ft.Text(f"CSV: {csv_name} (first {limit} IDs loaded)", size=12, color=ft.Colors.GREY_700)]
             elif limit < 0 and abs(limit) <= len(members):
                 # Negative limit: take last N records
                 editor.set_members = members[limit:]
-                set_info_text.controls = [ft.Text(f"CSV: {input_value.split('/')[-1]} (last {abs(limit)} of {len(members)} IDs loaded)", size=12, color=ft.Colors.GREY_700)]
+                set_info_text.controls = [ft.Text(f"CSV: {csv_name} (last {abs(limit)} of {len(members)} IDs loaded)", size=12, color=ft.Colors.GREY_700)]
             elif limit < 0:
                 # Negative limit larger than total: take all records
-                set_info_text.controls = [ft.Text(f"CSV: {input_value.split('/')[-1]} ({len(members)} IDs - limit exceeds total)", size=12, color=ft.Colors.GREY_700)]
+                set_info_text.controls = [ft.Text(f"CSV: {csv_name} ({len(members)} IDs - limit exceeds total)", size=12, color=ft.Colors.GREY_700)]
             else:
-                set_info_text.controls = [ft.Text(f"CSV: {input_value.split('/')[-1]} ({len(members)} IDs)", size=12, color=ft.Colors.GREY_700)]
+                set_info_text.controls = [ft.Text(f"CSV: {csv_name} ({len(members)} IDs)", size=12, color=ft.Colors.GREY_700)]
             
             page.update()
             update_status(f"Loaded {len(editor.set_members)} MMS IDs from CSV", False)
@@ -9481,7 +10065,7 @@ def main(page: ft.Page):
             def update_progress(current, total):
                 set_progress_bar.value = current / total
                 set_progress_text.value = f"Loading members: {current} of {total}"
-                page.update()
+                redraw_progress(current, total)
             
             # Fetch set members with progress updates
             success, member_msg, members = editor.fetch_set_members(
@@ -9540,7 +10124,7 @@ def main(page: ft.Page):
     def on_kill_switch_click(e):
         """Handle Kill Switch button click - emergency stop for batch operations"""
         logger.warning("KILL SWITCH ACTIVATED")
-        editor.kill_switch = True
+        editor.kill_event.set()
         add_log_message("⚠️ KILL SWITCH ACTIVATED - Stopping batch operation")
         update_status("⚠️ Kill switch activated - stopping after current record", True)
     
@@ -9577,58 +10161,36 @@ def main(page: ft.Page):
                     return
                 
                 # Apply limit if set
-                members_to_process = editor.set_members
+                process_count = member_count
                 if limit > 0 and limit < member_count:
-                    members_to_process = editor.set_members[:limit]
+                    process_count = limit
                     add_log_message(f"Limiting batch to first {limit} of {member_count} records")
                 
-                process_count = len(members_to_process)
                 add_log_message(f"Starting batch clear_dc_relation for {process_count} records from set")
                 
-                # Show progress bar
-                set_progress_bar.visible = True
-                set_progress_text.visible = True
-                set_progress_bar.value = 0
-                set_progress_text.value = f"Processing: 0 of {process_count}"
-                page.update()
-                
                 # Reset kill switch before starting
-                editor.kill_switch = False
-                
-                success_count = 0
-                error_count = 0
+                editor.kill_event.clear()
                 
-                for idx, mms_id in enumerate(members_to_process, 1):
-                    # Check kill switch
-                    if editor.kill_switch:
-                        add_log_message(f"⚠️ Batch operation stopped by kill switch at record {idx}/{process_count}")
-                        set_progress_bar.visible = False
-                        set_progress_text.visible = False
-                        update_status(f"⚠️ STOPPED by kill switch: {success_count} succeeded, {error_count} failed, {process_count - idx + 1} skipped", True)
-                        editor.kill_switch = False  # Reset for next operation
-                        return
-                    
-                    add_log_message(f"Processing {idx}/{process_count}: {mms_id}")
-                    
-                    # Update progress bar and text
-                    set_progress_bar.value = idx / process_count
-                    set_progress_text.value = f"Processing: {idx} of {process_count}"
-                    update_status(f"Processing {idx}/{process_count}: {mms_id}", False)
-                    
+                def clear_dc_relation_record(mms_id):
+                    """clear_dc_relation_collections in the (success, message, outcome) shape run_record_batch expects"""
                     success, message = editor.clear_dc_relation_collections(mms_id)
-                    if success:
-                        success_count += 1
-                    else:
-                        error_count += 1
-                        add_log_message(f"ERROR on {mms_id}: {message}")
+                    return success, message, "cleared"
                 
-                # Hide progress bar
-                set_progress_bar.visible = False
-                set_progress_text.visible = False
+                # Records are cleared concurrently on editor.BATCH_WORKERS threads (see CABB_BATCH_WORKERS)
+                counts = run_record_batch(clear_dc_relation_record, editor.set_members, process_count, {"cleared": "✓"})
+                success_count = counts["cleared"]
+                error_count = counts["error"]
+                
+                if editor.kill_event.is_set():
+                    add_log_message(f"⚠️ Batch operation stopped by kill switch after {counts['total']}/{process_count} records")
+                    update_status(f"⚠️ STOPPED by kill switch: {success_count} succeeded, {error_count} failed, {process_count - counts['total']} skipped", True)
+                    editor.kill_event.clear()  # Reset for next operation
+                    return
                 
-                summary = f"Batch complete: {success_count} succeeded, {error_count} failed out of {process_count} records"
+                summary_parts = [f"Batch complete: {success_count} succeeded, {error_count} failed out of {process_count} records"]
                 if limit > 0 and limit < member_count:
-                    summary += f" (limited from {member_count} total)"
+                    summary_parts.append(f"(limited from {member_count} total)")
+                summary = " ".join(summary_parts)
                 update_status(summary, error_count > 0)
             else:
                 # Single record processing
@@ -9708,7 +10270,7 @@ def main(page: ft.Page):
             """Update progress during export"""
             set_progress_bar.value = current / total if total > 0 else None
             set_progress_text.value = f"Exported {current} of {total} records"
-            page.update()
+            redraw_progress(current, total)
         
         # Export to CSV
         success, message = editor.export_to_csv(
@@ -9761,79 +10323,30 @@ def main(page: ft.Page):
         """Handle Function 6 click - Replace Author Copyright Rights"""
         logger.info("Function 6 button clicked - Replace Author Copyright Rights")
         
+        # Work out the batch size once; shared by the confirmation dialog and execute_function_6
+        members = editor.set_members
+        member_count = len(members) if members else 0
+        process_count = compute_process_count(limit_input.value, member_count)
+        
         def execute_function_6():
             """Execute Function 6 after confirmation"""
             storage.record_function_usage("function_6_replace_rights")
             
             # Check if processing a batch or single record
-            if editor.set_members and len(editor.set_members) > 0:
+            if member_count > 0:
                 # Batch processing
-                add_log_message(f"Starting batch replace_author_copyright_rights for {len(editor.set_members)} records")
-                
-                # Get limit
-                try:
-                    limit = int(limit_input.value) if limit_input.value else 0
-                    if limit < 0:
-                        limit = 0
-                except ValueError:
-                    limit = 0
-                
-                # Calculate how many to process
-                member_count = len(editor.set_members)
-                process_count = min(limit, member_count) if limit > 0 else member_count
-                
-                # Show progress bar
-                set_progress_bar.visible = True
-                set_progress_text.visible = True
-                set_progress_bar.value = 0
-                set_progress_text.value = f"Processing 0/{process_count}"
-                page.update()
-                
-                total_count = 0
-                replaced_count = 0
-                added_count = 0
-                removed_duplicates_count = 0
-                no_change_count = 0
-                error_count = 0
-                
-                for i, mms_id in enumerate(editor.set_members[:process_count], 1):
-                    if editor.kill_switch:
-                        add_log_message("Batch processing stopped by user")
-                        break
-                    
-                    total_count += 1
-                    
-                    # Update progress
-                    set_progress_bar.value = i / process_count
-                    set_progress_text.value = f"Processing {i}/{process_count}: {mms_id}"
-                    page.update()
-                    
-                    success, message, outcome = editor.replace_author_copyright_rights(mms_id)
-                    if success:
-                        if outcome == "replaced":
-                            replaced_count += 1
-                            add_log_message(f"✓ {mms_id}: {message}")
-                        elif outcome == "added":
-                            added_count += 1
-                            add_log_message(f"+ {mms_id}: {message}")
-                        elif outcome == "removed_duplicates":
-                            removed_duplicates_count += 1
-                            add_log_message(f"◆ {mms_id}: {message}")
-                        elif outcome == "no_change":
-                            no_change_count += 1
-                            add_log_message(f"⊘ {mms_id}: {message}")
-                    else:
-                        error_count += 1
-                        add_log_message(f"✗ {mms_id}: {message}")
-                
-                # Hide progress bar
-                set_progress_bar.visible = False
-                set_progress_text.visible = False
+                add_log_message(f"Starting batch replace_author_copyright_rights for {member_count} records")
+                counts = run_record_batch(
+                    editor.replace_author_copyright_rights, members, process_count,
+                    {"replaced": "✓", "added": "+", "removed_duplicates": "◆", "no_change": "⊘"},
+                )
+                error_count = counts["error"]
                 
                 # Build detailed summary
-                summary = f"Batch complete ({total_count} records): {replaced_count} replaced, {added_count} added, {removed_duplicates_count} duplicates removed, {no_change_count} no change, {error_count} errors"
-                if limit > 0 and limit < member_count:
-                    summary += f" (limited from {member_count} total)"
+                summary_parts = [f"Batch complete ({counts['total']} records): {counts['replaced']} replaced, {counts['added']} added, {counts['removed_duplicates']} duplicates removed, {counts['no_change']} no change, {error_count} errors"]
+                if process_count < member_count:
+                    summary_parts.append(f"(limited from {member_count} total)")
+                summary = " ".join(summary_parts)
                 update_status(summary, error_count > 0)
             else:
                 # Single record processing
@@ -9857,22 +10370,13 @@ def main(page: ft.Page):
             update_status("Operation cancelled by user", False)
         
         # Determine warning message based on single or batch
-        if editor.set_members and len(editor.set_members) > 0:
-            member_count = len(editor.set_members)
-            try:
-                limit = int(limit_input.value) if limit_input.value else 0
-                if limit < 0:
-                    limit = 0
-            except ValueError:
-                limit = 0
-            
-            process_count = min(limit, member_count) if limit > 0 else member_count
-            warning_msg = f"⚠️ WARNING: This will modify {process_count} bibliographic record(s) in Alma.\n\nFunction: Replace old dc:rights with Public Domain link\n\nThis action will PERMANENTLY modify dc:rights fields in the records.\n\nDo you want to continue?"
+        if member_count > 0:
+            warning_msg = _WARN_BATCH_F6.format(n=process_count)
         else:
             if not mms_id_input.value:
                 update_status("Please enter an MMS ID or load a set", True)
                 return
-            warning_msg = f"⚠️ WARNING: This will modify the bibliographic record in Alma.\n\nMMS ID: {mms_id_input.value}\nFunction: Replace old dc:rights with Public Domain link\n\nThis action will PERMANENTLY modify dc:rights fields.\n\nDo you want to continue?"
+            warning_msg = _WARN_SINGLE_F6.format(mms_id=mms_id_input.value)
         
         dialog = ft.AlertDialog(
             modal=True,
@@ -9891,67 +10395,29 @@ def main(page: ft.Page):
         """Handle Function 7 click - Add Grinnell: dc:identifier"""
         logger.info("Function 7 button clicked - Add Grinnell: dc:identifier")
         
+        # Work out the batch size once; shared by the confirmation dialog and execute_function_7
+        members = editor.set_members
+        member_count = len(members) if members else 0
+        process_count = compute_process_count(limit_input.value, member_count)
+        
         def execute_function_7():
             """Execute Function 7 after confirmation"""
             storage.record_function_usage("function_7_add_grinnell_id")
             
             # Check if processing a batch or single record
-            if editor.set_members and len(editor.set_members) > 0:
+            if member_count > 0:
                 # Batch processing
-                add_log_message(f"Starting batch add_grinnell_identifier for {len(editor.set_members)} records")
-                
-                # Get limit
-                try:
-                    limit = int(limit_input.value) if limit_input.value else 0
-                    if limit < 0:
-                        limit = 0
-                except ValueError:
-                    limit = 0
-                
-                # Calculate how many to process
-                member_count = len(editor.set_members)
-                process_count = min(limit, member_count) if limit > 0 else member_count
-                
-                # Show progress bar
-                set_progress_bar.visible = True
-                set_progress_text.visible = True
-                set_progress_bar.value = 0
-                set_progress_text.value = f"Processing 0/{process_count}"
-                page.update()
-                
-                success_count = 0
-                error_count = 0
-                skipped_count = 0
-                
-                for i, mms_id in enumerate(editor.set_members[:process_count], 1):
-                    if editor.kill_switch:
-                        add_log_message("Batch processing stopped by user")
-                        break
-                    
-                    # Update progress
-                    set_progress_bar.value = i / process_count
-                    set_progress_text.value = f"Processing {i}/{process_count}: {mms_id}"
-                    page.update()
-                    
-                    success, message = editor.add_grinnell_identifier(mms_id)
-                    if success:
-                        if "already exists" in message or "No dg_" in message:
-                            skipped_count += 1
-                            add_log_message(f"⊘ {mms_id}: {message}")
-                        else:
-                            success_count += 1
-                            add_log_message(f"✓ {mms_id}: {message}")
-                    else:
-                        error_count += 1
-                        add_log_message(f"✗ {mms_id}: {message}")
-                
-                # Hide progress bar
-                set_progress_bar.visible = False
-                set_progress_text.visible = False
+                add_log_message(f"Starting batch add_grinnell_identifier for {member_count} records")
+                counts = run_record_batch(
+                    editor.add_grinnell_identifier, members, process_count,
+                    {"added": "✓", "skipped": "⊘"},
+                )
+                error_count = counts["error"]
                 
-                summary = f"Batch complete: {success_count} added, {skipped_count} skipped, {error_count} failed out of {process_count} records"
-                if limit > 0 and limit < member_count:
-                    summary += f" (limited from {member_count} total)"
+                summary_parts = [f"Batch complete: {counts['added']} added, {counts['skipped']} skipped, {error_count} failed out of {process_count} records"]
+                if process_count < member_count:
+                    summary_parts.append(f"(limited from {member_count} total)")
+                summary = " ".join(summary_parts)
                 update_status(summary, error_count > 0)
             else:
                 # Single record processing
@@ -9960,7 +10426,7 @@ def main(page: ft.Page):
                     return
                 
                 add_log_message(f"Starting add_grinnell_identifier for MMS ID: {mms_id_input.value}")
-                success, message = editor.add_grinnell_identifier(mms_id_input.value)
+                success, message, _ = editor.add_grinnell_identifier(mms_id_input.value)
                 update_status(message, not success)
         
         # Show confirmation dialog
@@ -9975,22 +10441,13 @@ def main(page: ft.Page):
             update_status("Operation cancelled by user", False)
         
         # Determine warning message based on single or batch
-        if editor.set_members and len(editor.set_members) > 0:
-            member_count = len(editor.set_members)
-            try:
-                limit = int(limit_input.value) if limit_input.value else 0
-                if limit < 0:
-                    limit = 0
-            except ValueError:
-                limit = 0
-            
-            process_count = min(limit, member_count) if limit > 0 else member_count
-            warning_msg = f"⚠️ WARNING: This will modify {process_count} bibliographic record(s) in Alma.\n\nFunction: Add Grinnell: dc:identifier Field As Needed\n\nThis action will PERMANENTLY add dc:identifier fields to records with dg_ identifiers.\n\nDo you want to continue?"
+        if member_count > 0:
+            warning_msg = _WARN_BATCH_F7.format(n=process_count)
         else:
             if not mms_id_input.value:
                 update_status("Please enter an MMS ID or load a set", True)
                 return
-            warning_msg = f"⚠️ WARNING: This will modify the bibliographic record in Alma.\n\nMMS ID: {mms_id_input.value}\nFunction: Add Grinnell: dc:identifier Field As Needed\n\nThis action will PERMANENTLY add a dc:identifier field if a dg_ identifier exists.\n\nDo you want to continue?"
+            warning_msg = _WARN_SINGLE_F7.format(mms_id=mms_id_input.value)
         
         dialog = ft.AlertDialog(
             modal=True,
@@ -10004,7 +10461,7 @@ def main(page: ft.Page):
         )
         
         page.open(dialog)
-    
+
     def on_function_8_click(e):
         """Handle Function 8: Export Identifier CSV"""
         if not editor.set_members or len(editor.set_members) == 0:
@@ -10023,7 +10480,7 @@ def main(page: ft.Page):
             progress = current / total
             set_progress_bar.value = progress
             status_text.value = f"Exporting identifiers: {current}/{total} records ({progress*100:.1f}%)"
-            page.update()
+            redraw_progress(current, total)
         
         # Export to CSV
         storage.record_function_usage("function_8_export_identifiers")
@@ -10060,14 +10517,15 @@ def main(page: ft.Page):
             progress = current / total
             set_progress_bar.value = progress
             status_text.value = f"Validating Handles: {current}/{total} records ({progress*100:.1f}%)"
-            page.update()
+            redraw_progress(current, total)
         
         # Validate Handles
         storage.record_function_usage("function_9_validate_handles")
         success, message = editor.validate_handles_to_csv(
             editor.set_members,
             output_file,
-            progress_callback=progress_update
+            progress_callback=progress_update,
+            verify_primo_title=bool(verify_primo_checkbox.value)
         )
         
         # Hide progress bar
@@ -10106,7 +10564,7 @@ def main(page: ft.Page):
             set_progress_bar.value = progress
             set_progress_text.value = f"Processing: {current}/{total} records ({progress*100:.1f}%)"
             status_text.value = f"Exporting for review: {current}/{total} records ({progress*100:.1f}%)"
-            page.update()
+            redraw_progress(current, total)
         
         # Export to CSV
         storage.record_function_usage("function_10_export_review")
@@ -10164,7 +10622,7 @@ def main(page: ft.Page):
                     set_progress_bar.value = progress
                     set_progress_text.value = f"Processing: {current}/{total} records ({progress*100:.1f}%)"
                     status_text.value = f"Preparing TIFF/JPG reps: {current}/{total} records ({progress*100:.1f}%)"
-                    page.update()
+                    redraw_progress(current, total)
             else:
                 add_log_message(f"Starting TIFF/JPG preparation for MMS ID: {mms_ids_to_process[0]}")
                 update_status(f"Preparing TIFF/JPG representation for {mms_ids_to_process[0]}...", False)
@@ -10333,7 +10791,7 @@ def main(page: ft.Page):
             set_progress_bar.value = progress
             set_progress_text.value = f"Processing: {current}/{total} records ({progress*100:.1f}%)"
             status_text.value = f"Analyzing sound records: {current}/{total} records ({progress*100:.1f}%)"
-            page.update()
+            redraw_progress(current, total)
         
         # Analyze sound records by decade
         storage.record_function_usage("function_12_sound_by_decade")
@@ -10465,7 +10923,7 @@ def main(page: ft.Page):
                     set_progress_bar.value = progress
                     set_progress_text.value = f"Processing: {current}/{total} records ({progress*100:.1f}%)"
                     status_text.value = f"Preparing thumbnails: {current}/{total} records ({progress*100:.1f}%)"
-                    page.update()
+                    redraw_progress(current, total)
             else:
                 add_log_message(f"Starting thumbnail preparation for MMS ID: {mms_ids_to_process[0]}")
                 update_status(f"Preparing thumbnail for {mms_ids_to_process[0]}...", False)
@@ -10588,7 +11046,7 @@ def main(page: ft.Page):
                 set_progress_bar.value = progress
                 set_progress_text.value = f"Processing: {current}/{total} records ({progress*100:.1f}%)"
                 status_text.value = f"Uploading thumbnails: {current}/{total} records ({progress*100:.1f}%)"
-                page.update()
+                redraw_progress(current, total)
             
             # Upload via Selenium
             storage.record_function_usage("function_14b_upload_thumbnails")
@@ -10807,7 +11265,7 @@ def main(page: ft.Page):
                 set_progress_bar.value = progress
                 set_progress_text.value = f"Processing: {current}/{total} records ({progress*100:.1f}%)"
                 status_text.value = f"Analyzing identifiers: {current}/{total} records ({progress*100:.1f}%)"
-                page.update()
+                redraw_progress(current, total)
         else:
             progress_update = None
         
@@ -10874,7 +11332,7 @@ def main(page: ft.Page):
                     set_progress_bar.value = progress
                     set_progress_text.value = f"Processing: {current}/{total} records ({progress*100:.1f}%)"
                     status_text.value = f"Adding MMS ID identifiers: {current}/{total} records ({progress*100:.1f}%)"
-                    page.update()
+                    redraw_progress(current, total)
             else:
                 progress_update = None
             
@@ -10992,7 +11450,7 @@ def main(page: ft.Page):
                     set_progress_bar.value = progress
                     set_progress_text.value = f"Processing: {current}/{total} records ({progress*100:.1f}%)"
                     status_text.value = f"Restoring metadata: {current}/{total} records ({progress*100:.1f}%)"
-                    page.update()
+                    redraw_progress(current, total)
             else:
                 progress_update = None
 
@@ -11105,7 +11563,7 @@ def main(page: ft.Page):
             set_progress_bar.value = progress
             set_progress_text.value = f"Processing: {current}/{total} records ({progress*100:.1f}%)"
             status_text.value = f"Identifying single TIFFs: {current}/{total} records ({progress*100:.1f}%)"
-            page.update()
+            redraw_progress(current, total)
         
         # Identify single TIFF objects
         storage.record_function_usage("function_18_identify_single_tiff")
@@ -11163,7 +11621,7 @@ def main(page: ft.Page):
                 set_progress_bar.value = progress
                 set_progress_text.value = f"Processing: {current}/{total} records ({progress*100:.1f}%)"
                 status_text.value = f"Creating thumbnails: {current}/{total} records ({progress*100:.1f}%)"
-                page.update()
+                redraw_progress(current, total)
         else:
             progress_update = None
         
@@ -11302,7 +11760,7 @@ def main(page: ft.Page):
                 total_fields_removed = 0
                 
                 for i, mms_id in enumerate(editor.set_members[:process_count], 1):
-                    if editor.kill_switch:
+                    if editor.kill_event.is_set():
                         add_log_message("Batch processing stopped by user")
                         break
                     
@@ -11331,9 +11789,10 @@ def main(page: ft.Page):
                 set_progress_text.visible = False
                 
                 # Build detailed summary
-                summary = f"Batch complete ({total_count} records): {success_count} cleaned (removed {total_fields_removed} total fields), {no_fields_count} no ns0: fields, {error_count} errors"
+                summary_parts = [f"Batch complete ({total_count} records): {success_count} cleaned (removed {total_fields_removed} total fields), {no_fields_count} no ns0: fields, {error_count} errors"]
                 if limit > 0 and limit < member_count:
-                    summary += f" (limited from {member_count} total)"
+                    summary_parts.append(f"(limited from {member_count} total)")
+                summary = " ".join(summary_parts)
                 update_status(summary, error_count > 0)
             else:
                 # Single record processing
@@ -11426,7 +11885,7 @@ def main(page: ft.Page):
         def progress_update(current, total):
             set_progress_bar.value = current / total
             set_progress_text.value = f"Diagnosing: {current}/{total} records"
-            page.update()
+            redraw_progress(current, total)
         
         success, message = editor.diagnose_record_accessibility(
             editor.set_members,
@@ -11636,6 +12095,9 @@ def main(page: ft.Page):
     # Help checkbox state
     help_mode_enabled = ft.Ref[ft.Checkbox]()
     
+    # help file -> (mtime, markdown), so repeat help clicks don't re-read the file
+    help_cache = {}
+    
     def show_help_dialog(function_key):
         """Display the help markdown file for a function"""
         if function_key not in functions:
@@ -11649,9 +12111,15 @@ def main(page: ft.Page):
             return
         
         try:
-            # Read the markdown file
-            with open(help_file, 'r', encoding='utf-8') as f:
-                markdown_content = f.read()
+            # Read the markdown file, reusing the cached copy unless it changed on disk
+            mtime = os.stat(help_file).st_mtime
+            cached = help_cache.get(help_file)
+            if cached and cached[0] == mtime:
+                markdown_content = cached[1]
+            else:
+                with open(help_file, 'r', encoding='utf-8') as f:
+                    markdown_content = f.read()
+                help_cache[help_file] = (mtime, markdown_content)
             
             add_log_message(f"Displaying help for: {func_info['label']}")
             
@@ -11659,20 +12127,32 @@ def main(page: ft.Page):
                 help_dialog.open = False
                 page.update()
             
+            reset_timer = None
+            
+            def reset_text():
+                copy_help_button.text = "Copy to Clipboard"
+                page.update()
+            
             def copy_help(e):
-                page.set_clipboard(markdown_content)
+                nonlocal reset_timer
+                # Copy from the control so the dialog holds only the one (cached) content string
+                page.set_clipboard(help_markdown.value)
                 copy_help_button.text = "Copied!"
                 page.update()
-                # Reset button text after 2 seconds
-                import threading
-                def reset_text():
-                    import time
-                    time.sleep(2)
-                    copy_help_button.text = "Copy to Clipboard"
-                    page.update()
-                threading.Thread(target=reset_text, daemon=True).start()
+                # Reset button text after 2 seconds; a repeat click restarts the one pending timer
+                if reset_timer is not None:
+                    reset_timer.cancel()
+                reset_timer = threading.Timer(2.0, reset_text)
+                reset_timer.daemon = True
+                reset_timer.start()
             
             copy_help_button = ft.TextButton("Copy to Clipboard", on_click=copy_help)
+            help_markdown = ft.Markdown(
+                value=markdown_content,
+                selectable=True,
+                extension_set=ft.MarkdownExtensionSet.GITHUB_WEB,
+                on_tap_link=lambda e: page.launch_url(e.data),
+            )
             
             help_dialog = ft.AlertDialog(
                 modal=True,
@@ -11683,14 +12163,7 @@ def main(page: ft.Page):
                         ft.Container(height=10),
                         ft.Container(
                             content=ft.Column(
-                                [
-                                    ft.Markdown(
-                                        value=markdown_content,
-                                        selectable=True,
-                                        extension_set=ft.MarkdownExtensionSet.GITHUB_WEB,
-                                        on_tap_link=lambda e: page.launch_url(e.data),
-                                    ),
-                                ],
+                                [help_markdown],
                                 scroll=ft.ScrollMode.AUTO,
                             ),
                             width=900,
@@ -11733,9 +12206,7 @@ def main(page: ft.Page):
             else:
                 # Execute the function normally
                 # Call the function handler with a mock event
-                class MockEvent:
-                    pass
-                functions[function_key]["handler"](MockEvent())
+                functions[function_key]["handler"](_MOCK_EVENT)
                 
                 # Refresh dropdown orders after execution
                 active_function_dropdown.options = get_sorted_function_options(active_functions)
@@ -11744,38 +12215,38 @@ def main(page: ft.Page):
                 inactive_function_dropdown.value = None  # Clear selection
                 page.update()
     
+    # (function keys, storage.usage_version) -> dropdown options, so unchanged lists aren't re-sorted
+    sorted_options_cache = {}
+    
     def get_sorted_function_options(function_list):
         """Get function dropdown options sorted by last use date"""
-        from datetime import datetime
+        cache_key = (tuple(function_list), storage.usage_version)
+        if cache_key in sorted_options_cache:
+            return sorted_options_cache[cache_key]
         
         usage_data = storage.get_all_function_usage()
         
-        # Create list of (function_key, last_used_timestamp)
+        # Create list of (function_key, last_used ISO timestamp); never-used functions get ""
+        # record_function_usage writes datetime.isoformat() strings, which sort chronologically as text
         function_usage = []
         for func_key in function_list:
             usage = usage_data.get(func_key, {})
-            last_used = usage.get("last_used")
-            # Parse ISO timestamp or use epoch start for never-used functions
-            if last_used:
-                try:
-                    timestamp = datetime.fromisoformat(last_used)
-                except:
-                    timestamp = datetime.min
-            else:
-                timestamp = datetime.min
-            
-            function_usage.append((func_key, timestamp))
+            function_usage.append((func_key, usage.get("last_used") or ""))
         
         # Sort by timestamp (most recent first)
         function_usage.sort(key=lambda x: x[1], reverse=True)
         
         # Create dropdown options
         options = []
-        for func_key, timestamp in function_usage:
+        for func_key, last_used in function_usage:
             func_info = functions[func_key]
             label = f"{func_info['icon']} {func_info['label']}"
             options.append(ft.dropdown.Option(key=func_key, text=label))
         
+        # Entries from an older usage_version can never be hit again
+        for stale_key in [key for key in sorted_options_cache if key[1] != storage.usage_version]:
+            del sorted_options_cache[stale_key]
+        sorted_options_cache[cache_key] = options
         return options
     
     # Build UI
@@ -11883,11 +12354,14 @@ def main(page: ft.Page):
                             ),
                         ], spacing=5),
                     ]),
-                    ft.Checkbox(
-                        label="Help Mode",
-                        ref=help_mode_enabled,
-                        tooltip="Enable to view help documentation for functions instead of executing them"
-                    ),
+                    ft.Row([
+                        ft.Checkbox(
+                            label="Help Mode",
+                            ref=help_mode_enabled,
+                            tooltip="Enable to view help documentation for functions instead of executing them"
+                        ),
+                        verify_primo_checkbox,
+                    ], spacing=20),
                 ], spacing=5),
                 padding=5,
             ),
@@ -5,12 +5,52 @@ to reduce file size and improve maintainability.
 """
 
 import logging
+import re
 import xml.etree.ElementTree as ET
 import requests
-from typing import Optional
 
 logger = logging.getLogger(__name__)
 
+# Prefixes used when serializing modified records back to Alma (the default
+# Alma namespace is deliberately NOT registered - see the ns0 fixups below).
+# Registered once at import: ET.register_namespace rewrites a global map, so
+# doing it per record would race with ET.tostring in concurrent batch workers.
+for _prefix, _uri in {
+    'dc': 'http://purl.org/dc/elements/1.1/',
+    'dcterms': 'http://purl.org/dc/terms/',
+    'xsi': 'http://www.w3.org/2001/XMLSchema-instance',
+    'xml': 'http://www.w3.org/XML/1998/namespace'
+}.items():
+    ET.register_namespace(_prefix, _uri)
+
+# Query flags for the bib PUTs below; requests encodes them alongside the URL
+_BIB_UPDATE_PARAMS = {
+    'validate': 'true',
+    'override_warning': 'true',
+    'override_lock': 'true',
+    'stale_version_check': 'false',
+    'check_match': 'false'
+}
+
+# dc:relation values removed by Function 2 start with this
+_COLLECTION_RELATION_PREFIX = 'alma:01GCL_INST/bibs/collections/'
+_COLLECTION_RELATION_BYTES = _COLLECTION_RELATION_PREFIX.encode('utf-8')
+
+# ElementTree serializes the unregistered default Alma namespace as ns0 (<ns0:record
+# xmlns:ns0="...">). One pass removes the declaration (either form) and the prefixes;
+# the declaration alternative comes first so it is matched before its ':ns0' part.
+_ALMA_NS0_PATTERN = re.compile(
+    rb' xmlns(?::ns0)?="http://alma\.exlibrisgroup\.com/dc/01GCL_INST"|ns0:|:ns0'
+)
+
+# First plausible 4-digit year (1000-2099) in a date value - used by Function 4
+_YEAR_PATTERN = re.compile(r'\b(?:1[0-9]{3}|20[0-9]{2})\b')
+
+
+def _strip_alma_ns0(xml_bytes: bytes) -> bytes:
+    """Remove ns0 prefixes and the Alma default-namespace declaration in a single scan"""
+    return _ALMA_NS0_PATTERN.sub(b'', xml_bytes)
+
 
 # ============================================================================
 # INACTIVE CLASS METHODS - These are called as editor.method_name()
@@ -40,14 +80,16 @@ def clear_dc_relation_collections(editor, mms_id: str) -> tuple[bool, str]:
     
     try:
         # Get the Alma API base URL
-        api_url = editor._get_alma_api_url()
+        api_url = editor._api_base
         
         # Step 1: GET the bib record as XML
         editor.log(f"Fetching bibliographic record {mms_id} as XML")
         headers = {'Accept': 'application/xml'}
-        response = requests.get(
-            f"{api_url}/almaws/v1/bibs/{mms_id}?view=full&expand=None&apikey={editor.api_key}",
-            headers=headers
+        response = editor._http.get(
+            f"{api_url}/almaws/v1/bibs/{mms_id}?view=full&expand=None",
+            params={'apikey': editor.api_key},
+            headers=headers,
+            timeout=editor.REQUEST_TIMEOUT
         )
         
         if response.status_code != 200:
@@ -55,21 +97,15 @@ def clear_dc_relation_collections(editor, mms_id: str) -> tuple[bool, str]:
             editor.log(f"Response: {response.text}", logging.ERROR)
             return False, f"Failed to fetch record: {response.status_code}"
         
+        # Most records carry no collection relation at all - skip the parse (and PUT)
+        # when the raw bytes never mention the pattern
+        if _COLLECTION_RELATION_BYTES not in response.content:
+            editor.log("No matching dc:relation fields found")
+            return True, "No matching dc:relation fields found"
+        
         # Step 2: Parse the XML response
         editor.log("Parsing XML response")
-        root = ET.fromstring(response.text)
-        
-        # Register namespaces (but NOT the default namespace - we'll handle that in tostring)
-        # This prevents xmlns attribute on <bib> root element which Alma rejects
-        namespaces_to_register = {
-            'dc': 'http://purl.org/dc/elements/1.1/',
-            'dcterms': 'http://purl.org/dc/terms/',
-            'xsi': 'http://www.w3.org/2001/XMLSchema-instance'
-        }
-        for prefix, uri in namespaces_to_register.items():
-            ET.register_namespace(prefix, uri)
-        
-        editor.log("Registered namespaces: dc, dcterms, xsi (default namespace handled in tostring)")
+        root = ET.fromstring(response.content)
         
         # Step 3: Find and remove matching dc:relation elements
         # Use namespaces dict for finding
@@ -77,20 +113,18 @@ def clear_dc_relation_collections(editor, mms_id: str) -> tuple[bool, str]:
             'dc': 'http://purl.org/dc/elements/1.1/',
             'dcterms': 'http://purl.org/dc/terms/'
         }
-        pattern = 'alma:01GCL_INST/bibs/collections/'
+        pattern = _COLLECTION_RELATION_PREFIX
         relations = root.findall('.//dc:relation', search_namespaces)
         editor.log(f"Found {len(relations)} dc:relation elements")
         
+        # Map each element to its parent once, instead of rescanning the tree per match
+        parent_map = {child: parent for parent in root.iter() for child in parent}
         removed_count = 0
         for relation in relations:
             if relation.text and relation.text.startswith(pattern):
                 editor.log(f"MATCH FOUND - Removing: {relation.text}")
-                # Find parent and remove the element
-                for parent in root.iter():
-                    if relation in list(parent):
-                        parent.remove(relation)
-                        removed_count += 1
-                        break
+                parent_map[relation].remove(relation)
+                removed_count += 1
         
         if removed_count == 0:
             editor.log("No matching dc:relation fields found")
@@ -98,40 +132,40 @@ def clear_dc_relation_collections(editor, mms_id: str) -> tuple[bool, str]:
         
         # Step 4: Convert the modified tree back to XML bytes
         editor.log(f"Removed {removed_count} dc:relation field(s), preparing to update")
+        # Encoded once: the namespace fix-up works on these bytes and they are sent as-is as the PUT body
         xml_bytes = ET.tostring(root, encoding='utf-8')
         
-        # Convert to string and fix namespace prefixes
-        xml_str = xml_bytes.decode('utf-8')
-        # Remove ns0: prefix from element names (e.g., <ns0:record> -> <record>)
-        xml_str = xml_str.replace('ns0:', '').replace(':ns0', '')
-        # Remove the xmlns declaration for the Alma namespace (Alma rejects it on <bib>)
-        xml_str = xml_str.replace(' xmlns="http://alma.exlibrisgroup.com/dc/01GCL_INST"', '')
-        xml_bytes = xml_str.encode('utf-8')
+        # Drop ElementTree's ns0: prefixes and the Alma xmlns declaration (Alma rejects it on <bib>)
+        xml_bytes = _strip_alma_ns0(xml_bytes)
         
         # Log a sample of the XML being sent (first 500 chars)
         editor.log("=" * 60)
         editor.log("XML being sent to Alma (first 500 chars):")
-        editor.log(xml_str[:500])
+        editor.log(xml_bytes[:500].decode('utf-8', 'replace'))
         editor.log("=" * 60)
         
         # Step 5: PUT the modified XML back to Alma
         editor.log(f"Updating record {mms_id} in Alma")
         headers = {
             'Accept': 'application/xml',
-            'Content-Type': 'application/xml; charset=utf-8'
+            'Content-Type': 'application/xml; charset=utf-8',
+            'Authorization': f'apikey {editor.api_key}'
         }
-        response = requests.put(
-            f"{api_url}/almaws/v1/bibs/{mms_id}?validate=true&override_warning=true&override_lock=true&stale_version_check=false&check_match=false&apikey={editor.api_key}",
+        response = editor._http.put(
+            f"{api_url}/almaws/v1/bibs/{mms_id}",
+            params=_BIB_UPDATE_PARAMS,
             headers=headers,
-            data=xml_bytes
+            data=xml_bytes,
+            timeout=editor.REQUEST_TIMEOUT
         )
+        editor.invalidate_bib(mms_id)  # Drop any cached copy of the pre-update record
         
         if response.status_code != 200:
             editor.log(f"Failed to update record: {response.status_code}", logging.ERROR)
             editor.log(f"Response: {response.text}", logging.ERROR)
             editor.log("=" * 60)
             editor.log("Full XML that was sent:")
-            editor.log(xml_str)
+            editor.log(xml_bytes.decode('utf-8'))
             editor.log("=" * 60)
             return False, f"Failed to update record: {response.status_code}"
         
@@ -139,10 +173,7 @@ def clear_dc_relation_collections(editor, mms_id: str) -> tuple[bool, str]:
         return True, f"Successfully removed {removed_count} dc:relation field(s) from record {mms_id}"
         
     except Exception as e:
-        import traceback
-        error_details = traceback.format_exc()
-        editor.log(f"Error processing record {mms_id}: {str(e)}", logging.ERROR)
-        editor.log(f"Full traceback:\n{error_details}", logging.DEBUG)
+        editor.log(f"Error processing record {mms_id}: {str(e)}", logging.ERROR, exc_info=True)
         return False, f"Error processing record {mms_id}: {str(e)}"
 
 
@@ -170,8 +201,7 @@ def filter_csv_by_pre1930_dates(editor, input_file: str = None, output_file: str
         tuple: (success: bool, message: str)
     """
     import csv
-    import glob
-    import re
+    import os
     from datetime import datetime
     
     # Calculate cutoff year (95 years ago)
@@ -183,10 +213,17 @@ def filter_csv_by_pre1930_dates(editor, input_file: str = None, output_file: str
     try:
         # Find most recent alma_export_*.csv if not specified
         if input_file is None:
-            csv_files = glob.glob("alma_export_*.csv")
-            if not csv_files:
+            # Newest by modification time, scanning the directory without building a file list
+            with os.scandir('.') as entries:
+                newest = max(
+                    (entry for entry in entries
+                     if entry.name.startswith("alma_export_") and entry.name.endswith(".csv") and entry.is_file()),
+                    key=lambda entry: entry.stat().st_mtime,
+                    default=None
+                )
+            if newest is None:
                 return False, "No alma_export_*.csv files found"
-            input_file = max(csv_files, key=lambda f: f)
+            input_file = newest.name
             editor.log(f"Using input file: {input_file}")
         
         # Generate output filename if not specified
@@ -203,57 +240,49 @@ def filter_csv_by_pre1930_dates(editor, input_file: str = None, output_file: str
             "dcterms:dateAccepted"
         ]
         
-        def extract_year(date_str: str) -> Optional[int]:
-            """Extract 4-digit year from date string"""
-            if not date_str or not date_str.strip():
-                return None
-            
-            # Look for 4-digit year
-            match = re.search(r'\b(1[0-9]{3}|20[0-9]{2})\b', date_str)
-            if match:
-                try:
-                    return int(match.group(1))
-                except ValueError:
-                    return None
-            return None
-        
-        def has_old_date(row: dict) -> bool:
-            """Check if any date field contains a year 95+ years old (year <= cutoff_year)"""
-            for field in date_fields:
-                date_value = row.get(field, "")
-                year = extract_year(date_value)
-                if year is not None and year <= cutoff_year:
+        search_year = _YEAR_PATTERN.search
+        
+        def has_old_date(row: list, date_indices: list) -> bool:
+            """Check if any date column contains a year 95+ years old (year <= cutoff_year)"""
+            for index in date_indices:
+                date_value = row[index] if index < len(row) else ""
+                if not date_value:
+                    continue
+                # The whole match is the year, so no capture group is needed
+                match = search_year(date_value)
+                if match and int(match.group()) <= cutoff_year:
                     return True
             return False
         
-        # Read input CSV and filter
-        filtered_rows = []
+        # Read input CSV and write matching rows as they are found (constant memory)
+        filtered_count = 0
         total_rows = 0
         
-        with open(input_file, 'r', encoding='utf-8') as infile:
-            reader = csv.DictReader(infile)
-            fieldnames = reader.fieldnames
+        with open(input_file, 'r', encoding='utf-8', newline='') as infile, \
+                open(output_file, 'w', newline='', encoding='utf-8') as outfile:
+            # Plain rows (not DictReader) - only the date columns are inspected, so no per-row dict
+            reader = csv.reader(infile)
+            header = next(reader, None) or []
+            # Resolve the date columns to positions once (first occurrence of each heading)
+            date_indices = [header.index(field) for field in date_fields if field in header]
+            
+            writer = csv.writer(outfile)
+            writer.writerow(header)
             
             for row in reader:
+                if not row:
+                    continue  # DictReader skipped blank lines too
                 total_rows += 1
-                if has_old_date(row):
-                    filtered_rows.append(row)
+                if has_old_date(row, date_indices):
+                    writer.writerow(row)
+                    filtered_count += 1
         
-        # Write filtered results
-        with open(output_file, 'w', newline='', encoding='utf-8') as outfile:
-            writer = csv.DictWriter(outfile, fieldnames=fieldnames)
-            writer.writeheader()
-            writer.writerows(filtered_rows)
-        
-        message = f"Filtered {len(filtered_rows)} of {total_rows} records (95+ years old, ≤{cutoff_year}) → {output_file}"
+        message = f"Filtered {filtered_count} of {total_rows} records (95+ years old, ≤{cutoff_year}) → {output_file}"
         editor.log(message)
         return True, message
         
     except Exception as e:
-        import traceback
-        error_details = traceback.format_exc()
-        editor.log(f"Error filtering CSV: {str(e)}", logging.ERROR)
-        editor.log(f"Full traceback:\n{error_details}", logging.DEBUG)
+        editor.log(f"Error filtering CSV: {str(e)}", logging.ERROR, exc_info=True)
         return False, f"Error filtering CSV: {str(e)}"
 
 
@@ -284,14 +313,16 @@ def replace_author_copyright_rights(editor, mms_id: str) -> tuple[bool, str, str
     
     try:
         # Get the Alma API base URL
-        api_url = editor._get_alma_api_url()
+        api_url = editor._api_base
         
         # Step 1: GET the bib record as XML
         editor.log(f"Fetching bibliographic record {mms_id} as XML")
         headers = {'Accept': 'application/xml'}
-        response = requests.get(
-            f"{api_url}/almaws/v1/bibs/{mms_id}?view=full&expand=None&apikey={editor.api_key}",
-            headers=headers
+        response = editor._http.get(
+            f"{api_url}/almaws/v1/bibs/{mms_id}?view=full&expand=None",
+            params={'apikey': editor.api_key},
+            headers=headers,
+            timeout=editor.REQUEST_TIMEOUT
         )
         
         if response.status_code != 200:
@@ -299,21 +330,9 @@ def replace_author_copyright_rights(editor, mms_id: str) -> tuple[bool, str, str
             editor.log(f"Response: {response.text}", logging.ERROR)
             return False, f"Failed to fetch record: {response.status_code}", "error"
         
-        # Step 2: Parse the XML response
+        # Step 2: Parse the raw XML bytes (encoding comes from the XML declaration)
         editor.log("Parsing XML response")
-        root = ET.fromstring(response.text)
-        
-        # Register namespaces (but NOT the default namespace)
-        namespaces_to_register = {
-            'dc': 'http://purl.org/dc/elements/1.1/',
-            'dcterms': 'http://purl.org/dc/terms/',
-            'xsi': 'http://www.w3.org/2001/XMLSchema-instance',
-            'xml': 'http://www.w3.org/XML/1998/namespace'
-        }
-        for prefix, uri in namespaces_to_register.items():
-            ET.register_namespace(prefix, uri)
-        
-        editor.log("Registered namespaces: dc, dcterms, xsi, xml")
+        root = ET.fromstring(response.content)
         
         # Step 3: Find dc:rights elements
         search_namespaces = {
@@ -442,40 +461,40 @@ def replace_author_copyright_rights(editor, mms_id: str) -> tuple[bool, str, str
         
         # Step 4: Convert the modified tree back to XML bytes
         editor.log(f"Modified {changes_made} dc:rights field(s), preparing to update")
+        # Encoded once: the namespace fix-up works on these bytes and they are sent as-is as the PUT body
         xml_bytes = ET.tostring(root, encoding='utf-8')
         
-        # Convert to string and fix namespace prefixes
-        xml_str = xml_bytes.decode('utf-8')
-        # Remove ns0: prefix from element names
-        xml_str = xml_str.replace('ns0:', '').replace(':ns0', '')
-        # Remove the xmlns declaration for the Alma namespace
-        xml_str = xml_str.replace(' xmlns="http://alma.exlibrisgroup.com/dc/01GCL_INST"', '')
-        xml_bytes = xml_str.encode('utf-8')
+        # Drop ElementTree's ns0: prefixes and the Alma xmlns declaration (Alma rejects it on <bib>)
+        xml_bytes = _strip_alma_ns0(xml_bytes)
         
         # Log a sample of the XML being sent
         editor.log("=" * 60)
         editor.log("XML being sent to Alma (first 500 chars):")
-        editor.log(xml_str[:500])
+        editor.log(xml_bytes[:500].decode('utf-8', 'replace'))
         editor.log("=" * 60)
         
         # Step 5: PUT the modified XML back to Alma
         editor.log(f"Updating record {mms_id} in Alma")
         headers = {
             'Accept': 'application/xml',
-            'Content-Type': 'application/xml; charset=utf-8'
+            'Content-Type': 'application/xml; charset=utf-8',
+            'Authorization': f'apikey {editor.api_key}'
         }
-        response = requests.put(
-            f"{api_url}/almaws/v1/bibs/{mms_id}?validate=true&override_warning=true&override_lock=true&stale_version_check=false&check_match=false&apikey={editor.api_key}",
+        response = editor._http.put(
+            f"{api_url}/almaws/v1/bibs/{mms_id}",
+            params=_BIB_UPDATE_PARAMS,
             headers=headers,
-            data=xml_bytes
+            data=xml_bytes,
+            timeout=editor.REQUEST_TIMEOUT
         )
+        editor.invalidate_bib(mms_id)  # Drop any cached copy of the pre-update record
         
         if response.status_code != 200:
             editor.log(f"Failed to update record: {response.status_code}", logging.ERROR)
             editor.log(f"Response: {response.text}", logging.ERROR)
             editor.log("=" * 60)
             editor.log("Full XML that was sent:")
-            editor.log(xml_str)
+            editor.log(xml_bytes.decode('utf-8'))
             editor.log("=" * 60)
             return False, f"Failed to update record: {response.status_code}", "error"
         
@@ -494,10 +513,7 @@ def replace_author_copyright_rights(editor, mms_id: str) -> tuple[bool, str, str
         return True, message, outcome
         
     except Exception as e:
-        import traceback
-        error_details = traceback.format_exc()
-        editor.log(f"Error processing record {mms_id}: {str(e)}", logging.ERROR)
-        editor.log(f"Full traceback:\n{error_details}", logging.DEBUG)
+        editor.log(f"Error processing record {mms_id}: {str(e)}", logging.ERROR, exc_info=True)
         return False, f"Error: {str(e)}", "error"
 
 
@@ -527,14 +543,16 @@ def remove_ns0_fields(editor, mms_id: str) -> tuple[bool, str, int]:
     
     try:
         # Get the Alma API base URL
-        api_url = editor._get_alma_api_url()
+        api_url = editor._api_base
         
         # Step 1: GET the bib record as XML
         editor.log(f"Fetching bibliographic record {mms_id} as XML")
         headers = {'Accept': 'application/xml'}
-        response = requests.get(
-            f"{api_url}/almaws/v1/bibs/{mms_id}?view=full&expand=None&apikey={editor.api_key}",
-            headers=headers
+        response = editor._http.get(
+            f"{api_url}/almaws/v1/bibs/{mms_id}?view=full&expand=None",
+            params={'apikey': editor.api_key},
+            headers=headers,
+            timeout=editor.REQUEST_TIMEOUT
         )
         
         if response.status_code != 200:
@@ -544,12 +562,11 @@ def remove_ns0_fields(editor, mms_id: str) -> tuple[bool, str, int]:
         
         # Step 2: Work with XML as string
         editor.log("Analyzing XML for ns0: fields")
-        xml_str = response.text
-        
-        # Check if there are any ns0: references
-        if "ns0:" not in xml_str:
+        # Check if there are any ns0: references (on the raw bytes, before decoding)
+        if b"ns0:" not in response.content:
             editor.log("No ns0: namespaced fields found in record")
             return True, "No ns0: namespaced fields found", 0
+        xml_str = response.text
         
         editor.log("Found ns0: references in XML, removing them...")
         
@@ -612,15 +629,19 @@ def remove_ns0_fields(editor, mms_id: str) -> tuple[bool, str, int]:
         editor.log(f"Updating record {mms_id} in Alma (validation disabled due to corruption)")
         headers = {
             'Accept': 'application/xml',
-            'Content-Type': 'application/xml; charset=utf-8'
+            'Content-Type': 'application/xml; charset=utf-8',
+            'Authorization': f'apikey {editor.api_key}'
         }
         xml_bytes = xml_str_clean.encode('utf-8')
         
-        response = requests.put(
-            f"{api_url}/almaws/v1/bibs/{mms_id}?validate=false&override_warning=true&override_lock=true&stale_version_check=false&check_match=false&apikey={editor.api_key}",
+        response = editor._http.put(
+            f"{api_url}/almaws/v1/bibs/{mms_id}",
+            params={**_BIB_UPDATE_PARAMS, 'validate': 'false'},
             headers=headers,
-            data=xml_bytes
+            data=xml_bytes,
+            timeout=editor.REQUEST_TIMEOUT
         )
+        editor.invalidate_bib(mms_id)  # Drop any cached copy of the pre-update record
         
         if response.status_code != 200:
             editor.log(f"Failed to update record: {response.status_code}", logging.ERROR)
@@ -636,10 +657,7 @@ def remove_ns0_fields(editor, mms_id: str) -> tuple[bool, str, int]:
         return True, message, removed_count
         
     except Exception as e:
-        import traceback
-        error_details = traceback.format_exc()
-        editor.log(f"Error processing record {mms_id}: {str(e)}", logging.ERROR)
-        editor.log(f"Full traceback:\n{error_details}", logging.DEBUG)
+        editor.log(f"Error processing record {mms_id}: {str(e)}", logging.ERROR, exc_info=True)
         return False, f"Error: {str(e)}", 0
 
 
@@ -678,7 +696,7 @@ def diagnose_record_accessibility(editor, mms_ids: list, output_file: str = None
         output_file = f"record_diagnosis_{timestamp}.csv"
     
     try:
-        api_url = editor._get_alma_api_url()
+        api_url = editor._api_base
         
         # Prepare results storage
         fetchable_clean = []
@@ -695,18 +713,19 @@ def diagnose_record_accessibility(editor, mms_ids: list, output_file: str = None
             # Attempt to fetch the record
             headers = {'Accept': 'application/xml'}
             try:
-                response = requests.get(
-                    f"{api_url}/almaws/v1/bibs/{mms_id}?view=full&expand=None&apikey={editor.api_key}",
+                response = editor._http.get(
+                    f"{api_url}/almaws/v1/bibs/{mms_id}?view=full&expand=None",
+                    params={'apikey': editor.api_key},
                     headers=headers,
                     timeout=30
                 )
                 
                 if response.status_code == 200:
                     # Record is fetchable - check for ns0: fields
-                    xml_text = response.text
-                    if "ns0:" in xml_text:
+                    xml_bytes = response.content
+                    if b"ns0:" in xml_bytes:
                         # Count ns0: references
-                        ns0_count = xml_text.count('ns0:')
+                        ns0_count = xml_bytes.count(b'ns0:')
                         fetchable_with_ns0.append({
                             'mms_id': mms_id,
                             'status': 'Fetchable with ns0: fields',
@@ -815,14 +834,11 @@ def diagnose_record_accessibility(editor, mms_ids: list, output_file: str = None
         return True, summary
         
     except Exception as e:
-        import traceback
-        error_details = traceback.format_exc()
-        editor.log(f"Error during diagnosis: {str(e)}", logging.ERROR)
-        editor.log(f"Full traceback:\n{error_details}", logging.DEBUG)
+        editor.log(f"Error during diagnosis: {str(e)}", logging.ERROR, exc_info=True)
         return False, f"Error during diagnosis: {str(e)}"
 
 
-def add_grinnell_identifier(editor, mms_id: str) -> tuple[bool, str]:
+def add_grinnell_identifier(editor, mms_id: str) -> tuple[bool, str, str]:
     """
     Function 7: Add Grinnell: dc:identifier field as needed
     
@@ -834,44 +850,36 @@ def add_grinnell_identifier(editor, mms_id: str) -> tuple[bool, str]:
         mms_id: The MMS ID of the bibliographic record
         
     Returns:
-        tuple: (success: bool, message: str)
+        tuple: (success: bool, message: str, outcome: str)
+               outcome is one of: 'added', 'skipped', 'error'
     """
     editor.log(f"Starting add_grinnell_identifier for MMS ID: {mms_id}")
     if not editor.api_key:
         editor.log("API Key not configured", logging.ERROR)
-        return False, "API Key not configured"
+        return False, "API Key not configured", "error"
     
     try:
         # Get the Alma API base URL
-        api_url = editor._get_alma_api_url()
+        api_url = editor._api_base
         
         # Step 1: GET the bib record as XML
         editor.log(f"Fetching bibliographic record {mms_id} as XML")
         headers = {'Accept': 'application/xml'}
-        response = requests.get(
-            f"{api_url}/almaws/v1/bibs/{mms_id}?view=full&expand=None&apikey={editor.api_key}",
-            headers=headers
+        response = editor._http.get(
+            f"{api_url}/almaws/v1/bibs/{mms_id}?view=full&expand=None",
+            params={'apikey': editor.api_key},
+            headers=headers,
+            timeout=editor.REQUEST_TIMEOUT
         )
         
         if response.status_code != 200:
             editor.log(f"Failed to fetch record: {response.status_code}", logging.ERROR)
             editor.log(f"Response: {response.text}", logging.ERROR)
-            return False, f"Failed to fetch record: {response.status_code}"
+            return False, f"Failed to fetch record: {response.status_code}", "error"
         
-        # Step 2: Parse the XML response
+        # Step 2: Parse the raw XML bytes (encoding comes from the XML declaration)
         editor.log("Parsing XML response")
-        root = ET.fromstring(response.text)
-        
-        # Register namespaces
-        namespaces_to_register = {
-            'dc': 'http://purl.org/dc/elements/1.1/',
-            'dcterms': 'http://purl.org/dc/terms/',
-            'xsi': 'http://www.w3.org/2001/XMLSchema-instance'
-        }
-        for prefix, uri in namespaces_to_register.items():
-            ET.register_namespace(prefix, uri)
-        
-        editor.log("Registered namespaces: dc, dcterms, xsi")
+        root = ET.fromstring(response.content)
         
         # Step 3: Find dc:identifier elements
         search_namespaces = {
@@ -893,15 +901,19 @@ def add_grinnell_identifier(editor, mms_id: str) -> tuple[bool, str]:
                 elif identifier_elem.text.startswith("Grinnell:"):
                     grinnell_identifier_exists = True
                     editor.log(f"Found existing Grinnell: identifier: {identifier_elem.text}")
-        
+
+                # Both found - the record will be skipped, no need to look further
+                if dg_identifier and grinnell_identifier_exists:
+                    break
+
         # Step 5: Determine if we need to add Grinnell: identifier
         if not dg_identifier:
             editor.log("No dg_ identifier found - nothing to do")
-            return True, "No dg_ identifier found"
+            return True, "No dg_ identifier found", "skipped"
         
         if grinnell_identifier_exists:
             editor.log("Grinnell: identifier already exists - nothing to do")
-            return True, "Grinnell: identifier already exists"
+            return True, "Grinnell: identifier already exists", "skipped"
         
         # Step 6: Extract number from dg_ identifier and create Grinnell: identifier
         # Extract number from "dg_<number>"
@@ -912,72 +924,62 @@ def add_grinnell_identifier(editor, mms_id: str) -> tuple[bool, str]:
         # Step 7: Add new dc:identifier element
         # Find the parent element that contains dc:identifier elements
         # Typically this is the record element in the anies section
-        parent_element = None
-        for identifier_elem in identifier_elements:
-            for parent in root.iter():
-                if identifier_elem in list(parent):
-                    parent_element = parent
-                    break
-            if parent_element:
-                break
+        # ElementTree has no getparent(), so map each child to its parent in one pass
+        parent_map = {child: parent for parent in root.iter() for child in parent}
+        parent_element = parent_map.get(identifier_elements[0])
         
-        if not parent_element:
+        if parent_element is None:
             editor.log("Could not find parent element for dc:identifier", logging.ERROR)
-            return False, "Could not find parent element for dc:identifier"
+            return False, "Could not find parent element for dc:identifier", "error"
         
-        # Create new dc:identifier element
-        new_identifier = ET.Element('{http://purl.org/dc/elements/1.1/}identifier')
-        new_identifier.text = new_grinnell_id
-        parent_element.append(new_identifier)
+        # Create and attach the new dc:identifier element
+        ET.SubElement(parent_element, '{http://purl.org/dc/elements/1.1/}identifier').text = new_grinnell_id
         editor.log(f"Added new dc:identifier: {new_grinnell_id}")
         
         # Step 8: Convert the modified tree back to XML bytes
+        # Encoded once: the namespace fix-up works on these bytes and they are sent as-is as the PUT body
         xml_bytes = ET.tostring(root, encoding='utf-8')
         
-        # Convert to string and fix namespace prefixes
-        xml_str = xml_bytes.decode('utf-8')
-        # Remove ns0: prefix from element names
-        xml_str = xml_str.replace('ns0:', '').replace(':ns0', '')
-        # Remove the xmlns declaration for the Alma namespace
-        xml_str = xml_str.replace(' xmlns="http://alma.exlibrisgroup.com/dc/01GCL_INST"', '')
-        xml_bytes = xml_str.encode('utf-8')
+        # Drop ElementTree's ns0: prefixes and the Alma xmlns declaration (Alma rejects it on <bib>)
+        xml_bytes = _strip_alma_ns0(xml_bytes)
         
         # Log a sample of the XML being sent
         editor.log("=" * 60)
         editor.log("XML being sent to Alma (first 500 chars):")
-        editor.log(xml_str[:500])
+        editor.log(xml_bytes[:500].decode('utf-8', 'replace'))
         editor.log("=" * 60)
         
         # Step 9: PUT the modified XML back to Alma
         editor.log(f"Updating record {mms_id} in Alma")
         headers = {
             'Accept': 'application/xml',
-            'Content-Type': 'application/xml; charset=utf-8'
+            'Content-Type': 'application/xml; charset=utf-8',
+            'Authorization': f'apikey {editor.api_key}'
         }
-        response = requests.put(
-            f"{api_url}/almaws/v1/bibs/{mms_id}?validate=true&override_warning=true&override_lock=true&stale_version_check=false&check_match=false&apikey={editor.api_key}",
+        response = editor._http.put(
+            f"{api_url}/almaws/v1/bibs/{mms_id}",
+            params=_BIB_UPDATE_PARAMS,
             headers=headers,
-            data=xml_bytes
+            data=xml_bytes,
+            timeout=editor.REQUEST_TIMEOUT
         )
+        editor.invalidate_bib(mms_id)  # Drop any cached copy of the pre-update record
         
         if response.status_code != 200:
             editor.log(f"Failed to update record: {response.status_code}", logging.ERROR)
             editor.log(f"Response: {response.text}", logging.ERROR)
             editor.log("=" * 60)
             editor.log("Full XML that was sent:")
-            editor.log(xml_str)
+            editor.log(xml_bytes.decode('utf-8'))
             editor.log("=" * 60)
-            return False, f"Failed to update record: {response.status_code}"
+            return False, f"Failed to update record: {response.status_code}", "error"
         
         editor.log(f"Successfully updated record {mms_id}")
-        return True, f"Added {new_grinnell_id} to record {mms_id}"
+        return True, f"Added {new_grinnell_id} to record {mms_id}", "added"
         
     except Exception as e:
-        import traceback
-        error_details = traceback.format_exc()
-        editor.log(f"Error processing record {mms_id}: {str(e)}", logging.ERROR)
-        editor.log(f"Full traceback:\n{error_details}", logging.DEBUG)
-        return False, f"Error processing record {mms_id}: {str(e)}"
+        editor.log(f"Error processing record {mms_id}: {str(e)}", logging.ERROR, exc_info=True)
+        return False, f"Error processing record {mms_id}: {str(e)}", "error"
 
 
 # ============================================================================